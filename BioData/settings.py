@@ -49,6 +49,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "biobio.metrics.RequestMetricsMiddleware",
+    "biobio.querylog.QueryInspectorMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -76,6 +78,8 @@ CORS_ALLOW_ALL_ORIGINS = True
 ROOT_URLCONF = "BioData.urls"
 
 FRONTEND_RESET_URL = "jfkfashions.com/reset-password"
+# Signed reset links expire after an hour, as the reset email promises
+PASSWORD_RESET_TIMEOUT = 3600
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
@@ -112,7 +116,82 @@ WSGI_APPLICATION = "BioData.wsgi.application"
 # }
 
 
-DATABASES = {"default": dj_database_url.parse(os.environ.get("DATABASE_URL"))}
+# Connections are kept open between requests for DB_CONN_MAX_AGE seconds
+# (0 closes them after every request) and health-checked before reuse.
+DATABASES = {
+    "default": dj_database_url.parse(
+        os.environ.get("DATABASE_URL"),
+        conn_max_age=int(os.environ.get("DB_CONN_MAX_AGE", "60")),
+        conn_health_checks=os.environ.get("DB_CONN_HEALTH_CHECKS", "True") == "True",
+    )
+}
+
+# Optional psycopg 3 connection pool (requires "psycopg[pool]" instead of
+# psycopg2). Django does not allow pooling together with persistent connections.
+if (
+    os.environ.get("DB_POOL", "False") == "True"
+    and DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql"
+):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", "2")),
+        "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", "10")),
+        "timeout": int(os.environ.get("DB_POOL_TIMEOUT", "10")),
+    }
+
+# SQLite's shared in-memory test database rejects concurrent writers outright,
+# so run the test suite against a file to exercise multi-threaded code paths.
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    DATABASES["default"]["TEST"] = {"NAME": BASE_DIR / "test_db.sqlite3"}
+
+
+# Cache
+# Defaults to a per-process memory cache; set REDIS_URL so every worker shares
+# one cache (and sees each other's invalidations).
+
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Seconds the admin dashboard counters may be served from cache
+DASHBOARD_CACHE_TTL = int(os.environ.get("DASHBOARD_CACHE_TTL", "30"))
+
+# Seconds a serialized detail/list payload stays cached; entries are keyed by
+# the rows' updated_at, so this only bounds memory, never staleness
+RESPONSE_CACHE_TTL = int(os.environ.get("RESPONSE_CACHE_TTL", "300"))
+
+# Render the large list endpoints from .values() rows instead of model
+# instances (same JSON, less CPU); see biobio/fast_serializers.py
+FAST_READ_SERIALIZERS = os.environ.get("FAST_READ_SERIALIZERS", "False") == "True"
+
+# Serve the v2 API (biobio/urls_v2.py) under /api/v2/users/. Its order
+# confirmations and status changes are texted to clients over Twilio.
+API_V2 = os.environ.get("API_V2", "False") == "True"
+
+# Rows fetched and rendered per batch by ?export=json|ndjson downloads
+EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", "2000"))
+
+# Per-view latency, query and response size metrics (admin/metrics, in the
+# Prometheus text format) and a Server-Timing header on every response.
+# Metrics are kept per worker process.
+REQUEST_METRICS = os.environ.get("REQUEST_METRICS", "True") == "True"
+
+# Development/staging aid: log queries slower than SLOW_QUERY_MS and query
+# shapes run REPEATED_QUERY_THRESHOLD+ times in one request (likely N+1s) to
+# the "biobio.queries" logger, with the view and the code that ran them
+QUERY_INSPECTOR = os.environ.get("QUERY_INSPECTOR", "False") == "True"
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS", "100"))
+REPEATED_QUERY_THRESHOLD = int(os.environ.get("REPEATED_QUERY_THRESHOLD", "3"))
 
 
 # Password validation
@@ -133,6 +212,45 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# PASSWORD_HASHER picks the hasher for new passwords: "pbkdf2_sha256" (Django's
+# default), "scrypt" (cost set by PASSWORD_SCRYPT_WORK_FACTOR) or "argon2"
+# (needs argon2-cffi). With PASSWORD_REHASH_ON_LOGIN, older hashes are upgraded
+# to it the next time their owner logs in.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "biobio.hashers.ScryptPasswordHasher",
+]
+PREFERRED_PASSWORD_HASHERS = {
+    "pbkdf2_sha256": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "scrypt": "biobio.hashers.ScryptPasswordHasher",
+    "argon2": "django.contrib.auth.hashers.Argon2PasswordHasher",
+}
+PASSWORD_HASHER = os.environ.get("PASSWORD_HASHER", "pbkdf2_sha256")
+if PASSWORD_HASHER not in PREFERRED_PASSWORD_HASHERS:
+    raise ImproperlyConfigured(
+        f"PASSWORD_HASHER must be one of {', '.join(PREFERRED_PASSWORD_HASHERS)}"
+    )
+# The first entry hashes new passwords; the rest can still verify old ones
+PASSWORD_HASHERS.remove(PREFERRED_PASSWORD_HASHERS[PASSWORD_HASHER])
+PASSWORD_HASHERS.insert(0, PREFERRED_PASSWORD_HASHERS[PASSWORD_HASHER])
+# scrypt's N must be a power of two; above 65536 the encoded hash is longer
+# than the 128 characters UserProfile.password holds
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.environ.get("PASSWORD_SCRYPT_WORK_FACTOR", "16384"))
+if not 2 <= PASSWORD_SCRYPT_WORK_FACTOR <= 65536 or PASSWORD_SCRYPT_WORK_FACTOR & (PASSWORD_SCRYPT_WORK_FACTOR - 1):
+    raise ImproperlyConfigured(
+        "PASSWORD_SCRYPT_WORK_FACTOR must be a power of two from 2 to 65536"
+    )
+PASSWORD_REHASH_ON_LOGIN = os.environ.get("PASSWORD_REHASH_ON_LOGIN", "False") == "True"
+
+# Login attempt limiter: after LOGIN_MAX_FAILED_ATTEMPTS failures a username is
+# rejected without checking its password for LOGIN_LOCKOUT_SECONDS (0 disables)
+LOGIN_MAX_FAILED_ATTEMPTS = int(os.environ.get("LOGIN_MAX_FAILED_ATTEMPTS", "5"))
+LOGIN_LOCKOUT_SECONDS = int(os.environ.get("LOGIN_LOCKOUT_SECONDS", "900"))
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
@@ -176,13 +294,21 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 DEFAULT_FROM_EMAIL = "support@jfkfashions.com"
 # DEFAULT_FROM_EMAIL = "JFK Fashion Shop <onboarding@resend.dev>"
 
-# Get Resend API Key
+# Resend API key; checked when the first email is sent (and by
+# "manage.py check --deploy"), so migrations and other commands run without it
 RESEND_API_KEY = os.environ.get("RESEND_API_KEY")
-if not RESEND_API_KEY:
-    raise ImproperlyConfigured("RESEND_API_KEY environment variable is not set")
+
+# Resend accepts at most 100 emails per batch call
+RESEND_BATCH_SIZE = int(os.environ.get("RESEND_BATCH_SIZE", "100"))
+RESEND_BATCH_CONCURRENCY = int(os.environ.get("RESEND_BATCH_CONCURRENCY", "4"))
 
 
 # Twilio settings
 TWILIO_ACCOUNT_SID = "your_twilio_account_sid"
 TWILIO_AUTH_TOKEN = "your_twilio_auth_token"
-TWILIO_PHONE_NUMBER = "your_twilio_phone_number"
\ No newline at end of file
+TWILIO_PHONE_NUMBER = "your_twilio_phone_number"
+
+# One pooled Twilio client is shared per worker process; these size its
+# connection pool and how many messages send_sms_many sends in parallel.
+TWILIO_POOL_SIZE = int(os.environ.get("TWILIO_POOL_SIZE", "10"))
+TWILIO_SMS_CONCURRENCY = int(os.environ.get("TWILIO_SMS_CONCURRENCY", "8"))
@@ -14,10 +14,16 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('api/users/', include('biobio.urls')),
+    path("admin/", admin.site.urls),
+    path("api/users/", include("biobio.urls")),
 ]
+
+# The v2 API queues SMS to clients instead of email; it is opt-in
+if settings.API_V2:
+    urlpatterns.append(path("api/v2/users/", include("biobio.urls_v2")))
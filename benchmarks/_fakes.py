@@ -0,0 +1,67 @@
+"""Local HTTP servers standing in for the notification providers."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeProvider:
+    """
+    Threaded HTTP server that answers every POST after ``latency`` seconds.
+
+    Responses mimic Resend (``/emails``, ``/emails/batch``) and Twilio
+    (``.../Messages.json``) closely enough for their client libraries.
+    """
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        provider = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                with provider._lock:
+                    provider.requests += 1
+                time.sleep(provider.latency)
+                self.respond(provider.payload(self.path, body))
+
+            def respond(self, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def payload(self, path, body):
+        if path.endswith("/emails/batch"):
+            return {
+                "data": [{"id": f"email-{i}"} for i in range(len(json.loads(body)))]
+            }
+        if path.endswith("/emails"):
+            return {"id": "email-0"}
+        if path.endswith("Messages.json"):
+            return {"sid": "SM00000000000000000000000000000000", "status": "queued"}
+        return {}
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,81 @@
+"""
+Shared setup for the standalone benchmark scripts.
+
+Run a benchmark from the repository root, e.g. ``python -m benchmarks.order_ids``.
+Every script works against a throwaway SQLite file, so it never touches the
+database configured through ``DATABASE_URL``.
+"""
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def setup_django(db_path=None):
+    """
+    Point Django at a fresh SQLite file, migrate it and return its path.
+
+    Set BENCH_DATABASE_URL to run against another database (e.g. a local
+    Postgres) instead; its tables are migrated but not emptied.
+    """
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+    if os.environ.get("BENCH_DATABASE_URL"):
+        os.environ["DATABASE_URL"] = os.environ["BENCH_DATABASE_URL"]
+    else:
+        if db_path is None:
+            handle, db_path = tempfile.mkstemp(prefix="jfk-bench-", suffix=".sqlite3")
+            os.close(handle)
+            os.unlink(db_path)
+        os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ.setdefault("RESEND_API_KEY", "benchmark")
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "BioData.settings")
+
+    import django
+
+    django.setup()
+
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+    return db_path
+
+
+def timed(func, repeat=1):
+    """Call ``func`` ``repeat`` times and return the wall time of each call."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summarize(samples):
+    """Latency summary in milliseconds for a list of timings in seconds."""
+    ordered = sorted(samples)
+
+    def percentile(fraction):
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return round(ordered[index] * 1000, 3)
+
+    return {
+        "samples": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+    }
+
+
+def report(name, results):
+    """Print one benchmark result as JSON on stdout."""
+    print(json.dumps({"benchmark": name, **results}, indent=2, default=str))
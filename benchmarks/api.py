@@ -0,0 +1,288 @@
+"""
+Baseline load test for the main REST endpoints.
+
+Seeds a throwaway database with --clients profiles (each with a measurement),
+--orders orders and --notifications notification log rows, then drives
+login, the client and admin order lists, the admin dashboard and order status
+updates through the full middleware stack. Login, the client order list and
+status updates also run against the v2 URL set ("v2:" scenarios, served with
+API_V2=True), which queues SMS instead of email. Email goes to a local fake
+provider.
+Each scenario reports p50/p95/p99 latency, queries per request and requests
+per second.
+
+    python -m benchmarks.api --orders 50000 --requests 1000
+    python -m benchmarks.api --save baseline.json
+    python -m benchmarks.api --baseline baseline.json   # adds ratios to baseline
+
+--concurrency runs each scenario from that many threads, each with its own
+client and database connection; --no-cache swaps in a dummy cache so every
+request does the full work.
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._fakes import FakeProvider
+from benchmarks._harness import report, setup_django, summarize
+
+PASSWORD = "bench-password"
+
+
+def seed(clients, orders, notifications):
+    from django.contrib.auth.hashers import make_password
+
+    from biobio.models import (
+        CustomizationOption,
+        Measurement,
+        NotificationLog,
+        Order,
+        UserProfile,
+    )
+
+    password = make_password(PASSWORD)
+    profiles = UserProfile.objects.bulk_create(
+        (
+            UserProfile(
+                username=f"client{i}",
+                password=password,
+                role="client",
+                firstname="Bench",
+                lastname=str(i),
+                phonenumber="0000000000",
+                email=f"client{i}@example.com",
+            )
+            for i in range(clients)
+        ),
+        batch_size=5000,
+    )
+    Measurement.objects.bulk_create(
+        (
+            Measurement(username=profile.username, chest=40, waist=32, sleeve=25)
+            for profile in profiles
+        ),
+        batch_size=5000,
+    )
+    options = CustomizationOption.objects.bulk_create(
+        CustomizationOption(name=f"Option {i}") for i in range(10)
+    )
+    statuses = [choice for choice, _ in Order.STATUS_CHOICES]
+    rng = random.Random(42)
+    created = Order.objects.bulk_create(
+        (
+            Order(
+                order_id=f"BENCH{i:010d}",
+                client=rng.choice(profiles),
+                status=rng.choice(statuses),
+                is_confirmed=rng.random() < 0.7,
+                measurements="chest 40, waist 32",
+            )
+            for i in range(orders)
+        ),
+        batch_size=5000,
+    )
+    Through = Order.customization_options.through
+    Through.objects.bulk_create(
+        (
+            Through(order_id=order.id, customizationoption_id=option.id)
+            for order in created
+            for option in rng.sample(options, 2)
+        ),
+        batch_size=5000,
+    )
+    NotificationLog.objects.bulk_create(
+        (
+            NotificationLog(
+                order=rng.choice(created).order_id,
+                notification_type="email",
+                recipient=f"client{i % clients}@example.com",
+                message="<p>Your order was updated</p>",
+                status=NotificationLog.STATUS_SUCCESS,
+            )
+            for i in range(notifications)
+        ),
+        batch_size=5000,
+    )
+    # Only confirmed orders accept status updates
+    confirmed = [order.id for order in created if order.is_confirmed]
+    return [profile.username for profile in profiles], confirmed
+
+
+def scenarios(usernames, order_ids):
+    """name -> function(rng) returning (method, url, data) for one request."""
+    from django.urls import reverse
+
+    from biobio.views import ADMIN_ORDER_FILTERS
+
+    order_types = list(ADMIN_ORDER_FILTERS)
+    statuses = ["Pending", "in_progress", "fitting", "Completed"]
+
+    def shared(prefix):
+        # Routes both URL sets serve, reversed in "" (v1) or "v2:"
+        return {
+            f"{prefix}login": lambda rng: (
+                "post",
+                reverse(f"{prefix}verify"),
+                {"username": rng.choice(usernames), "password": PASSWORD},
+            ),
+            f"{prefix}order_list": lambda rng: (
+                "get",
+                reverse(f"{prefix}order-list-username", args=[rng.choice(usernames)]),
+                {},
+            ),
+            f"{prefix}order_status_update": lambda rng: (
+                "put",
+                reverse(f"{prefix}update-status", args=[rng.choice(order_ids)]),
+                {"status": rng.choice(statuses)},
+            ),
+        }
+
+    return {
+        **shared(""),
+        "admin_order_list": lambda rng: (
+            "get",
+            reverse("admin-orders"),
+            {"type": rng.choice(order_types)},
+        ),
+        "admin_dashboard": lambda rng: ("get", reverse("admin-dashboard"), {}),
+        **shared("v2:"),
+    }
+
+
+def run_scenario(make_request, requests, concurrency):
+    from django.db import connection
+    from rest_framework.test import APIClient
+
+    from biobio.metrics import QueryRecorder
+
+    latencies = []
+    queries = []
+    statuses = {}
+    lock = threading.Lock()
+
+    def worker(index):
+        client = APIClient(SERVER_NAME="localhost")
+        rng = random.Random(index)
+        share = requests // concurrency + (index < requests % concurrency)
+        samples, counts, codes = [], [], {}
+        for _ in range(share):
+            method, url, data = make_request(rng)
+            recorder = QueryRecorder()
+            started = time.perf_counter()
+            with connection.execute_wrapper(recorder):
+                response = getattr(client, method)(url, data, format="json")
+            samples.append(time.perf_counter() - started)
+            counts.append(recorder.count)
+            codes[response.status_code] = codes.get(response.status_code, 0) + 1
+        connection.close()
+        with lock:
+            latencies.extend(samples)
+            queries.extend(counts)
+            for code, count in codes.items():
+                statuses[code] = statuses.get(code, 0) + count
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        **summarize(latencies),
+        "queries_per_request": round(sum(queries) / len(queries), 2),
+        "max_queries": max(queries),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "statuses": statuses,
+    }
+
+
+def compare(results, baseline):
+    """Ratios to a saved run: below 1 means faster (or fewer queries) now."""
+    ratios = {}
+    for name, current in results.items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        ratios[name] = {
+            key: round(current[key] / before[key], 2) if before[key] else None
+            for key in ("p50_ms", "p95_ms", "p99_ms", "queries_per_request")
+        }
+        ratios[name]["requests_per_second"] = round(
+            current["requests_per_second"] / before["requests_per_second"], 2
+        )
+    return ratios
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--orders", type=int, default=20_000)
+    parser.add_argument("--notifications", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument(
+        "--login-requests",
+        type=int,
+        default=50,
+        help="Logins hash a password each, so they get their own, smaller count.",
+    )
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument(
+        "--scenario", action="append", help="Only run these scenarios (repeatable)."
+    )
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--save", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare against a file from --save.")
+    args = parser.parse_args()
+
+    # The v2 scenarios need the opt-in v2 URLs
+    os.environ.setdefault("API_V2", "True")
+    setup_django()
+
+    import resend
+    from django.test import override_settings
+
+    usernames, order_ids = seed(args.clients, args.orders, args.notifications)
+    selected = scenarios(usernames, order_ids)
+    if args.scenario:
+        selected = {name: selected[name] for name in args.scenario}
+
+    overrides = {}
+    if args.no_cache:
+        overrides["CACHES"] = {
+            "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+        }
+
+    results = {}
+    with FakeProvider(latency=0) as provider, override_settings(**overrides):
+        resend.api_url = provider.url
+        for name, make_request in selected.items():
+            requests = args.login_requests if name.endswith("login") else args.requests
+            results[name] = run_scenario(make_request, requests, args.concurrency)
+
+    output = {
+        "volumes": {
+            "clients": args.clients,
+            "orders": args.orders,
+            "notifications": args.notifications,
+        },
+        "concurrency": args.concurrency,
+        "cache": not args.no_cache,
+        "scenarios": results,
+    }
+    if args.baseline:
+        with open(args.baseline) as saved:
+            output["vs_baseline"] = compare(results, json.load(saved))
+    if args.save:
+        with open(args.save, "w") as saved:
+            json.dump(output, saved, indent=2)
+    report("api", output)
+
+
+if __name__ == "__main__":
+    main()
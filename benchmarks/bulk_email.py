@@ -0,0 +1,60 @@
+"""
+Broadcast email: one Resend call per recipient versus NotificationService.send_bulk.
+
+    python -m benchmarks.bulk_email --recipients 500 --latency 0.05
+"""
+
+import argparse
+import time
+
+from benchmarks._fakes import FakeProvider
+from benchmarks._harness import report, setup_django
+
+
+def run(func, provider):
+    provider.requests = 0
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": round(elapsed, 3),
+        "http_requests": provider.requests,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--recipients", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per call")
+    args = parser.parse_args()
+
+    setup_django()
+
+    import resend
+
+    from biobio.notification_service import NotificationService
+
+    recipients = [f"client{i}@example.com" for i in range(args.recipients)]
+
+    def sequential():
+        for to_email in recipients:
+            NotificationService.send_email_notification(to_email, "Hello", "<p>Hi</p>")
+
+    def bulk():
+        NotificationService.send_bulk(recipients, "Hello", "<p>Hi</p>")
+
+    with FakeProvider(latency=args.latency) as provider:
+        resend.api_url = provider.url
+        report(
+            "bulk_email",
+            {
+                "recipients": args.recipients,
+                "latency_s": args.latency,
+                "one_call_per_recipient": run(sequential, provider),
+                "send_bulk": run(bulk, provider),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+cleanup_duplicate_measurements: legacy per-username loop versus chunked set delete.
+
+    python -m benchmarks.cleanup_measurements --rows 1000000 --legacy-rows 20000
+
+The username unique constraint is swapped for a plain index first, to recreate
+a table that collected duplicates before the constraint existed.
+"""
+
+import argparse
+import time
+from io import StringIO
+
+from benchmarks._harness import report, setup_django
+
+
+def legacy_cleanup(Measurement):
+    """The per-username loop the command ran before the set-based rewrite."""
+    from django.db.models import Count
+
+    duplicates = (
+        Measurement.objects.values("username")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+    )
+    for item in duplicates:
+        measurements = list(
+            Measurement.objects.filter(username=item["username"]).order_by("id")
+        )
+        for measurement in measurements[:-1]:
+            measurement.delete()
+
+
+def set_based_cleanup(Measurement):
+    from django.core.management import call_command
+
+    call_command("cleanup_duplicate_measurements", stdout=StringIO())
+
+
+def allow_duplicates(Measurement):
+    from django.db import connection, models
+
+    old_field = Measurement._meta.get_field("username")
+    new_field = models.CharField(max_length=100, blank=True, null=True, db_index=True)
+    new_field.set_attributes_from_name("username")
+    with connection.schema_editor() as editor:
+        editor.alter_field(Measurement, old_field, new_field)
+
+
+def seed(Measurement, rows, copies):
+    Measurement.objects.all().delete()
+    Measurement.objects.bulk_create(
+        (Measurement(username=f"client{i // copies}") for i in range(rows)),
+        batch_size=10000,
+    )
+
+
+def run(cleanup, rows, copies):
+    from biobio.models import Measurement
+
+    seed(Measurement, rows, copies)
+    started = time.perf_counter()
+    cleanup(Measurement)
+    elapsed = time.perf_counter() - started
+
+    remaining = Measurement.objects.count()
+    return {
+        "rows": rows,
+        "deleted": rows - remaining,
+        "remaining": remaining,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument(
+        "--legacy-rows",
+        type=int,
+        default=20000,
+        help="rows for the legacy loop, which is far too slow for --rows",
+    )
+    parser.add_argument(
+        "--copies", type=int, default=4, help="measurements per username"
+    )
+    args = parser.parse_args()
+
+    setup_django()
+
+    from biobio.models import Measurement
+
+    allow_duplicates(Measurement)
+    report(
+        "cleanup_measurements",
+        {
+            "copies_per_username": args.copies,
+            "legacy_loop": run(legacy_cleanup, args.legacy_rows, args.copies),
+            "set_based": run(set_based_cleanup, args.rows, args.copies),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
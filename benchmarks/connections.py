@@ -0,0 +1,61 @@
+"""
+Requests per second for OrderDetailsView and AdminDashboardView with persistent
+connections off (CONN_MAX_AGE=0) and on.
+
+    python -m benchmarks.connections --requests 2000
+    BENCH_DATABASE_URL=postgres://localhost/jfk_bench python -m benchmarks.connections
+"""
+
+import argparse
+import time
+
+from benchmarks._harness import report, setup_django
+
+
+def drive(client, urls, requests):
+    started = time.perf_counter()
+    for i in range(requests):
+        response = client.get(urls[i % len(urls)])
+        assert response.status_code == 200, response.content
+    elapsed = time.perf_counter() - started
+    return round(requests / elapsed, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--conn-max-age", type=int, default=60)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import connection
+    from django.test import Client, override_settings
+    from django.urls import reverse
+
+    from biobio.models import Order, UserProfile
+
+    profile = UserProfile.objects.create(
+        username="bench", password="unused", email="bench@example.com"
+    )
+    orders = [Order.objects.create(client=profile) for _ in range(50)]
+    detail_urls = [reverse("order-details", args=[order.id]) for order in orders]
+    dashboard_urls = [reverse("admin-dashboard")]
+
+    results = {"vendor": connection.vendor}
+    client = Client(SERVER_NAME="localhost")
+    # Keep the dashboard snapshot out of the way so every request hits the database
+    with override_settings(DASHBOARD_CACHE_TTL=0):
+        for mode, max_age in (("per_request", 0), ("persistent", args.conn_max_age)):
+            connection.close()
+            connection.settings_dict["CONN_MAX_AGE"] = max_age
+            results[mode] = {
+                "conn_max_age": max_age,
+                "order_details_rps": drive(client, detail_urls, args.requests),
+                "admin_dashboard_rps": drive(client, dashboard_urls, args.requests),
+            }
+    report("connections", results)
+
+
+if __name__ == "__main__":
+    main()
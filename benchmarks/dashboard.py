@@ -0,0 +1,105 @@
+"""
+Admin dashboard counters: seven count() queries versus one aggregate and the cache.
+
+    python -m benchmarks.dashboard --orders 100000
+"""
+
+import argparse
+import random
+
+from benchmarks._harness import report, setup_django, summarize, timed
+
+
+def legacy_counts():
+    """The seven separate count() queries AdminDashboardView used to run."""
+    from biobio.models import Order, UserProfile
+
+    return {
+        "total_clients": UserProfile.objects.count(),
+        "total_orders": Order.objects.count(),
+        "pending_orders": Order.objects.filter(
+            status="Pending", is_confirmed=True
+        ).count(),
+        "in_progress_orders": Order.objects.filter(
+            status="in_progress", is_confirmed=True
+        ).count(),
+        "fitting_orders": Order.objects.filter(
+            status="fitting", is_confirmed=True
+        ).count(),
+        "completed_orders": Order.objects.filter(
+            status="Completed", is_confirmed=True
+        ).count(),
+        "unconfirmed_orders": Order.objects.filter(is_confirmed=False).count(),
+    }
+
+
+def seed(orders, clients=1000):
+    from biobio.models import Order, UserProfile
+
+    profiles = UserProfile.objects.bulk_create(
+        UserProfile(
+            username=f"client{i}",
+            password="unused",
+            role="client",
+            firstname="Bench",
+            lastname=str(i),
+            phonenumber="0000000000",
+            email=f"client{i}@example.com",
+        )
+        for i in range(clients)
+    )
+    statuses = [choice for choice, _ in Order.STATUS_CHOICES]
+    rng = random.Random(42)
+    Order.objects.bulk_create(
+        (
+            Order(
+                order_id=f"BENCH{i:010d}",
+                client=rng.choice(profiles),
+                status=rng.choice(statuses),
+                is_confirmed=rng.random() < 0.7,
+            )
+            for i in range(orders)
+        ),
+        batch_size=5000,
+    )
+
+
+def measure(func, repeat):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as queries:
+        func()
+    return {"queries": len(queries), **summarize(timed(func, repeat))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    seed(args.orders)
+
+    from django.core.cache import cache
+
+    from biobio.dashboard import compute_dashboard_counts, get_dashboard_counts
+
+    assert legacy_counts() == compute_dashboard_counts()
+    cache.clear()
+    get_dashboard_counts()
+
+    report(
+        "dashboard",
+        {
+            "orders": args.orders,
+            "legacy_counts": measure(legacy_counts, args.repeat),
+            "single_aggregate": measure(compute_dashboard_counts, args.repeat),
+            "cached_snapshot": measure(get_dashboard_counts, args.repeat),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
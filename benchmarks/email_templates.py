@@ -0,0 +1,181 @@
+"""
+Status email rendering: the legacy per-request dict + f-string, unescaped and
+escaped, versus email_templates.
+
+    python -m benchmarks.email_templates --renders 20000
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+
+from benchmarks._harness import report, setup_django
+
+
+def legacy_status_email(order, user_profile, new_status, escape=str):
+    """
+    The per-request dict and f-string OrderUpdateStatusView used to build.
+
+    With ``escape``, the per-order values are escaped the way the shipped
+    templates escape them, so the comparison is like for like.
+    """
+    order_id = escape(order.order_id)
+    client_name = f"{escape(user_profile.firstname)} {escape(user_profile.lastname)}"
+    event_type = escape(order.event_type or "N/A")
+    email_templates = {
+        "in_progress": {
+            "subject": f"🚀 Production Update - Order {order.order_id} In Progress",
+            "title": "Your Order Is Now In Production",
+            "intro": "Great news! Your custom garment has entered the production phase.",
+            "body": "Our expert tailors are currently working on your order. This stage involves careful cutting, stitching, and assembly of your garment according to your specifications and measurements. We take pride in our attention to detail and craftsmanship.",
+            "action": "You can monitor the progress of your order by logging into your dashboard at any time. We will notify you when your order moves to the next stage.",
+        },
+        "fitting": {
+            "subject": f"👔 Ready for Fitting - Order {order.order_id}",
+            "title": "Your Garment Is Ready for Fitting",
+            "intro": "Excellent news! Your custom garment has been completed and is ready for a fitting session.",
+            "body": "We invite you to visit our office at your earliest convenience for a fitting appointment. During this session, we will ensure the garment fits perfectly and make any necessary adjustments to guarantee your complete satisfaction.",
+            "action": "Please contact us to schedule a convenient time for your fitting. Our team is available to accommodate your schedule. Remember, minor adjustments are part of our commitment to delivering the perfect fit.",
+        },
+        "Completed": {
+            "subject": f"✅ Order Complete - {order.order_id} Ready for Collection",
+            "title": "Your Order Is Complete!",
+            "intro": "Congratulations! Your custom garment is now complete and ready for collection.",
+            "body": "We are delighted to inform you that your order has been finished to our highest standards. All adjustments have been completed, and your garment is perfectly tailored to your measurements and preferences.",
+            "action": "You may collect your order at our office during business hours. Please bring your order confirmation for a smooth collection process. We look forward to seeing you and hope you enjoy wearing your new garment.",
+        },
+    }
+
+    if new_status in email_templates:
+        template = email_templates[new_status]
+        email_body = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>
+                * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+                body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; }}
+                .email-container {{ max-width: 600px; margin: 0 auto; background: #fff; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 20px rgba(0,0,0,0.1); }}
+                .email-header {{ background: linear-gradient(135deg, #8B4513 0%, #A0522D 100%); padding: 30px 20px; text-align: center; color: white; }}
+                .logo {{ font-size: 28px; font-weight: bold; margin-bottom: 10px; }}
+                .order-details {{ padding: 30px; background: rgba(139, 69, 19, 0.05); border-radius: 8px; margin: 20px 0; }}
+                .detail-item {{ display: flex; margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid rgba(139, 69, 19, 0.1); }}
+                .detail-label {{ font-weight: 600; color: #8B4513; min-width: 180px; }}
+                .detail-value {{ font-weight: 500; color: #222; }}
+                .content {{ padding: 30px; }}
+                .footer {{ background: linear-gradient(135deg, #8B4513 0%, #A0522D 100%); padding: 25px; color: white; text-align: center; }}
+                h2 {{ color: #8B4513; margin-bottom: 15px; }}
+                p {{ margin: 15px 0; }}
+            </style>
+        </head>
+        <body>
+            <div class="email-container">
+                <div class="email-header">
+                    <div class="logo">JFK TAILOR SHOP</div>
+                    <div>Order Status Update</div>
+                </div>
+                <div class="content">
+                    <h2>{template['title']}</h2>
+                    <p>Hello {client_name},</p>
+                    <p>{template['intro']}</p>
+
+                    <div class="order-details">
+                        <div class="detail-item">
+                            <span class="detail-label">Order ID:</span>
+                            <span class="detail-value">{order_id}</span>
+                        </div>
+                        <div class="detail-item">
+                            <span class="detail-label">Client Name:</span>
+                            <span class="detail-value">{client_name}</span>
+                        </div>
+                        <div class="detail-item">
+                            <span class="detail-label">Current Status:</span>
+                            <span class="detail-value">{template['title'].replace('Your Order Is Now ', '').replace('Your Garment Is ', '').replace('Your Order Is ', '')}</span>
+                        </div>
+                        <div class="detail-item">
+                            <span class="detail-label">Event Type:</span>
+                            <span class="detail-value">{event_type}</span>
+                        </div>
+                    </div>
+
+                    <p>{template['body']}</p>
+                    <p><strong>{template['action']}</strong></p>
+
+                    <p style="margin-top: 30px; text-align: center; font-size: 16px;">
+                        Thank you for choosing <strong style="color: #8B4513;">JFK Tailor Shop</strong>!
+                    </p>
+                </div>
+                <div class="footer">
+                    <p>JFK Tailor Shop | Where Excellence Meets Elegance</p>
+                    <p>Need help? Contact us at support@jfktailorshop.com</p>
+                    <p style="margin-top: 15px; font-style: italic;">Best regards,<br/>The JFK Tailor Shop Team</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+        return template["subject"], email_body
+
+
+def measure(candidates, renders, rounds=7):
+    """
+    Time every candidate in interleaved rounds and keep each one's best round,
+    so CPU frequency drift does not favour whichever runs first.
+    """
+    best = dict.fromkeys(candidates, float("inf"))
+    for _ in range(rounds):
+        for name, func in candidates.items():
+            best[name] = min(best[name], timeit.timeit(func, number=renders))
+
+    results = {}
+    for name, func in candidates.items():
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {
+            "us_per_render": round(best[name] / renders * 1e6, 3),
+            "peak_bytes_per_render": peak,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=20_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.utils.html import escape
+
+    from biobio.email_templates import render_order_status_update
+
+    order = SimpleNamespace(order_id="JFK010120300001", event_type="Wedding")
+    profile = SimpleNamespace(firstname="Ada", lastname="Obi")
+
+    report(
+        "email_templates",
+        {
+            "renders": args.renders,
+            **measure(
+                {
+                    "legacy_fstring": lambda: legacy_status_email(
+                        order, profile, "fitting"
+                    ),
+                    "legacy_fstring_escaped": lambda: legacy_status_email(
+                        order, profile, "fitting", escape=escape
+                    ),
+                    "email_templates": lambda: render_order_status_update(
+                        order, profile, "fitting"
+                    ),
+                },
+                args.renders,
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Time and memory for ``manage.py export_data`` over a year of orders.
+
+Each export runs in a forked child process and reports how far its resident
+memory rose, so the figure reflects the export alone. Parquet is measured
+only when pyarrow is installed.
+
+    python -m benchmarks.export_data --orders 200000
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+
+from benchmarks._harness import report, setup_django
+from benchmarks.streaming_export import current_rss_kb
+
+
+def run_export(args, results):
+    from django.core.management import call_command
+
+    baseline = current_rss_kb()
+    started = time.perf_counter()
+    call_command("export_data", *args, stdout=open(os.devnull, "w"))
+    results.put(
+        {
+            "seconds": round(time.perf_counter() - started, 2),
+            "megabytes": round(
+                os.path.getsize(args[args.index("--output") + 1]) / 2**20, 1
+            ),
+            "peak_rss_growth_mb": round(
+                (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline) / 1024,
+                1,
+            ),
+        }
+    )
+
+
+def in_child(args):
+    from django.db import connections
+
+    connections.close_all()
+    results = multiprocessing.Queue()
+    child = multiprocessing.get_context("fork").Process(
+        target=run_export, args=(args, results)
+    )
+    child.start()
+    result = results.get()
+    child.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=200_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.utils import timezone
+
+    from benchmarks.fast_serializers import seed
+
+    # bulk_create stamps every order with today's date, inside the year exported
+    seed(args.orders)
+    since = (timezone.localdate().replace(month=1, day=1)).isoformat()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for export_format in ("csv", "parquet"):
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                if export_format == "parquet":
+                    results[export_format] = "skipped: pyarrow is not installed"
+                    continue
+            results[export_format] = in_child(
+                [
+                    "orders",
+                    "--format",
+                    export_format,
+                    "--since",
+                    since,
+                    "--output",
+                    os.path.join(directory, f"orders.{export_format}"),
+                ]
+            )
+
+    report("export_data", {"orders": args.orders, **results})
+
+
+if __name__ == "__main__":
+    main()
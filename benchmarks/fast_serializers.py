@@ -0,0 +1,138 @@
+"""
+Rows serialized per second: DRF serializers versus the .values() fast path.
+
+Renders every user profile and every order (OrderListSerializer, with its
+client username and customization options) to JSON both ways and checks the
+bytes are identical.
+
+    python -m benchmarks.fast_serializers --rows 20000
+"""
+
+import argparse
+import random
+
+from benchmarks._harness import report, setup_django, timed
+
+
+def seed(rows):
+    from django.utils import timezone
+
+    from biobio.models import CustomizationOption, Order, UserProfile
+
+    profiles = UserProfile.objects.bulk_create(
+        (
+            UserProfile(
+                username=f"client{i}",
+                password="unused",
+                role="client",
+                firstname="Bench",
+                lastname=str(i),
+                phonenumber="0000000000",
+                email=f"client{i}@example.com",
+            )
+            for i in range(rows)
+        ),
+        batch_size=5000,
+    )
+    options = CustomizationOption.objects.bulk_create(
+        CustomizationOption(name=f"Option {i}") for i in range(10)
+    )
+    rng = random.Random(42)
+    created = Order.objects.bulk_create(
+        (
+            Order(
+                order_id=f"BENCH{i:010d}",
+                client=rng.choice(profiles),
+                is_confirmed=True,
+                confirmed_date=timezone.now(),
+            )
+            for i in range(rows)
+        ),
+        batch_size=5000,
+    )
+    Through = Order.customization_options.through
+    Through.objects.bulk_create(
+        (
+            Through(order_id=order.id, customizationoption_id=option.id)
+            for order in created
+            for option in rng.sample(options, 2)
+        ),
+        batch_size=5000,
+    )
+
+
+def measure(render, rows, repeat):
+    payload = render()
+    samples = timed(render, repeat)
+    return {
+        "rows_per_second": round(rows / min(samples)),
+        "best_ms": round(min(samples) * 1000, 1),
+    }, payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from biobio.fast_serializers import (
+        OrderListValuesSerializer,
+        UserProfileValuesSerializer,
+    )
+    from biobio.models import Order, UserProfile
+    from biobio.serializers import OrderListSerializer, UserProfileSerializer
+
+    seed(args.rows)
+    request = Request(APIRequestFactory().get("/admin/orders"))
+    context = {"request": request}
+
+    def render(serializer_class, queryset):
+        serializer = serializer_class(
+            (
+                serializer_class.prepare_queryset(queryset, request)
+                if hasattr(serializer_class, "prepare_queryset")
+                else queryset
+            ),
+            many=True,
+            context=context,
+        )
+        return JSONRenderer().render(serializer.data)
+
+    results = {}
+    cases = {
+        "user_profiles": (
+            UserProfile.objects.order_by("id"),
+            UserProfileSerializer,
+            UserProfileValuesSerializer,
+        ),
+        "orders": (
+            Order.objects.order_by("-order_date", "-id"),
+            OrderListSerializer,
+            OrderListValuesSerializer,
+        ),
+    }
+    for name, (queryset, drf, fast) in cases.items():
+        drf_result, drf_payload = measure(
+            lambda: render(drf, queryset), args.rows, args.repeat
+        )
+        fast_result, fast_payload = measure(
+            lambda: render(fast, queryset), args.rows, args.repeat
+        )
+        results[name] = {
+            "drf": drf_result,
+            "values": fast_result,
+            "identical": drf_payload == fast_payload,
+        }
+
+    report("fast_serializers", {"rows": args.rows, **results})
+
+
+if __name__ == "__main__":
+    main()
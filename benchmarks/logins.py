@@ -0,0 +1,84 @@
+"""
+Logins per second on one core for UserVerficationView.
+
+Compares a credential-stuffing run (every attempt wrong) with the attempt
+limiter off and on, and valid logins against PBKDF2 and scrypt hashes.
+
+    python -m benchmarks.logins --requests 40
+"""
+
+import argparse
+import time
+
+from benchmarks._harness import report, setup_django
+
+
+def logins_per_second(view, username, password, requests):
+    from rest_framework.test import APIRequestFactory
+
+    factory = APIRequestFactory()
+    statuses = {}
+    started = time.perf_counter()
+    for _ in range(requests):
+        request = factory.post(
+            "/verify/", {"username": username, "password": password}, format="json"
+        )
+        code = view(request).status_code
+        statuses[code] = statuses.get(code, 0) + 1
+    elapsed = time.perf_counter() - started
+    return {"logins_per_second": round(requests / elapsed, 1), "statuses": statuses}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=40)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth.hashers import make_password
+    from django.core.cache import cache
+    from django.test import override_settings
+
+    from biobio.models import UserProfile
+    from biobio.views import UserVerficationView
+
+    view = UserVerficationView.as_view()
+    profile = UserProfile.objects.create(
+        username="bench",
+        password=make_password("s3cret!"),
+        email="bench@example.com",
+    )
+
+    results = {}
+    cache.clear()
+    with override_settings(LOGIN_MAX_FAILED_ATTEMPTS=0):
+        results["stuffing_without_limiter"] = logins_per_second(
+            view, "bench", "wrong", args.requests
+        )
+    with override_settings(LOGIN_MAX_FAILED_ATTEMPTS=5):
+        # The first five wrong passwords are hashed; time what comes after
+        logins_per_second(view, "bench", "wrong", 5)
+        results["stuffing_after_lockout"] = logins_per_second(
+            view, "bench", "wrong", args.requests * 100
+        )
+
+    cache.clear()
+    results["valid_pbkdf2"] = logins_per_second(view, "bench", "s3cret!", args.requests)
+
+    scrypt_first = ["biobio.hashers.ScryptPasswordHasher"] + [
+        path for path in settings.PASSWORD_HASHERS if "Scrypt" not in path
+    ]
+    with override_settings(PASSWORD_HASHERS=scrypt_first):
+        profile.password = make_password("s3cret!")
+        profile.save(update_fields=["password"])
+        results["valid_scrypt"] = logins_per_second(
+            view, "bench", "s3cret!", args.requests
+        )
+
+    report("logins", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Concurrent order_id allocation: legacy "scan the last row" versus OrderSequence.
+
+    python -m benchmarks.order_ids --threads 8 --orders 200
+"""
+
+import argparse
+import threading
+import time
+
+from benchmarks._harness import report, setup_django
+
+
+def legacy_create(Order):
+    """The allocation Order.save() used before OrderSequence existed."""
+    from datetime import datetime
+
+    date_prefix = datetime.now().strftime("JFK%d%m%Y")
+    last_order = (
+        Order.objects.filter(order_id__startswith=date_prefix)
+        .order_by("order_id")
+        .last()
+    )
+    new_sequence = int(last_order.order_id[-4:]) + 1 if last_order else 1
+    Order.objects.create(order_id=f"{date_prefix}{new_sequence:04d}")
+
+
+def sequence_create(Order):
+    Order.objects.create()
+
+
+def run(create, threads, orders):
+    from django.db import connection
+
+    from biobio.models import Order, OrderSequence
+
+    Order.objects.all().delete()
+    OrderSequence.objects.all().delete()
+
+    failures = []
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        for _ in range(orders):
+            try:
+                create(Order)
+            except Exception as e:
+                failures.append(type(e).__name__)
+        connection.close()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    created = Order.objects.count()
+    return {
+        "attempted": threads * orders,
+        "created": created,
+        "failed": len(failures),
+        "failure_types": sorted(set(failures)),
+        "seconds": round(elapsed, 3),
+        "inserts_per_second": round(created / elapsed, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--orders", type=int, default=200, help="orders per thread")
+    args = parser.parse_args()
+
+    setup_django()
+    report(
+        "order_ids",
+        {
+            "threads": args.threads,
+            "legacy_scan": run(legacy_create, args.threads, args.orders),
+            "order_sequence": run(sequence_create, args.threads, args.orders),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Order list pages: payload size and serialization time per page.
+
+Compares the full OrderSerializer (what the list views used to return) with
+OrderListSerializer and a sparse ``?fields=`` request, each over the same
+page of orders carrying realistic measurements and comments text.
+
+    python -m benchmarks.order_list_payload --orders 1000
+"""
+
+import argparse
+import json
+import random
+
+from benchmarks._harness import report, setup_django, summarize, timed
+
+
+def seed(orders):
+    from biobio.models import CustomizationOption, Order, UserProfile
+
+    profiles = UserProfile.objects.bulk_create(
+        UserProfile(
+            username=f"client{i}",
+            password="unused",
+            email=f"client{i}@example.com",
+        )
+        for i in range(100)
+    )
+    options = CustomizationOption.objects.bulk_create(
+        CustomizationOption(name=f"Option {i}", description="x" * 200)
+        for i in range(10)
+    )
+    rng = random.Random(42)
+    created = Order.objects.bulk_create(
+        Order(
+            order_id=f"BENCH{i:010d}",
+            client=rng.choice(profiles),
+            measurements="chest 40, waist 32, sleeve 25, inseam 31, " * 20,
+            comments="Please take in the waist a little. " * 30,
+        )
+        for i in range(orders)
+    )
+    Through = Order.customization_options.through
+    Through.objects.bulk_create(
+        Through(order_id=order.id, customizationoption_id=option.id)
+        for order in created
+        for option in rng.sample(options, 2)
+    )
+
+
+def render(serializer_class, queryset, request):
+    from rest_framework.renderers import JSONRenderer
+
+    data = serializer_class(queryset, many=True, context={"request": request}).data
+    return JSONRenderer().render(data)
+
+
+def measure(serializer_class, make_queryset, request, repeat):
+    payload = render(serializer_class, make_queryset(), request)
+    samples = timed(lambda: render(serializer_class, make_queryset(), request), repeat)
+    return {
+        "payload_bytes": len(payload),
+        "rows": len(json.loads(payload)),
+        **summarize(samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from biobio.models import Order
+    from biobio.serializers import OrderListSerializer, OrderSerializer
+
+    seed(args.orders)
+    factory = APIRequestFactory()
+    full = Request(factory.get("/orders/"))
+    sparse = Request(factory.get("/orders/", {"fields": "id,order_id,status"}))
+    orders = Order.objects.order_by("-order_date", "-id")
+
+    results = {
+        "full_serializer": measure(
+            OrderSerializer,
+            lambda: orders.select_related("client").prefetch_related(
+                "customization_options"
+            ),
+            full,
+            args.repeat,
+        ),
+        "list_serializer": measure(
+            OrderListSerializer,
+            lambda: OrderListSerializer.prepare_queryset(orders, full),
+            full,
+            args.repeat,
+        ),
+        "sparse_fields": measure(
+            OrderListSerializer,
+            lambda: OrderListSerializer.prepare_queryset(orders, sparse),
+            sparse,
+            args.repeat,
+        ),
+    }
+    report("order_list_payload", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+SMS throughput: a new Twilio client per message versus the pooled shared client.
+
+    python -m benchmarks.sms --messages 200 --latency 0.01
+"""
+
+import argparse
+import time
+
+from benchmarks._fakes import FakeProvider
+from benchmarks._harness import report, setup_django
+
+
+def run(func, count, provider):
+    provider.requests = 0
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": round(elapsed, 3),
+        "http_requests": provider.requests,
+        "messages_per_second": round(count / elapsed, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.01, help="seconds per call")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from twilio.rest import Client
+
+    from biobio.notification_service import NotificationService, get_twilio_client
+
+    numbers = [f"+1555{i:07d}" for i in range(args.messages)]
+
+    with FakeProvider(latency=args.latency) as provider:
+
+        def client_per_message():
+            # What send_sms_notification did before the shared client
+            for to_phone in numbers:
+                client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+                client.api.base_url = provider.url
+                client.messages.create(
+                    body="Hi", from_=settings.TWILIO_PHONE_NUMBER, to=to_phone
+                )
+
+        def pooled_sequential():
+            for to_phone in numbers:
+                NotificationService.send_sms_notification(to_phone, "Hi")
+
+        def pooled_many():
+            NotificationService.send_sms_many(numbers, "Hi")
+
+        get_twilio_client().api.base_url = provider.url
+        report(
+            "sms",
+            {
+                "messages": args.messages,
+                "latency_s": args.latency,
+                "client_per_message": run(client_per_message, args.messages, provider),
+                "pooled_client": run(pooled_sequential, args.messages, provider),
+                "send_sms_many": run(pooled_many, args.messages, provider),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
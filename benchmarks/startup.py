@@ -0,0 +1,115 @@
+"""
+Cold-start cost of a web worker and of a management command.
+
+Each sample is a fresh interpreter: "worker" runs django.setup(), builds the
+WSGI application and loads the URLconf (what a gunicorn worker does before
+its first response); "check" times ``manage.py check`` end to end. With
+--profile, one extra worker run under ``python -X importtime`` lists the
+modules that cost the most to import.
+
+    python -m benchmarks.startup --runs 20 --profile
+    python -m benchmarks.startup --no-credentials   # boot without RESEND_API_KEY
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks._harness import ROOT, report, summarize
+
+WORKER = """
+import sys, time
+started = time.perf_counter()
+import BioData.wsgi
+import biobio.urls
+print(time.perf_counter() - started)
+print(",".join(sorted(m for m in %r if m in sys.modules)))
+"""
+# Provider SDKs that should only be imported once a notification is sent
+WATCHED_MODULES = ("pdb", "resend", "twilio")
+
+
+def environment(credentials):
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{tempfile.gettempdir()}/jfk-bench-startup.sqlite3"
+    env.setdefault("SECRET_KEY", "benchmark")
+    env["DJANGO_SETTINGS_MODULE"] = "BioData.settings"
+    env["PYTHONPATH"] = str(ROOT)
+    if credentials:
+        env.setdefault("RESEND_API_KEY", "benchmark")
+    else:
+        env.pop("RESEND_API_KEY", None)
+    return env
+
+
+def run(args, env):
+    return subprocess.run(
+        [sys.executable, *args], env=env, cwd=ROOT, capture_output=True, text=True
+    )
+
+
+def worker_start(env):
+    result = run(["-c", WORKER % (WATCHED_MODULES,)], env)
+    if result.returncode:
+        raise SystemExit(result.stderr)
+    elapsed, loaded = result.stdout.splitlines()
+    return float(elapsed), loaded.split(",") if loaded else []
+
+
+def check_command(env):
+    started = time.perf_counter()
+    result = run(["manage.py", "check"], env)
+    if result.returncode:
+        raise SystemExit(result.stderr)
+    return time.perf_counter() - started
+
+
+def import_profile(env, top):
+    """The ``top`` modules by self import time, and the total, in ms."""
+    result = run(["-X", "importtime", "-c", WORKER % (WATCHED_MODULES,)], env)
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        modules.append((int(own), int(cumulative), name.strip()))
+    ordered = sorted(modules, reverse=True)
+    return {
+        "total_ms": round(sum(own for own, _, _ in modules) / 1000, 1),
+        "top_self_ms": {name: round(own / 1000, 1) for own, _, name in ordered[:top]},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--no-credentials", action="store_true")
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    env = environment(credentials=not args.no_credentials)
+    worker_samples, loaded = [], []
+    for _ in range(args.runs):
+        elapsed, loaded = worker_start(env)
+        worker_samples.append(elapsed)
+    check_samples = [check_command(env) for _ in range(args.runs)]
+
+    results = {
+        "credentials": not args.no_credentials,
+        "worker_start": summarize(worker_samples),
+        "manage_check": summarize(check_samples),
+        "provider_modules_loaded": loaded,
+    }
+    if args.profile:
+        results["import_profile"] = import_profile(env, args.top)
+    report("startup", results)
+
+
+if __name__ == "__main__":
+    main()
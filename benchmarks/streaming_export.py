@@ -0,0 +1,88 @@
+"""
+Peak memory and time for full-table responses: in-memory lists versus streaming.
+
+Seeds --rows user profiles and orders, then serves each response in a forked
+child process and reports how far its resident memory rose above where it
+started, so one mode's garbage never inflates another's figure.
+
+    python -m benchmarks.streaming_export --rows 200000
+"""
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+from benchmarks._harness import report, setup_django
+
+
+def seed(rows):
+    from benchmarks.fast_serializers import seed as seed_rows
+
+    seed_rows(rows)
+
+
+def current_rss_kb():
+    with open("/proc/self/statm") as statm:
+        pages = int(statm.read().split()[1])
+    return pages * resource.getpagesize() // 1024
+
+
+def serve(path, params, results):
+    from django.test import Client
+
+    baseline = current_rss_kb()
+    started = time.perf_counter()
+    response = Client(SERVER_NAME="localhost").get(path, params)
+    body = response.streaming_content if response.streaming else [response.content]
+    size = sum(len(chunk) for chunk in body)
+    results.put(
+        {
+            "status": response.status_code,
+            "seconds": round(time.perf_counter() - started, 2),
+            "megabytes": round(size / 2**20, 1),
+            "peak_rss_growth_mb": round(
+                (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline) / 1024,
+                1,
+            ),
+        }
+    )
+
+
+def in_child(path, params):
+    from django.db import connections
+
+    connections.close_all()
+    results = multiprocessing.Queue()
+    child = multiprocessing.get_context("fork").Process(
+        target=serve, args=(path, params, results)
+    )
+    child.start()
+    result = results.get()
+    child.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    setup_django()
+    seed(args.rows)
+
+    from django.urls import reverse
+
+    users, orders = reverse("biodata-list"), reverse("admin-orders")
+
+    results = {
+        "userprofile_list": in_child(users, {}),
+        "userprofile_export_json": in_child(users, {"export": "json"}),
+        "orders_export_json": in_child(orders, {"type": "all", "export": "json"}),
+        "orders_export_ndjson": in_child(orders, {"type": "all", "export": "ndjson"}),
+    }
+    report("streaming_export", {"rows": args.rows, **results})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+# biobio/checks.py
+from django.conf import settings
+from django.core.checks import Warning, register
+
+
+@register(deploy=True)
+def check_notification_settings(app_configs, **kwargs):
+    """Credentials that are only needed once a notification is sent."""
+    errors = []
+    if not settings.RESEND_API_KEY:
+        errors.append(
+            Warning(
+                "RESEND_API_KEY is not set; sending email will fail.",
+                hint="Set the RESEND_API_KEY environment variable.",
+                id="biobio.W001",
+            )
+        )
+    return errors
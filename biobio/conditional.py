@@ -0,0 +1,41 @@
+# biobio/conditional.py
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+def conditional_payload(request, key, version, last_modified, build):
+    """
+    Serve ``build()``'s payload behind ETag/Last-Modified validators.
+
+    ``version`` must change whenever anything in the payload can change
+    (e.g. the rows' ``updated_at``). A client that already holds it gets a
+    304 without ``build()`` running; otherwise the payload is read from the
+    cache under that version, and only built and stored on a miss.
+    """
+    # Keyed by host too: paginated payloads carry absolute links
+    digest = hashlib.md5(f"{request.get_host()}:{key}:{version}".encode()).hexdigest()
+    etag = quote_etag(digest)
+    timestamp = last_modified.timestamp() if last_modified else None
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=timestamp and int(timestamp)
+    )
+    if response is None:
+        cache_key = f"biobio:payload:{digest}"
+        payload = cache.get(cache_key)
+        if payload is None:
+            payload = build()
+            cache.set(cache_key, payload, settings.RESPONSE_CACHE_TTL)
+        response = Response(payload)
+
+    response["ETag"] = etag
+    if timestamp:
+        response["Last-Modified"] = http_date(timestamp)
+    # Let browsers keep the copy but revalidate it on every poll
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
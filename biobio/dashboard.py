@@ -0,0 +1,49 @@
+# biobio/dashboard.py
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+
+DASHBOARD_CACHE_KEY = "biobio:admin-dashboard"
+
+# Counter name -> filter over the orders table (None counts every order)
+ORDER_COUNTERS = {
+    "total_orders": None,
+    "pending_orders": Q(status="Pending", is_confirmed=True),
+    "in_progress_orders": Q(status="in_progress", is_confirmed=True),
+    "fitting_orders": Q(status="fitting", is_confirmed=True),
+    "completed_orders": Q(status="Completed", is_confirmed=True),
+    "unconfirmed_orders": Q(is_confirmed=False),
+}
+
+
+def compute_dashboard_counts():
+    """
+    Read every dashboard counter straight from the database.
+
+    All order counters come from one conditional-aggregation query over the
+    orders table; the client total is a plain count on the profiles table.
+    """
+    from .models import Order, UserProfile
+
+    counts = Order.objects.aggregate(
+        **{
+            name: Count("id", filter=condition)
+            for name, condition in ORDER_COUNTERS.items()
+        }
+    )
+    return {"total_clients": UserProfile.objects.count(), **counts}
+
+
+def get_dashboard_counts():
+    """Return the cached dashboard snapshot, recomputing it when missing or stale."""
+    counts = cache.get(DASHBOARD_CACHE_KEY)
+    if counts is None:
+        counts = compute_dashboard_counts()
+        cache.set(DASHBOARD_CACHE_KEY, counts, settings.DASHBOARD_CACHE_TTL)
+    return counts
+
+
+def invalidate_dashboard_counts():
+    """Drop the cached snapshot once the current transaction commits."""
+    transaction.on_commit(lambda: cache.delete(DASHBOARD_CACHE_KEY))
@@ -0,0 +1,217 @@
+# biobio/email_templates.py
+import re
+
+from django.utils.html import escape
+
+_FIELD = re.compile(r"\$\{(\w+)\}")
+_SPECIAL = re.compile(r"[&<>\"']")
+
+
+def _escape(value):
+    # Most names and order ids contain nothing to escape; skip escape()'s work
+    value = str(value)
+    return escape(value) if _SPECIAL.search(value) else value
+
+
+class EmailTemplate:
+    """
+    HTML email template with ``${field}`` slots, split once at import.
+
+    The template is kept as its literal chunks with a slot for each field, so
+    a render escapes the per-email values and does one join. partial() fills
+    in trusted, fixed copy ahead of time, so an email only fills its own fields.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        parts = _FIELD.split(source)
+        # Literal chunks at even positions, field names at odd ones
+        self.parts = parts
+        self.slots = tuple(enumerate(parts))[1::2]
+        self.fields = parts[1::2]
+
+    def render(self, **values):
+        escaped = {name: _escape(value) for name, value in values.items()}
+        parts = self.parts.copy()
+        for index, name in self.slots:
+            parts[index] = escaped[name]
+        return "".join(parts)
+
+    def partial(self, **static):
+        """Fill trusted, fixed values in now and return the remaining template."""
+        return EmailTemplate(
+            _FIELD.sub(lambda m: static.get(m.group(1), m.group(0)), self.source)
+        )
+
+
+ORDER_CONFIRMATION = EmailTemplate("""
+<div style='font-family: Arial, sans-serif; line-height:1.6;'>
+    <h2 style='color: #8B4513;'>Order Confirmation</h2>
+    <p>Hello ${client_name},</p>
+    <p>We are pleased to inform you that your order has been successfully confirmed by our team.</p>
+    <div style='background: #f5f5f5; padding: 15px; border-radius: 6px; margin: 20px 0;'>
+        <p style='margin: 5px 0;'><strong>Order ID:</strong> ${order_id}</p>
+        <p style='margin: 5px 0;'><strong>Client Name:</strong> ${client_name}</p>
+        <p style='margin: 5px 0;'><strong>Status:</strong> Confirmed</p>
+        <p style='margin: 5px 0;'><strong>Event Type:</strong> ${event_type}</p>
+    </div>
+    <p>Our skilled tailors have begun working on your custom garment. We will keep you informed at every stage of the production process. You can also log in to your dashboard at any time to track the progress of your order.</p>
+    <p>We appreciate your trust in our craftsmanship and look forward to delivering a garment that exceeds your expectations.</p>
+    <p style='margin-top: 30px;'>Thank you for your patronage.</p>
+    <p>Warm regards,<br/>The JFK Tailoring Team</p>
+</div>
+""")
+
+PASSWORD_RESET = EmailTemplate("""
+<div style='font-family: Arial, sans-serif; line-height:1.6;'>
+    <h2>Password Reset Requested</h2>
+    <p>Hello ${firstname},</p>
+    <p>We received a request to reset the password for your account. Click the button below to reset your password. This link will expire in 1 hour.</p>
+    <p style='text-align:center; margin:24px 0;'>
+        <a href='${reset_link}' style='background:#8B4513; color:#ffffff; padding:12px 20px; text-decoration:none; border-radius:6px;'>Reset Password</a>
+    </p>
+    <p>If you did not request this, you can safely ignore this email. If you continue to receive these emails, please contact an administrator.</p>
+    <p>Thank you,<br/>JFK Team</p>
+</div>
+""")
+
+_STATUS_UPDATE_SHELL = EmailTemplate("""<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; }
+        .email-container { max-width: 600px; margin: 0 auto; background: #fff; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 20px rgba(0,0,0,0.1); }
+        .email-header { background: linear-gradient(135deg, #8B4513 0%, #A0522D 100%); padding: 30px 20px; text-align: center; color: white; }
+        .logo { font-size: 28px; font-weight: bold; margin-bottom: 10px; }
+        .order-details { padding: 30px; background: rgba(139, 69, 19, 0.05); border-radius: 8px; margin: 20px 0; }
+        .detail-item { display: flex; margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid rgba(139, 69, 19, 0.1); }
+        .detail-label { font-weight: 600; color: #8B4513; min-width: 180px; }
+        .detail-value { font-weight: 500; color: #222; }
+        .content { padding: 30px; }
+        .footer { background: linear-gradient(135deg, #8B4513 0%, #A0522D 100%); padding: 25px; color: white; text-align: center; }
+        h2 { color: #8B4513; margin-bottom: 15px; }
+        p { margin: 15px 0; }
+    </style>
+</head>
+<body>
+    <div class="email-container">
+        <div class="email-header">
+            <div class="logo">JFK TAILOR SHOP</div>
+            <div>Order Status Update</div>
+        </div>
+        <div class="content">
+            <h2>${title}</h2>
+            <p>Hello ${client_name},</p>
+            <p>${intro}</p>
+
+            <div class="order-details">
+                <div class="detail-item">
+                    <span class="detail-label">Order ID:</span>
+                    <span class="detail-value">${order_id}</span>
+                </div>
+                <div class="detail-item">
+                    <span class="detail-label">Client Name:</span>
+                    <span class="detail-value">${client_name}</span>
+                </div>
+                <div class="detail-item">
+                    <span class="detail-label">Current Status:</span>
+                    <span class="detail-value">${status_label}</span>
+                </div>
+                <div class="detail-item">
+                    <span class="detail-label">Event Type:</span>
+                    <span class="detail-value">${event_type}</span>
+                </div>
+            </div>
+
+            <p>${body}</p>
+            <p><strong>${action}</strong></p>
+
+            <p style="margin-top: 30px; text-align: center; font-size: 16px;">
+                Thank you for choosing <strong style="color: #8B4513;">JFK Tailor Shop</strong>!
+            </p>
+        </div>
+        <div class="footer">
+            <p>JFK Tailor Shop | Where Excellence Meets Elegance</p>
+            <p>Need help? Contact us at support@jfktailorshop.com</p>
+            <p style="margin-top: 15px; font-style: italic;">Best regards,<br/>The JFK Tailor Shop Team</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+# Order status -> fixed copy for its notification email
+STATUS_UPDATE_COPY = {
+    "in_progress": {
+        "subject": "🚀 Production Update - Order {order_id} In Progress",
+        "title": "Your Order Is Now In Production",
+        "status_label": "In Production",
+        "intro": "Great news! Your custom garment has entered the production phase.",
+        "body": "Our expert tailors are currently working on your order. This stage involves careful cutting, stitching, and assembly of your garment according to your specifications and measurements. We take pride in our attention to detail and craftsmanship.",
+        "action": "You can monitor the progress of your order by logging into your dashboard at any time. We will notify you when your order moves to the next stage.",
+    },
+    "fitting": {
+        "subject": "👔 Ready for Fitting - Order {order_id}",
+        "title": "Your Garment Is Ready for Fitting",
+        "status_label": "Ready for Fitting",
+        "intro": "Excellent news! Your custom garment has been completed and is ready for a fitting session.",
+        "body": "We invite you to visit our office at your earliest convenience for a fitting appointment. During this session, we will ensure the garment fits perfectly and make any necessary adjustments to guarantee your complete satisfaction.",
+        "action": "Please contact us to schedule a convenient time for your fitting. Our team is available to accommodate your schedule. Remember, minor adjustments are part of our commitment to delivering the perfect fit.",
+    },
+    "Completed": {
+        "subject": "✅ Order Complete - {order_id} Ready for Collection",
+        "title": "Your Order Is Complete!",
+        "status_label": "Complete!",
+        "intro": "Congratulations! Your custom garment is now complete and ready for collection.",
+        "body": "We are delighted to inform you that your order has been finished to our highest standards. All adjustments have been completed, and your garment is perfectly tailored to your measurements and preferences.",
+        "action": "You may collect your order at our office during business hours. Please bring your order confirmation for a smooth collection process. We look forward to seeing you and hope you enjoy wearing your new garment.",
+    },
+}
+
+# Order status -> (subject format, template with only the per-order slots left)
+STATUS_UPDATE_TEMPLATES = {
+    order_status: (
+        copy["subject"],
+        _STATUS_UPDATE_SHELL.partial(
+            **{key: value for key, value in copy.items() if key != "subject"}
+        ),
+    )
+    for order_status, copy in STATUS_UPDATE_COPY.items()
+}
+
+
+def render_order_confirmation(order, user_profile):
+    """Return ``(subject, html)`` for the order confirmation email."""
+    return (
+        f"Order Confirmed - {order.order_id}",
+        ORDER_CONFIRMATION.render(
+            order_id=order.order_id,
+            client_name=f"{user_profile.firstname} {user_profile.lastname}",
+            event_type=order.event_type or "N/A",
+        ),
+    )
+
+
+def render_order_status_update(order, user_profile, order_status):
+    """Return ``(subject, html)`` for a status change, or None if it sends no email."""
+    email = STATUS_UPDATE_TEMPLATES.get(order_status)
+    if email is None:
+        return None
+    subject, template = email
+    return (
+        subject.format(order_id=order.order_id),
+        template.render(
+            order_id=order.order_id,
+            client_name=f"{user_profile.firstname} {user_profile.lastname}",
+            event_type=order.event_type or "N/A",
+        ),
+    )
+
+
+def render_password_reset(user_profile, reset_link):
+    """Return ``(subject, html)`` for the password reset email."""
+    return (
+        "Reset your JFK password",
+        PASSWORD_RESET.render(firstname=user_profile.firstname, reset_link=reset_link),
+    )
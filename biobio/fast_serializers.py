@@ -0,0 +1,175 @@
+# biobio/fast_serializers.py
+import datetime
+
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from .serializers import OrderListSerializer, UserProfileSerializer
+
+
+def _datetime_converter(field):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != "iso-8601":
+        return field.to_representation
+    field_timezone = getattr(field, "timezone", field.default_timezone())
+    if field_timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        if isinstance(value, str) or not timezone.is_aware(value):
+            return field.to_representation(value)
+        text = value.astimezone(field_timezone).isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+    return convert
+
+
+def _date_converter(field):
+    output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() != "iso-8601":
+        return field.to_representation
+    return lambda value: (
+        value.isoformat() if isinstance(value, datetime.date) else value
+    )
+
+
+def _identity(value):
+    return value
+
+
+def _converter(field):
+    """
+    A function giving ``field.to_representation(value)`` for a database value.
+
+    Types whose representation of a database value is the value itself skip the
+    field call entirely; anything not listed here falls back to it.
+    """
+    if isinstance(field, serializers.DateTimeField):
+        return _datetime_converter(field)
+    if isinstance(field, serializers.DateField):
+        return _date_converter(field)
+    if isinstance(field, serializers.ChoiceField):
+        # Every choice of a model CharField is already stored as its string value
+        if all(str(key) == key for key in field.choices):
+            return _identity
+        return field.to_representation
+    if isinstance(
+        field,
+        (
+            serializers.CharField,
+            serializers.BooleanField,
+            serializers.IntegerField,
+            serializers.SlugRelatedField,
+            serializers.PrimaryKeyRelatedField,
+        ),
+    ):
+        return _identity
+    return field.to_representation
+
+
+class ValuesSerializer:
+    """
+    Read-only stand-in for a ModelSerializer that renders ``.values()`` rows.
+
+    Model instances and per-field serializer calls dominate CPU on large
+    lists, so this reads plain dicts and runs one precomputed converter per
+    column instead. The fields, their order and their representation are
+    taken from ``serializer_class`` (after any sparse ``?fields=`` pruning),
+    so the rendered JSON is byte-identical to it. Nested many-to-many
+    serializers are filled in with one extra query per page, like a prefetch.
+    """
+
+    serializer_class = None
+    # Columns the paginator reads from every row, whether rendered or not
+    always_select = ()
+
+    def __init__(self, instance=None, many=False, context=None):
+        assert many or instance is None, "ValuesSerializer only renders lists"
+        self.instance = instance
+        self.context = context or {}
+        serializer = self.serializer_class(context=self.context)
+        self.model = serializer.Meta.model
+        self.columns = []
+        self.nested = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if isinstance(field, serializers.ListSerializer):
+                related = type(self)._nested_class(field.child)
+                self.nested.append((name, field.source, related))
+            elif isinstance(field, serializers.SlugRelatedField):
+                lookup = f"{field.source}__{field.slug_field}"
+                self.columns.append((name, lookup, _converter(field)))
+            else:
+                self.columns.append((name, field.source, _converter(field)))
+
+    @staticmethod
+    def _nested_class(child):
+        return type(
+            f"{type(child).__name__}Values",
+            (ValuesSerializer,),
+            {"serializer_class": type(child)},
+        )
+
+    @classmethod
+    def prepare_queryset(cls, queryset, request):
+        """``queryset`` as the dicts ``to_representation`` reads."""
+        return queryset.values(*cls(context={"request": request}).lookups())
+
+    def lookups(self):
+        names = {lookup for _, lookup, _ in self.columns}
+        names.update(self.always_select)
+        if self.nested:
+            names.add("pk")
+        return sorted(names)
+
+    def to_representation(self, rows):
+        rows = list(rows)
+        nested = {
+            name: self._fetch_related(source, related, rows)
+            for name, source, related in self.nested
+        }
+        data = []
+        for row in rows:
+            item = {}
+            for name, lookup, convert in self.columns:
+                value = row[lookup]
+                item[name] = None if value is None else convert(value)
+            for name, _, _ in self.nested:
+                item[name] = nested[name].get(row["pk"], [])
+            data.append(item)
+        return data
+
+    def _fetch_related(self, source, related, rows):
+        """Rendered related rows for each parent pk, in prefetch order."""
+        relation = self.model._meta.get_field(source)
+        back = relation.related_query_name()
+        serializer = related(context=self.context)
+        related_rows = list(
+            relation.related_model.objects.filter(
+                **{f"{back}__in": [row["pk"] for row in rows]}
+            ).values(back, *serializer.lookups())
+        )
+        grouped = {}
+        for parent, item in zip(
+            (row[back] for row in related_rows),
+            serializer.to_representation(related_rows),
+        ):
+            grouped.setdefault(parent, []).append(item)
+        return grouped
+
+    @property
+    def data(self):
+        return serializers.ReturnList(
+            self.to_representation(self.instance), serializer=self
+        )
+
+
+class UserProfileValuesSerializer(ValuesSerializer):
+    serializer_class = UserProfileSerializer
+
+
+class OrderListValuesSerializer(ValuesSerializer):
+    serializer_class = OrderListSerializer
+    always_select = ("id", "order_date")
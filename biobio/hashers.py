@@ -0,0 +1,38 @@
+# biobio/hashers.py
+import base64
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    """
+    Django's scrypt hasher with its cost (N) taken from settings.
+
+    Hashes keep the "scrypt" algorithm name, so changing the work factor only
+    marks existing hashes for an upgrade instead of invalidating them.
+    """
+
+    @property
+    def work_factor(self):
+        return settings.PASSWORD_SCRYPT_WORK_FACTOR
+
+    def encode(self, password, salt, n=None, r=None, p=None):
+        self._check_encode_args(password, salt)
+        n = n or self.work_factor
+        r = r or self.block_size
+        p = p or self.parallelism
+        hash_ = hashlib.scrypt(
+            password.encode(),
+            salt=salt.encode(),
+            n=n,
+            r=r,
+            p=p,
+            # scrypt needs 128 * r * n bytes; OpenSSL's default limit (32 MiB)
+            # would reject any N above 16384
+            maxmem=128 * r * n * 2,
+            dklen=64,
+        )
+        hash_ = base64.b64encode(hash_).decode("ascii").strip()
+        return "%s$%d$%s$%d$%d$%s" % (self.algorithm, n, salt, r, p, hash_)
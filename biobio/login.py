@@ -0,0 +1,51 @@
+# biobio/login.py
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.cache import cache
+
+
+def _failures_key(username):
+    # Hashed so any username makes a valid key for every cache backend
+    digest = hashlib.sha256(username.encode()).hexdigest()
+    return f"biobio:login-failures:{digest}"
+
+
+def is_locked_out(username):
+    """True once ``username`` has used up its failed attempts for the window."""
+    limit = settings.LOGIN_MAX_FAILED_ATTEMPTS
+    return bool(limit) and cache.get(_failures_key(username), 0) >= limit
+
+
+def record_failure(username):
+    """Count a failed login; the window starts at the first failure."""
+    if not settings.LOGIN_MAX_FAILED_ATTEMPTS:
+        return
+    key = _failures_key(username)
+    cache.add(key, 0, settings.LOGIN_LOCKOUT_SECONDS)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The window expired between add() and incr()
+        cache.set(key, 1, settings.LOGIN_LOCKOUT_SECONDS)
+
+
+def reset_failures(username):
+    cache.delete(_failures_key(username))
+
+
+def verify_password(user_profile, password):
+    """
+    Check ``password`` against the profile's stored hash.
+
+    With PASSWORD_REHASH_ON_LOGIN a correct password whose hash uses an older
+    hasher or cost is re-hashed with the preferred one and saved.
+    """
+
+    def rehash(raw_password):
+        user_profile.password = make_password(raw_password)
+        user_profile.save(update_fields=["password", "updated_at"])
+
+    setter = rehash if settings.PASSWORD_REHASH_ON_LOGIN else None
+    return check_password(password, user_profile.password, setter)
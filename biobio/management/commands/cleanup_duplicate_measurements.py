@@ -1,50 +1,80 @@
-from django.core.management.base import BaseCommand
-from django.db.models import Count
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Exists, Max, Min, OuterRef, Q
 from biobio.models import Measurement
 
 
+def duplicate_measurements():
+    """
+    Every measurement that has a newer row (higher id) for the same username.
+
+    Deleting these keeps exactly the Max(id) row per username; rows without a
+    username are treated as one group, as they always have been.
+    """
+    newer = Measurement.objects.filter(id__gt=OuterRef("id"))
+    return Measurement.objects.filter(
+        Q(Exists(newer.filter(username=OuterRef("username"))), username__isnull=False)
+        | Q(Exists(newer.filter(username__isnull=True)), username__isnull=True)
+    )
+
+
 class Command(BaseCommand):
     help = "Remove duplicate measurement records, keeping only the most recent one for each username"
 
-    def handle(self, *args, **kwargs):
-        self.stdout.write(
-            self.style.WARNING("Starting cleanup of duplicate measurements...")
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many duplicates would be deleted without deleting them.",
         )
-
-        # Find all usernames that have duplicates
-        duplicates = (
-            Measurement.objects.values("username")
-            .annotate(count=Count("id"))
-            .filter(count__gt=1)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50000,
+            help="Measurement ids scanned per delete statement and transaction.",
         )
 
-        total_deleted = 0
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive number of ids")
 
-        for item in duplicates:
-            username = item["username"]
-            count = item["count"]
+        self.stdout.write(
+            self.style.WARNING("Starting cleanup of duplicate measurements...")
+        )
 
-            # Get all measurements for this username, ordered by id (oldest first)
-            measurements = list(
-                Measurement.objects.filter(username=username).order_by("id")
+        if options["dry_run"]:
+            groups = (
+                Measurement.objects.values("username")
+                .annotate(count=Count("id"))
+                .filter(count__gt=1)
+                .count()
             )
+            total = duplicate_measurements().count()
+            self.stdout.write(
+                f"Dry run: would delete {total} duplicate measurement(s) "
+                f"across {groups} username(s)."
+            )
+            return
 
-            # Keep the most recent one (last in the list) and delete the rest
-            to_delete = measurements[:-1] if len(measurements) > 1 else []
-            deleted_count = len(to_delete)
-
-            if deleted_count > 0:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f'Found {count} measurements for username "{username}". '
-                        f"Keeping the most recent one, deleting {deleted_count} duplicates."
+        bounds = Measurement.objects.aggregate(first=Min("id"), last=Max("id"))
+        total_deleted = 0
+        if bounds["first"] is not None:
+            batch_size = options["batch_size"]
+            span = bounds["last"] - bounds["first"] + 1
+            for start in range(bounds["first"], bounds["last"] + 1, batch_size):
+                end = min(start + batch_size - 1, bounds["last"])
+                # One DELETE per id window, committed on its own
+                with transaction.atomic():
+                    deleted, _ = (
+                        duplicate_measurements().filter(id__range=(start, end)).delete()
                     )
+                total_deleted += deleted
+                done = end - bounds["first"] + 1
+                self.stdout.write(
+                    f"Scanned ids up to {end} ({done * 100 // span}%): "
+                    f"{total_deleted} deleted so far"
                 )
 
-                for measurement in to_delete:
-                    measurement.delete()
-                    total_deleted += 1
-
         if total_deleted > 0:
             self.stdout.write(
                 self.style.SUCCESS(
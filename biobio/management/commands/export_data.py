@@ -0,0 +1,228 @@
+import csv
+from datetime import datetime, time, timedelta
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from biobio.models import Measurement, NotificationLog, Order
+
+EXPORTS = {
+    "orders": {
+        "model": Order,
+        "date_field": "order_date",
+        "status_field": "status",
+        # The API identifies clients by username, so exports do too
+        "columns": {"client_id": ("client", "client__username")},
+        "many_to_many": {"customization_options": "name"},
+    },
+    "measurements": {
+        "model": Measurement,
+        "date_field": "updated_at",
+        "status_field": None,
+    },
+    "notifications": {
+        "model": NotificationLog,
+        "date_field": "timestamp",
+        "status_field": "status",
+    },
+}
+
+
+def export_columns(export):
+    """(header, values() lookup) for every column of an export, in model order."""
+    renamed = export.get("columns", {})
+    columns = [
+        renamed.get(field.attname, (field.attname, field.attname))
+        for field in export["model"]._meta.concrete_fields
+    ]
+    return columns + [(name, None) for name in export.get("many_to_many", {})]
+
+
+def export_chunks(export, queryset, chunk_size):
+    """
+    Lists of up to ``chunk_size`` row dicts keyed by column header.
+
+    Rows are read through ``.iterator()``, a server-side cursor on
+    PostgreSQL, and many-to-many columns are filled in with one query per
+    chunk, joined as "a; b".
+    """
+    columns = export_columns(export)
+    lookups = [lookup for _, lookup in columns if lookup]
+    rows = queryset.values(*lookups).iterator(chunk_size=chunk_size)
+    while batch := list(islice(rows, chunk_size)):
+        related = {}
+        for name, related_field in export.get("many_to_many", {}).items():
+            relation = export["model"]._meta.get_field(name)
+            source = relation.m2m_field_name()
+            target = f"{relation.m2m_reverse_field_name()}__{related_field}"
+            values = related[name] = {}
+            ids = [row["id"] for row in batch]
+            for pk, value in (
+                relation.remote_field.through.objects.filter(**{f"{source}__in": ids})
+                .order_by("pk")
+                .values_list(source, target)
+            ):
+                values.setdefault(pk, []).append(value)
+        yield [
+            {
+                header: (
+                    "; ".join(related[header].get(row["id"], []))
+                    if lookup is None
+                    else row[lookup]
+                )
+                for header, lookup in columns
+            }
+            for row in batch
+        ]
+
+
+class CsvExport:
+    extension = "csv"
+
+    def __init__(self, output, columns, export, stdout):
+        self.stdout = stdout
+        self.file = (
+            stdout if output == "-" else open(output, "w", newline="", encoding="utf-8")
+        )
+        self.writer = csv.DictWriter(
+            self.file, fieldnames=[name for name, _ in columns]
+        )
+        self.writer.writeheader()
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        if self.file is not self.stdout:
+            self.file.close()
+
+
+class ParquetExport:
+    """Columnar, zstd-compressed output; needs the optional pyarrow package."""
+
+    extension = "parquet"
+
+    def __init__(self, output, columns, export, stdout):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise CommandError("Parquet export needs pyarrow: pip install pyarrow")
+        if output == "-":
+            raise CommandError("Parquet export needs an --output file")
+
+        self.pyarrow = pyarrow
+        self.schema = pyarrow.schema(
+            [(name, self.arrow_type(export, name, lookup)) for name, lookup in columns]
+        )
+        self.writer = pyarrow.parquet.ParquetWriter(
+            output, self.schema, compression="zstd"
+        )
+
+    def arrow_type(self, export, name, lookup):
+        pa = self.pyarrow
+        field = export["model"]._meta.get_field(
+            lookup.split("__")[0] if lookup else name
+        )
+        if field.is_relation:
+            # Related usernames and joined many-to-many names
+            return pa.string()
+        if isinstance(field, models.DateTimeField):
+            return pa.timestamp("us", tz="UTC")
+        if isinstance(field, models.DateField):
+            return pa.date32()
+        if isinstance(field, models.DecimalField):
+            return pa.decimal128(field.max_digits, field.decimal_places)
+        if isinstance(field, models.BooleanField):
+            return pa.bool_()
+        if isinstance(field, (models.IntegerField, models.AutoField)):
+            return pa.int64()
+        return pa.string()
+
+    def write(self, rows):
+        self.writer.write_table(self.pyarrow.Table.from_pylist(rows, self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+FORMATS = {"csv": CsvExport, "parquet": ParquetExport}
+
+
+def day(value):
+    parsed = parse_date(value)
+    if parsed is None:
+        raise ValueError(value)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = "Export orders, measurements or notification logs to CSV or Parquet"
+
+    def add_arguments(self, parser):
+        parser.add_argument("data", choices=EXPORTS, help="What to export.")
+        parser.add_argument("--format", choices=FORMATS, default="csv")
+        parser.add_argument(
+            "--output",
+            help='File to write; defaults to "<data>.<format>", "-" for stdout (CSV only).',
+        )
+        parser.add_argument(
+            "--since", type=day, help="First day to include (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            "--until", type=day, help="Last day to include (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            "--status",
+            action="append",
+            help="Only rows with this status; repeat for several.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows fetched from the database and written per chunk.",
+        )
+
+    def handle(self, *args, **options):
+        export = EXPORTS[options["data"]]
+        queryset = export["model"].objects.order_by("id")
+
+        date_field = export["date_field"]
+        if options["since"]:
+            start = datetime.combine(options["since"], time.min)
+            queryset = queryset.filter(
+                **{f"{date_field}__gte": timezone.make_aware(start)}
+            )
+        if options["until"]:
+            end = datetime.combine(options["until"] + timedelta(days=1), time.min)
+            queryset = queryset.filter(
+                **{f"{date_field}__lt": timezone.make_aware(end)}
+            )
+        if options["status"]:
+            if not export["status_field"]:
+                raise CommandError(f"{options['data']} have no status to filter on")
+            queryset = queryset.filter(
+                **{f"{export['status_field']}__in": options["status"]}
+            )
+
+        export_class = FORMATS[options["format"]]
+        output = options["output"] or f"{options['data']}.{export_class.extension}"
+        writer = export_class(output, export_columns(export), export, self.stdout)
+        written = 0
+        try:
+            for chunk in export_chunks(export, queryset, options["batch_size"]):
+                writer.write(chunk)
+                written += len(chunk)
+        finally:
+            writer.close()
+
+        if output != "-":
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"✓ Exported {written} {options['data']} row(s) to {output}."
+                )
+            )
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from biobio.models import PasswordResetToken
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete used and expired password reset token rows left over from "
+        "before reset links were signed"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Also delete unexpired rows, invalidating their reset links.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many rows would be deleted without deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        tokens = PasswordResetToken.objects.all()
+        if not options["all"]:
+            tokens = tokens.filter(Q(used=True) | Q(expires_at__lt=timezone.now()))
+
+        if options["dry_run"]:
+            self.stdout.write(
+                f"Dry run: would delete {tokens.count()} password reset token(s)."
+            )
+            return
+
+        deleted, _ = tokens.delete()
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Deleted {deleted} password reset token(s).")
+        )
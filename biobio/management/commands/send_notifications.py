@@ -0,0 +1,130 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from biobio.models import NotificationLog
+from biobio.notification_service import NotificationService
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver pending email and SMS notifications from the outbox, retrying "
+        "failures with exponential backoff"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the outbox once and exit instead of polling forever.",
+        )
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=5,
+            help="Give up on a notification after this many failed sends.",
+        )
+        parser.add_argument(
+            "--backoff",
+            type=float,
+            default=30.0,
+            help="Seconds before the first retry; doubles after every failure.",
+        )
+        parser.add_argument(
+            "--lease",
+            type=float,
+            default=300.0,
+            help="Seconds a claimed notification is hidden from other workers; "
+            "if this worker dies, it is sent again after that.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep when the outbox is empty.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            processed = self.process_batch(options)
+            if processed:
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["poll_interval"])
+
+    def process_batch(self, options):
+        """Send one batch of due notifications; return how many were attempted."""
+        batch = self.claim_batch(options)
+        # Sent outside the claiming transaction and recorded one by one, so no
+        # lock is held across provider calls and a crash keeps what was sent
+        for notification in batch:
+            self.deliver(notification, options)
+        return len(batch)
+
+    def claim_batch(self, options):
+        """Lease up to --batch-size due notifications to this worker."""
+        now = timezone.now()
+        with transaction.atomic():
+            # skip_locked lets several workers drain the outbox side by side
+            batch = list(
+                NotificationLog.objects.select_for_update(skip_locked=True)
+                .filter(
+                    status=NotificationLog.STATUS_PENDING,
+                    next_attempt_at__lte=now,
+                )
+                .order_by("next_attempt_at")[: options["batch_size"]]
+            )
+            NotificationLog.objects.filter(
+                id__in=[notification.id for notification in batch]
+            ).update(next_attempt_at=now + timedelta(seconds=options["lease"]))
+        return batch
+
+    def send(self, notification):
+        if notification.notification_type == "sms":
+            return NotificationService.send_sms_notification(
+                notification.recipient, notification.message
+            )
+        return NotificationService.send_email_notification(
+            to_email=notification.recipient,
+            subject=notification.subject,
+            message=notification.message,
+        )
+
+    def deliver(self, notification, options):
+        try:
+            sent = self.send(notification)
+            error = None if sent else "provider rejected the message"
+        except Exception as e:
+            error = str(e)
+
+        notification.attempts += 1
+        # timestamp stays the time the notification was queued
+        notification.last_attempt_at = timezone.now()
+        if error is None:
+            notification.status = NotificationLog.STATUS_SUCCESS
+            notification.next_attempt_at = None
+        elif notification.attempts >= options["max_attempts"]:
+            notification.status = f"Failed: {error}"[:50]
+            notification.next_attempt_at = None
+        else:
+            delay = options["backoff"] * 2 ** (notification.attempts - 1)
+            notification.next_attempt_at = timezone.now() + timedelta(seconds=delay)
+        notification.save(
+            update_fields=["status", "attempts", "last_attempt_at", "next_attempt_at"]
+        )
+
+        if error is None:
+            self.stdout.write(
+                f"Sent {notification.notification_type} "
+                f"{notification.subject or notification.message!r} "
+                f"to {notification.recipient}"
+            )
+        else:
+            self.stderr.write(
+                f"Attempt {notification.attempts} to {notification.recipient} failed: {error}"
+            )
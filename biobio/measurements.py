@@ -0,0 +1,154 @@
+# biobio/measurements.py
+import math
+import re
+import statistics
+from decimal import Decimal, InvalidOperation
+
+from django.db import connections
+from django.db.models import Aggregate, Avg, Count, F, FloatField, Max, Min
+from django.db.models.functions import Cast
+
+# Body measurements stored on Measurement, all in inches
+MEASUREMENT_FIELDS = (
+    "neck",
+    "chest",
+    "waist",
+    "hip",
+    "shoulder",
+    "sleeve",
+    "armhole",
+    "bicep",
+    "wrist",
+    "inseam",
+    "outseam",
+    "thigh",
+    "rise",
+    "bodylength",
+)
+
+# Unit suffix -> inches per unit; a bare number is already in inches
+UNITS = {
+    "": Decimal(1),
+    "in": Decimal(1),
+    "inch": Decimal(1),
+    "inches": Decimal(1),
+    '"': Decimal(1),
+    "cm": Decimal(1) / Decimal("2.54"),
+    "mm": Decimal(1) / Decimal("25.4"),
+}
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+_MEASUREMENT = re.compile(r"^\s*(\d+(?:[.,]\d+)?)\s*([a-z\"]*)\.?\s*$", re.IGNORECASE)
+
+
+class PercentileCont(Aggregate):
+    """PostgreSQL's ``percentile_cont(fraction) WITHIN GROUP (ORDER BY expression)``."""
+
+    function = "PERCENTILE_CONT"
+    template = "%(function)s(%(fraction)s) WITHIN GROUP (ORDER BY %(expressions)s)"
+    output_field = FloatField()
+
+    def __init__(self, expression, percentile, **extra):
+        # Written into the SQL, so it must be a number
+        super().__init__(expression, fraction=float(percentile) / 100, **extra)
+
+
+def parse_measurement(value):
+    """
+    Convert a measurement such as ``32``, ``"32in"`` or ``"81 cm"`` to inches.
+
+    Returns a Decimal rounded to two places, or None for empty values.
+    Raises ValueError for anything that is not a number with a known unit.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return Decimal(str(value)).quantize(Decimal("0.01"))
+    value = str(value).strip()
+    if not value:
+        return None
+
+    match = _MEASUREMENT.match(value)
+    unit = match and UNITS.get(match.group(2).lower())
+    if unit is None:
+        raise ValueError(f"Unrecognized measurement: {value!r}")
+    try:
+        number = Decimal(match.group(1).replace(",", "."))
+    except InvalidOperation:
+        raise ValueError(f"Unrecognized measurement: {value!r}")
+    return (number * unit).quantize(Decimal("0.01"))
+
+
+def size_chart(queryset, percentiles=DEFAULT_PERCENTILES):
+    """
+    Summarize every measurement field across ``queryset``.
+
+    Count, mean, min, max and (population) standard deviation come from one
+    aggregate query. On PostgreSQL the percentile cut points are computed in
+    that query too; elsewhere they are taken from one fetch of the columns,
+    sorted per field.
+    """
+    in_database = bool(percentiles) and connections[queryset.db].vendor == "postgresql"
+    aggregates = {
+        f"{field}__{name}": function
+        for field in MEASUREMENT_FIELDS
+        for name, function in (
+            ("count", Count(field)),
+            ("mean", Avg(field)),
+            ("min", Min(field)),
+            ("max", Max(field)),
+            # SQLite's StdDev fails on fewer than two values; derive it instead
+            ("square", Avg(F(field) * F(field))),
+        )
+    }
+    if in_database:
+        aggregates.update(
+            (f"{field}__p{p}", PercentileCont(Cast(field, FloatField()), p))
+            for field in MEASUREMENT_FIELDS
+            for p in percentiles
+        )
+    summary = queryset.aggregate(**aggregates)
+    columns = dict.fromkeys(MEASUREMENT_FIELDS, ())
+    if percentiles and not in_database:
+        # Fetched as floats: building Decimals costs far more than the query
+        rows = queryset.values_list(
+            *(Cast(field, FloatField()) for field in MEASUREMENT_FIELDS)
+        )
+        columns.update(zip(MEASUREMENT_FIELDS, zip(*rows)))
+
+    chart = {}
+    for field in MEASUREMENT_FIELDS:
+        stats = {
+            name: _round(summary[f"{field}__{name}"])
+            for name in ("count", "mean", "min", "max")
+        }
+        mean, square = summary[f"{field}__mean"], summary[f"{field}__square"]
+        stats["stddev"] = (
+            None
+            if mean is None
+            else _round(math.sqrt(max(float(square) - float(mean) ** 2, 0)))
+        )
+        if in_database:
+            stats["percentiles"] = {
+                f"p{p}": _round(summary[f"{field}__p{p}"]) for p in percentiles
+            }
+        elif percentiles:
+            values = sorted(value for value in columns[field] if value is not None)
+            stats["percentiles"] = _percentiles(values, percentiles)
+        chart[field] = stats
+    return chart
+
+
+def _percentiles(values, percentiles):
+    if len(values) < 2:
+        cuts = [values[0] if values else None] * 99
+    else:
+        cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {f"p{p}": _round(cuts[p - 1]) for p in percentiles}
+
+
+def _round(value):
+    if value is None or isinstance(value, int):
+        return value
+    return round(float(value), 2)
@@ -0,0 +1,198 @@
+# biobio/metrics.py
+import bisect
+import contextvars
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+def _labels(names, values):
+    escaped = (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for value in values
+    )
+    return ",".join(f'{name}="{value}"' for name, value in zip(names, escaped))
+
+
+class Histogram:
+    """Prometheus-style histogram with one series per label tuple."""
+
+    def __init__(self, name, help_text, buckets, label_names=("view", "method")):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.label_names = label_names
+        # labels -> [per-bucket counts (last is +Inf), sum of observations]
+        self.series = {}
+
+    def observe(self, labels, value):
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [[0] * (len(self.buckets) + 1), 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, (counts, total) in sorted(self.series.items()):
+            label_text = _labels(self.label_names, labels)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(
+                    f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f"{self.name}_sum{{{label_text}}} {total}")
+            lines.append(f"{self.name}_count{{{label_text}}} {cumulative}")
+        return lines
+
+
+class RequestMetrics:
+    """Per-view request metrics for this process, rendered for Prometheus."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.requests = {}
+        self.histograms = {
+            "duration": Histogram(
+                "biobio_request_duration_seconds",
+                "Wall time spent in the view and middleware.",
+                DURATION_BUCKETS,
+            ),
+            "queries": Histogram(
+                "biobio_request_db_queries",
+                "Database queries run per request.",
+                QUERY_BUCKETS,
+            ),
+            "db_duration": Histogram(
+                "biobio_request_db_duration_seconds",
+                "Time spent in database queries per request.",
+                DURATION_BUCKETS,
+            ),
+            "size": Histogram(
+                "biobio_response_size_bytes",
+                "Response body size; streaming responses are not counted.",
+                SIZE_BUCKETS,
+            ),
+        }
+
+    def observe(self, view, method, status, duration, queries, db_duration, size):
+        labels = (view, method)
+        key = (view, method, status)
+        histograms = self.histograms
+        with self.lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+            histograms["duration"].observe(labels, duration)
+            histograms["queries"].observe(labels, queries)
+            histograms["db_duration"].observe(labels, db_duration)
+            if size is not None:
+                histograms["size"].observe(labels, size)
+
+    def render(self):
+        with self.lock:
+            lines = [
+                "# HELP biobio_requests_total Requests served, by view and status.",
+                "# TYPE biobio_requests_total counter",
+            ]
+            for labels, count in sorted(self.requests.items()):
+                label_text = _labels(("view", "method", "status"), labels)
+                lines.append(f"biobio_requests_total{{{label_text}}} {count}")
+            for histogram in self.histograms.values():
+                lines.extend(histogram.render())
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
+
+
+class QueryRecorder:
+    """``connection.execute_wrapper`` that counts queries and their time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+
+# The recorder for the request being handled in this thread or task, if any
+current_recorder = contextvars.ContextVar("biobio_query_recorder", default=None)
+
+
+def record_queries(execute, sql, params, many, context):
+    recorder = current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_query_recorder(connection, **kwargs):
+    # Installed once per connection: entering execute_wrapper() on every
+    # request costs more than the rest of the middleware put together
+    if record_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_queries)
+
+
+class RequestMetricsMiddleware:
+    """
+    Record wall time, query count, query time and response size per view.
+
+    The numbers feed ``request_metrics`` (served by the admin metrics view)
+    and a ``Server-Timing`` header. Turn off with REQUEST_METRICS=False.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        connection_created.connect(
+            install_query_recorder, dispatch_uid="biobio.metrics"
+        )
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(connection)
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        token = current_recorder.set(recorder)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            duration = time.perf_counter() - started
+            current_recorder.reset(token)
+
+        match = request.resolver_match
+        request_metrics.observe(
+            match.view_name if match else "unresolved",
+            request.method,
+            response.status_code,
+            duration=duration,
+            queries=recorder.count,
+            db_duration=recorder.duration,
+            size=None if response.streaming else len(response.content),
+        )
+        response["Server-Timing"] = (
+            f"app;dur={duration * 1000:.1f}, "
+            f'db;dur={recorder.duration * 1000:.1f};desc="{recorder.count} queries"'
+        )
+        return response
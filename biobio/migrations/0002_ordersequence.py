@@ -0,0 +1,45 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:35
+
+from django.db import migrations, models
+
+
+def seed_sequences(apps, schema_editor):
+    """Start each day's counter after the highest order_id already issued."""
+    Order = apps.get_model("biobio", "Order")
+    OrderSequence = apps.get_model("biobio", "OrderSequence")
+
+    last_values = {}
+    order_ids = Order.objects.filter(order_id__startswith="JFK").values_list(
+        "order_id", flat=True
+    )
+    for order_id in order_ids.iterator():
+        prefix, suffix = order_id[:11], order_id[11:]
+        if not suffix.isdigit():
+            continue
+        last_values[prefix] = max(last_values.get(prefix, 0), int(suffix))
+
+    OrderSequence.objects.bulk_create(
+        OrderSequence(prefix=prefix, last_value=value)
+        for prefix, value in last_values.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("biobio", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderSequence",
+            fields=[
+                (
+                    "prefix",
+                    models.CharField(max_length=11, primary_key=True, serialize=False),
+                ),
+                ("last_value", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(seed_sequences, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("biobio", "0003_notification_outbox"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notificationlog",
+            index=models.Index(
+                fields=["order", "-timestamp"], name="notification_order_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notificationlog",
+            index=models.Index(fields=["timestamp"], name="notification_timestamp_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(fields=["-order_date", "-id"], name="order_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["client", "-order_date", "-id"], name="order_client_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["is_confirmed", "-order_date", "-id"],
+                name="order_confirmed_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("is_confirmed", True)),
+                fields=["status", "-order_date", "-id"],
+                name="order_status_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["is_confirmed", "status"], name="order_dashboard_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="passwordresettoken",
+            index=models.Index(
+                condition=models.Q(("used", False)),
+                fields=["expires_at"],
+                name="reset_token_active_idx",
+            ),
+        ),
+    ]
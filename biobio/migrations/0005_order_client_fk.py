@@ -0,0 +1,86 @@
+# Generated by Django 5.1.1 on 2026-10-18 12:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def link_clients(apps, schema_editor):
+    """
+    Point every order at the profile whose username it stored.
+
+    Orders whose profile no longer exists keep their username in the old
+    column (renamed legacy_client below); it is cleared on linked orders.
+    """
+    Order = apps.get_model("biobio", "Order")
+    UserProfile = apps.get_model("biobio", "UserProfile")
+
+    Order.objects.update(
+        client_profile=Subquery(
+            UserProfile.objects.filter(username=OuterRef("client")).values("id")[:1]
+        )
+    )
+    Order.objects.filter(client_profile__isnull=False).update(client="")
+
+
+def unlink_clients(apps, schema_editor):
+    Order = apps.get_model("biobio", "Order")
+    UserProfile = apps.get_model("biobio", "UserProfile")
+
+    Order.objects.filter(client_profile__isnull=False).update(
+        client=Subquery(
+            UserProfile.objects.filter(id=OuterRef("client_profile")).values(
+                "username"
+            )[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("biobio", "0004_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="client_profile",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                db_index=False,
+                related_name="orders",
+                to="biobio.userprofile",
+            ),
+        ),
+        migrations.RunPython(link_clients, unlink_clients),
+        migrations.AlterField(
+            model_name="order",
+            name="client",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=100
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="order",
+            name="order_client_date_idx",
+        ),
+        migrations.RenameField(
+            model_name="order",
+            old_name="client",
+            new_name="legacy_client",
+        ),
+        migrations.RenameField(
+            model_name="order",
+            old_name="client_profile",
+            new_name="client",
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["client", "-order_date", "-id"], name="order_client_date_idx"
+            ),
+        ),
+    ]
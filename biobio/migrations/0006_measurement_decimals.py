@@ -0,0 +1,228 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:50
+
+import re
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+# A frozen copy of the parser in biobio.measurements, so later changes to it
+# cannot change what this migration does
+MEASUREMENT_FIELDS = (
+    "neck",
+    "chest",
+    "waist",
+    "hip",
+    "shoulder",
+    "sleeve",
+    "armhole",
+    "bicep",
+    "wrist",
+    "inseam",
+    "outseam",
+    "thigh",
+    "rise",
+    "bodylength",
+)
+
+UNITS = {
+    "": Decimal(1),
+    "in": Decimal(1),
+    "inch": Decimal(1),
+    "inches": Decimal(1),
+    '"': Decimal(1),
+    "cm": Decimal(1) / Decimal("2.54"),
+    "mm": Decimal(1) / Decimal("25.4"),
+}
+
+_MEASUREMENT = re.compile(r"^\s*(\d+(?:[.,]\d+)?)\s*([a-z\"]*)\.?\s*$", re.IGNORECASE)
+
+# DecimalField(max_digits=6, decimal_places=2) holds up to 9999.99
+LIMIT = Decimal("10000")
+
+
+def parse_measurement(value):
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+
+    match = _MEASUREMENT.match(value)
+    unit = match and UNITS.get(match.group(2).lower())
+    if unit is None:
+        raise ValueError(f"Unrecognized measurement: {value!r}")
+    try:
+        number = Decimal(match.group(1).replace(",", "."))
+    except InvalidOperation:
+        raise ValueError(f"Unrecognized measurement: {value!r}")
+    return (number * unit).quantize(Decimal("0.01"))
+
+
+def normalize(raw):
+    """Legacy text as plain inches, or None if the new column cannot hold it."""
+    try:
+        value = parse_measurement(raw)
+    except ValueError:
+        return None
+    if value is None or value >= LIMIT:
+        return None
+    return str(value)
+
+
+def normalize_measurements(apps, schema_editor):
+    """
+    Rewrite legacy text such as "32in" or "81 cm" as plain inches.
+
+    Values that cannot be read as a measurement, or are too large for the
+    numeric columns below, are cleared; their text is kept in
+    legacy_measurements.
+    """
+    Measurement = apps.get_model("biobio", "Measurement")
+
+    changed = []
+    kept = 0
+    for measurement in Measurement.objects.only(*MEASUREMENT_FIELDS).iterator():
+        legacy = {}
+        for field in MEASUREMENT_FIELDS:
+            raw = getattr(measurement, field)
+            value = normalize(raw)
+            if value is None and raw is not None and str(raw).strip():
+                legacy[field] = raw
+            setattr(measurement, field, value)
+        measurement.legacy_measurements = legacy
+        kept += bool(legacy)
+        changed.append(measurement)
+    Measurement.objects.bulk_update(
+        changed, [*MEASUREMENT_FIELDS, "legacy_measurements"], batch_size=500
+    )
+    if kept:
+        print(
+            f"\n  {kept} measurement rows had values that could not be converted; "
+            "their text is in Measurement.legacy_measurements"
+        )
+
+
+def restore_measurements(apps, schema_editor):
+    """Put the text that could not be converted back into its column."""
+    Measurement = apps.get_model("biobio", "Measurement")
+
+    changed = []
+    for measurement in Measurement.objects.exclude(legacy_measurements={}).iterator():
+        for field, raw in measurement.legacy_measurements.items():
+            setattr(measurement, field, raw)
+        changed.append(measurement)
+    Measurement.objects.bulk_update(changed, MEASUREMENT_FIELDS, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("biobio", "0005_order_client_fk"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="measurement",
+            name="legacy_measurements",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.RunPython(normalize_measurements, restore_measurements),
+        migrations.AlterField(
+            model_name="measurement",
+            name="armhole",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="bicep",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="bodylength",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="chest",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="hip",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="inseam",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="neck",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="outseam",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="rise",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="shoulder",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="sleeve",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="thigh",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="waist",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="wrist",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=6, null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-18 12:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("biobio", "0007_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="userprofile",
+            name="password",
+            field=models.CharField(max_length=128),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-18 13:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("biobio", "0008_userprofile_password_length"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notificationlog",
+            name="last_attempt_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -1,9 +1,13 @@
 from django.contrib.auth.models import AbstractUser, Group, Permission
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import connection, models
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
 from django.utils import timezone
 from datetime import datetime
 
+from .dashboard import invalidate_dashboard_counts
+
 User = get_user_model()
 
 # class CustomUser(AbstractUser):
@@ -51,7 +55,8 @@ class Biodata(models.Model):
 class UserProfile(models.Model):
     username = models.CharField(max_length=100, unique=True)
     # username = models.OneToOneField(User, on_delete=models.CASCADE)
-    password = models.CharField(max_length=100)
+    # As long as Django's own password column; an scrypt hash fills all 128
+    password = models.CharField(max_length=128)
     role = models.CharField(max_length=100)
     firstname = models.CharField(max_length=100)
     lastname = models.CharField(max_length=100)
@@ -62,12 +67,34 @@ class UserProfile(models.Model):
     bio = models.TextField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.username
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_dashboard_counts()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        invalidate_dashboard_counts()
+        return result
 
 
 class CustomizationOption(models.Model):
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True, null=True)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Order payloads embed their options, so a rename is a change to them
+        touch_orders(self.order_set.all())
+
+    def delete(self, *args, **kwargs):
+        touch_orders(self.order_set.all())
+        return super().delete(*args, **kwargs)
+
     def __str__(self):
         return self.name
 
@@ -81,8 +108,21 @@ class Order(models.Model):
     ]
 
     order_id = models.CharField(max_length=20, unique=True, blank=True)
-    # client = models.ForeignKey(UserProfile, on_delete=models.CASCADE)
-    client = models.CharField(max_length=100)
+    # Orders outlive a deleted profile; the API still reads and writes the username.
+    # order_client_date_idx leads with client, so the FK needs no index of its own
+    client = models.ForeignKey(
+        UserProfile,
+        on_delete=models.SET_NULL,
+        related_name="orders",
+        blank=True,
+        null=True,
+        db_index=False,
+    )
+    # Username of an order whose profile was already gone when client became a
+    # foreign key; empty for every other order
+    legacy_client = models.CharField(
+        max_length=100, blank=True, default="", editable=False
+    )
     status = models.CharField(max_length=100, choices=STATUS_CHOICES, default="Pending")
     order_date = models.DateTimeField(auto_now_add=True)
     customization_options = models.ManyToManyField(CustomizationOption, blank=True)
@@ -95,6 +135,27 @@ class Order(models.Model):
     event_type = models.CharField(max_length=100, blank=True, null=True)
     material = models.BooleanField(default=False)
     preferred_Color = models.CharField(max_length=100, blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Matched to the list views' filters and their (-order_date, -id) cursor
+        indexes = [
+            models.Index(fields=["-order_date", "-id"], name="order_date_idx"),
+            models.Index(
+                fields=["client", "-order_date", "-id"], name="order_client_date_idx"
+            ),
+            models.Index(
+                fields=["is_confirmed", "-order_date", "-id"],
+                name="order_confirmed_date_idx",
+            ),
+            models.Index(
+                fields=["status", "-order_date", "-id"],
+                condition=models.Q(is_confirmed=True),
+                name="order_status_date_idx",
+            ),
+            # Covers the dashboard's conditional counts without touching the table
+            models.Index(fields=["is_confirmed", "status"], name="order_dashboard_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.order_id:
@@ -102,46 +163,93 @@ class Order(models.Model):
             today = datetime.now()
             date_prefix = today.strftime("JFK%d%m%Y")
 
-            # Get the last order with the same date prefix
-            last_order = (
-                Order.objects.filter(order_id__startswith=date_prefix)
-                .order_by("order_id")
-                .last()
-            )
-
-            if last_order and last_order.order_id:
-                # Extract the sequence number and increment
-                last_sequence = int(last_order.order_id[-4:])
-                new_sequence = last_sequence + 1
-            else:
-                # First order of the day
-                new_sequence = 1
+            # Reserve the next number for today in a single atomic statement
+            new_sequence = OrderSequence.next_value(date_prefix)
 
             # Format with leading zeros (4 digits)
             self.order_id = f"{date_prefix}{new_sequence:04d}"
 
         super().save(*args, **kwargs)
+        invalidate_dashboard_counts()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        invalidate_dashboard_counts()
+        return result
 
     def __str__(self):
         return f"Order {self.order_id} - {self.client}"
 
 
+def touch_orders(orders):
+    """Bump ``updated_at`` so conditional GETs of ``orders`` get a new version."""
+    orders.update(updated_at=timezone.now())
+
+
+@receiver(m2m_changed, sender=Order.customization_options.through)
+def order_options_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        touch_orders(Order.objects.filter(pk=instance.pk))
+    elif action == "pre_clear":
+        touch_orders(instance.order_set.all())
+    elif pk_set:
+        touch_orders(Order.objects.filter(pk__in=pk_set))
+
+
+class OrderSequence(models.Model):
+    """Per-day counter backing the numeric suffix of ``Order.order_id``."""
+
+    prefix = models.CharField(max_length=11, primary_key=True)
+    last_value = models.PositiveIntegerField(default=0)
+
+    @classmethod
+    def next_value(cls, prefix):
+        """
+        Atomically increment the counter for ``prefix`` and return the new value.
+
+        The upsert runs as one statement, so concurrent callers each get a
+        distinct number without locking the orders table.
+        """
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (prefix, last_value) VALUES (%s, 1) "
+                f"ON CONFLICT (prefix) DO UPDATE SET last_value = {table}.last_value + 1 "
+                "RETURNING last_value",
+                [prefix],
+            )
+            return cursor.fetchone()[0]
+
+    def __str__(self):
+        return f"{self.prefix}: {self.last_value}"
+
+
 class Measurement(models.Model):
     username = models.CharField(max_length=100, unique=True, blank=True, null=True)
-    neck = models.CharField(max_length=100, blank=True, null=True)
-    chest = models.CharField(max_length=100, blank=True, null=True)
-    waist = models.CharField(max_length=100, blank=True, null=True)
-    hip = models.CharField(max_length=100, blank=True, null=True)
-    shoulder = models.CharField(max_length=100, blank=True, null=True)
-    sleeve = models.CharField(max_length=100, blank=True, null=True)
-    armhole = models.CharField(max_length=100, blank=True, null=True)
-    bicep = models.CharField(max_length=100, blank=True, null=True)
-    wrist = models.CharField(max_length=100, blank=True, null=True)
-    inseam = models.CharField(max_length=100, blank=True, null=True)
-    outseam = models.CharField(max_length=100, blank=True, null=True)
-    thigh = models.CharField(max_length=100, blank=True, null=True)
-    rise = models.CharField(max_length=100, blank=True, null=True)
-    bodylength = models.CharField(max_length=100, blank=True, null=True)
+    # Body measurements in inches; see biobio.measurements for accepted input
+    neck = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    chest = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    waist = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    hip = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    shoulder = models.DecimalField(
+        max_digits=6, decimal_places=2, blank=True, null=True
+    )
+    sleeve = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    armhole = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    bicep = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    wrist = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    inseam = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    outseam = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    thigh = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    rise = models.DecimalField(max_digits=6, decimal_places=2, blank=True, null=True)
+    bodylength = models.DecimalField(
+        max_digits=6, decimal_places=2, blank=True, null=True
+    )
+    # Field -> text the decimal migration could not convert, kept for recovery
+    legacy_measurements = models.JSONField(default=dict, blank=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.username
@@ -152,14 +260,30 @@ class NotificationLog(models.Model):
         ("email", "Email"),
         ("sms", "SMS"),
     ]
+    STATUS_PENDING = "Pending"
+    STATUS_SUCCESS = "Success"
 
     # order = models.ForeignKey('Order', on_delete=models.CASCADE, related_name='notifications')
     order = models.CharField(max_length=100)
     notification_type = models.CharField(max_length=10, choices=ORDER_NOTIFICATION_TYPE)
     message = models.TextField()
     recipient = models.CharField(max_length=255)  # Email address or phone number
-    status = models.CharField(max_length=50)  # Success, Failed, etc.
+    status = models.CharField(max_length=50)  # Pending, Success, Failed, etc.
     timestamp = models.DateTimeField(default=timezone.now)
+    # Outbox bookkeeping for notifications delivered by the send_notifications worker
+    subject = models.CharField(max_length=255, blank=True, default="")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(blank=True, null=True)
+    last_attempt_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"], name="notification_outbox_idx"
+            ),
+            models.Index(fields=["order", "-timestamp"], name="notification_order_idx"),
+            models.Index(fields=["timestamp"], name="notification_timestamp_idx"),
+        ]
 
     def __str__(self):
         return (
@@ -176,5 +300,15 @@ class PasswordResetToken(models.Model):
     expires_at = models.DateTimeField()
     used = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            # Unused tokens are looked up by expiry; the user FK is already indexed
+            models.Index(
+                fields=["expires_at"],
+                condition=models.Q(used=False),
+                name="reset_token_active_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"Reset token for {self.user.username}"
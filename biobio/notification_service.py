@@ -1,18 +1,80 @@
 # biobio/notification_service.py
 from django.core.mail import send_mail
-from twilio.rest import Client
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from .models import NotificationLog
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
 
-
-import resend
 from django.conf import settings
+from django.utils import timezone
 import logging
 
 logger = logging.getLogger(__name__)
 
+_twilio_client = None
+_twilio_client_lock = threading.Lock()
+_resend = None
+
+
+def get_resend():
+    """
+    Return the resend module, configured with RESEND_API_KEY.
+
+    The SDK is imported on first use rather than at startup, so web workers
+    and management commands that never send email neither pay for the import
+    nor need the key.
+    """
+    global _resend
+    if _resend is None:
+        if not settings.RESEND_API_KEY:
+            raise ImproperlyConfigured("RESEND_API_KEY environment variable is not set")
+        import resend
+
+        resend.api_key = settings.RESEND_API_KEY
+        _resend = resend
+    return _resend
+
+
+def get_twilio_client():
+    """
+    Return the process-wide Twilio client.
+
+    The client keeps one pooled HTTP session, so consecutive SMS reuse open
+    TLS connections instead of building a new client per message.
+    """
+    global _twilio_client
+    if _twilio_client is None:
+        with _twilio_client_lock:
+            if _twilio_client is None:
+                # Imported here: twilio and requests add noticeably to worker boot
+                from requests.adapters import HTTPAdapter
+                from twilio.http.http_client import TwilioHttpClient
+                from twilio.rest import Client
+
+                http_client = TwilioHttpClient(pool_connections=True)
+                adapter = HTTPAdapter(pool_maxsize=settings.TWILIO_POOL_SIZE)
+                http_client.session.mount("https://", adapter)
+                http_client.session.mount("http://", adapter)
+                _twilio_client = Client(
+                    settings.TWILIO_ACCOUNT_SID,
+                    settings.TWILIO_AUTH_TOKEN,
+                    http_client=http_client,
+                )
+    return _twilio_client
+
+
+def _reset_twilio_client():
+    # A forked worker must not share the parent's sockets (or a held lock)
+    global _twilio_client, _twilio_client_lock
+    _twilio_client = None
+    _twilio_client_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_twilio_client)
+
 
 # class NotificationService:
 
@@ -58,6 +120,7 @@ class NotificationService:
         """
         Send email notification using Resend API
         """
+        resend = get_resend()
         try:
             # Send email using Resend API
             r = resend.Emails.send({
@@ -78,11 +141,70 @@ class NotificationService:
             logger.error(f"❌ Unexpected error sending email to {to_email}: {str(e)}")
             return False
 
+    @staticmethod
+    def send_bulk(recipients, subject, message, order="", max_concurrency=None):
+        """
+        Send the same email to many recipients using Resend's batch endpoint.
+
+        Recipients are grouped into batches of RESEND_BATCH_SIZE, and up to
+        ``max_concurrency`` batches are in flight at once. Every recipient gets a
+        NotificationLog row; returns a dict of recipient -> True/False.
+        """
+        resend = get_resend()
+        recipients = list(dict.fromkeys(recipients))
+        batch_size = settings.RESEND_BATCH_SIZE
+        batches = [
+            recipients[i : i + batch_size] for i in range(0, len(recipients), batch_size)
+        ]
+
+        def send_batch(batch):
+            try:
+                resend.Batch.send([
+                    {
+                        "from": settings.DEFAULT_FROM_EMAIL,
+                        "to": to_email,
+                        "subject": subject,
+                        "html": message,
+                        "text": "",
+                    }
+                    for to_email in batch
+                ])
+                return batch, None
+            except Exception as e:
+                logger.error(f"❌ Resend batch of {len(batch)} emails failed: {str(e)}")
+                return batch, str(e)
+
+        results = {}
+        logs = []
+        workers = min(max_concurrency or settings.RESEND_BATCH_CONCURRENCY, len(batches))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            for batch, error in pool.map(send_batch, batches):
+                status = NotificationLog.STATUS_SUCCESS
+                if error is not None:
+                    status = f"Failed: {error}"[:50]
+                for to_email in batch:
+                    results[to_email] = error is None
+                    logs.append(
+                        NotificationLog(
+                            order=order,
+                            notification_type="email",
+                            recipient=to_email,
+                            subject=subject,
+                            message=message,
+                            status=status,
+                        )
+                    )
+
+        NotificationLog.objects.bulk_create(logs)
+        logger.info(
+            f"✅ Bulk email sent to {sum(results.values())}/{len(results)} recipients"
+        )
+        return results
+
     @staticmethod
     def send_sms_notification(to_phone, message):
         try:
-            client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
-            client.messages.create(
+            get_twilio_client().messages.create(
                 body=message,
                 from_=settings.TWILIO_PHONE_NUMBER,
                 to=to_phone,
@@ -92,6 +214,24 @@ class NotificationService:
             print(f"Error sending SMS: {e}")
             return False
 
+    @staticmethod
+    def send_sms_many(recipients, message, max_concurrency=None):
+        """
+        Send the same SMS to many numbers over the shared Twilio connection pool.
+
+        Returns a dict of phone number -> True/False.
+        """
+        recipients = list(dict.fromkeys(recipients))
+        workers = min(max_concurrency or settings.TWILIO_SMS_CONCURRENCY, len(recipients))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            sent = pool.map(
+                lambda to_phone: NotificationService.send_sms_notification(
+                    to_phone, message
+                ),
+                recipients,
+            )
+            return dict(zip(recipients, sent))
+
     @staticmethod
     def notify_client(order, message):
         # Send both email and SMS notification
@@ -102,6 +242,36 @@ class NotificationService:
         #return email_sent, sms_sent
         return email_sent
 
+    @staticmethod
+    def queue_email_notification(to_email, subject, message, order=""):
+        """
+        Record an email in the outbox instead of sending it now.
+
+        Call this inside the transaction that changes the order: the row only
+        becomes visible to the send_notifications worker once that commits.
+        """
+        return NotificationLog.objects.create(
+            order=order,
+            notification_type="email",
+            recipient=to_email,
+            subject=subject,
+            message=message,
+            status=NotificationLog.STATUS_PENDING,
+            next_attempt_at=timezone.now(),
+        )
+
+    @staticmethod
+    def queue_sms_notification(to_phone, message, order=""):
+        """Record an SMS in the outbox; same rules as queue_email_notification."""
+        return NotificationLog.objects.create(
+            order=order,
+            notification_type="sms",
+            recipient=to_phone,
+            message=message,
+            status=NotificationLog.STATUS_PENDING,
+            next_attempt_at=timezone.now(),
+        )
+
     def log_notification(order, notification_type, recipient, message, status):
         # Create a log entry for the notification
         NotificationLog.objects.create(
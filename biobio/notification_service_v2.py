@@ -1,8 +1,10 @@
 # biobio/notification_service_v2.py
+from concurrent.futures import ThreadPoolExecutor
+
 from django.core.mail import send_mail
-from twilio.rest import Client
 from django.conf import settings
 from .models import NotificationLog
+from .notification_service import get_twilio_client
 
 
 class NotificationServiceV2:
@@ -47,8 +49,7 @@ class NotificationServiceV2:
     @staticmethod
     def send_sms_notification(to_phone, message, order_id=None):
         try:
-            client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
-            client.messages.create(
+            get_twilio_client().messages.create(
                 body=message,
                 from_=settings.TWILIO_PHONE_NUMBER,
                 to=to_phone,
@@ -78,6 +79,50 @@ class NotificationServiceV2:
                 pass
             return False
 
+    @staticmethod
+    def send_sms_many(recipients, message, order_id=None, max_concurrency=None):
+        """
+        Send the same SMS to many numbers concurrently over the shared Twilio
+        client, then record every outcome with a single bulk insert.
+        """
+        recipients = list(dict.fromkeys(recipients))
+
+        def send(to_phone):
+            try:
+                get_twilio_client().messages.create(
+                    body=message,
+                    from_=settings.TWILIO_PHONE_NUMBER,
+                    to=to_phone,
+                )
+                return "Success"
+            except Exception as e:
+                print(f"Error sending SMS: {e}")
+                return f"Failed: {str(e)}"[:50]
+
+        workers = min(
+            max_concurrency or settings.TWILIO_SMS_CONCURRENCY, len(recipients)
+        )
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            statuses = list(pool.map(send, recipients))
+
+        try:
+            NotificationLog.objects.bulk_create(
+                NotificationLog(
+                    order=order_id or "",
+                    notification_type="sms",
+                    recipient=to_phone,
+                    message=message,
+                    status=sms_status,
+                )
+                for to_phone, sms_status in zip(recipients, statuses)
+            )
+        except Exception:
+            pass
+        return {
+            to_phone: sms_status == "Success"
+            for to_phone, sms_status in zip(recipients, statuses)
+        }
+
     @staticmethod
     def notify_client(order, message):
         # Send both email and SMS notification
@@ -0,0 +1,16 @@
+# biobio/pagination.py
+from rest_framework.pagination import CursorPagination
+
+
+class OrderCursorPagination(CursorPagination):
+    """
+    Keyset pagination for order lists, newest first.
+
+    Pages are located by an opaque cursor on ``(order_date, id)`` instead of an
+    offset, so fetching page 1000 costs the same as fetching page 1.
+    """
+
+    ordering = ("-order_date", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
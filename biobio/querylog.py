@@ -0,0 +1,120 @@
+# biobio/querylog.py
+import json
+import logging
+import re
+import time
+import traceback
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+logger = logging.getLogger("biobio.queries")
+
+APP_DIR = Path(__file__).resolve().parent
+PLACEHOLDER_LIST = re.compile(r"%s(?:, %s)+")
+# Modules whose execute wrappers sit between the app code and the database
+WRAPPER_MODULES = {"querylog.py", "metrics.py"}
+
+
+def query_shape(sql):
+    """``sql`` with IN (...) lists collapsed, so every pass of a loop matches."""
+    return PLACEHOLDER_LIST.sub("%s, ...", sql)
+
+
+def query_origin():
+    """``file:line in function`` of the innermost app frame running a query."""
+    for frame in reversed(traceback.extract_stack()):
+        path = Path(frame.filename)
+        if path.is_relative_to(APP_DIR) and path.name not in WRAPPER_MODULES:
+            return f"{path.relative_to(APP_DIR.parent)}:{frame.lineno} in {frame.name}"
+    return None
+
+
+class QueryInspector:
+    """
+    Execute wrapper that finds slow queries and repeated query shapes.
+
+    A shape seen ``repeat_threshold`` times in one request is the signature
+    of an N+1: a query issued once per row instead of once per list. Use it
+    as a context manager around the code to inspect; ``log_findings()``
+    reports what it saw to the ``biobio.queries`` logger as JSON.
+    """
+
+    def __init__(self, view=None, slow_ms=None, repeat_threshold=None):
+        self.view = view
+        self.slow_ms = settings.SLOW_QUERY_MS if slow_ms is None else slow_ms
+        self.repeat_threshold = (
+            settings.REPEATED_QUERY_THRESHOLD
+            if repeat_threshold is None
+            else repeat_threshold
+        )
+        # shape -> [times run, where the second run came from]
+        self.shapes = {}
+        self.slow_queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            seen = self.shapes.setdefault(query_shape(sql), [0, None])
+            seen[0] += 1
+            if seen[0] == 2:
+                seen[1] = query_origin()
+            if duration_ms >= self.slow_ms:
+                self.slow_queries.append(
+                    {
+                        "sql": sql,
+                        "duration_ms": round(duration_ms, 1),
+                        "origin": query_origin(),
+                    }
+                )
+
+    def __enter__(self):
+        self.wrapper = connection.execute_wrapper(self)
+        self.wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wrapper.__exit__(*exc_info)
+
+    def repeated_queries(self):
+        return [
+            {"sql": shape, "count": count, "origin": origin}
+            for shape, (count, origin) in self.shapes.items()
+            if count >= self.repeat_threshold
+        ]
+
+    def log_findings(self):
+        for query in self.slow_queries:
+            self.report("slow_query", **query)
+        for query in self.repeated_queries():
+            self.report("repeated_query", **query)
+
+    def report(self, event, **fields):
+        logger.warning(json.dumps({"event": event, "view": self.view, **fields}))
+
+
+class QueryInspectorMiddleware:
+    """
+    Log slow queries and likely N+1 patterns per view (development/staging).
+
+    Enabled by QUERY_INSPECTOR=True; queries run while a streaming response
+    is consumed are not inspected.
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_INSPECTOR:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with QueryInspector() as inspector:
+            response = self.get_response(request)
+        match = request.resolver_match
+        inspector.view = match.view_name if match else "unresolved"
+        inspector.log_findings()
+        return response
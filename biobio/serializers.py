@@ -2,6 +2,8 @@
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from .models import UserProfile, Biodata, Order, CustomizationOption,Measurement
 from django.contrib.auth.hashers import make_password
+from django.db import models
+from .measurements import parse_measurement
 # from .models import UserValidation
 from rest_framework import serializers
 
@@ -51,11 +53,84 @@ class CustomizationOptionSerializer(serializers.ModelSerializer):
 
 class OrderSerializer(serializers.ModelSerializer):
     customization_options = CustomizationOptionSerializer(many=True, read_only=True)
+    # Clients are still sent and returned as usernames; views set it on create
+    client = serializers.SlugRelatedField(
+        slug_field='username', queryset=UserProfile.objects.all(), required=False
+    )
     class Meta:
         model = Order
         fields = '__all__'
 
+
+class SparseFieldsMixin:
+    """Render only the fields named in the request's ``?fields=a,b,c``."""
+
+    @classmethod
+    def requested_fields(cls, request):
+        names = set(cls.Meta.fields)
+        requested = request and request.query_params.get('fields')
+        if requested:
+            names &= {name.strip() for name in requested.split(',')}
+        return names
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        keep = self.requested_fields(self.context.get('request'))
+        for name in set(self.fields) - keep:
+            self.fields.pop(name)
+
+
+class OrderListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """
+    Summary of an order for list pages.
+
+    Leaves out the measurements and comments text, which only the detail
+    view shows; ``prepare_queryset`` loads just the columns being rendered.
+    """
+
+    customization_options = CustomizationOptionSerializer(many=True, read_only=True)
+    client = serializers.SlugRelatedField(slug_field='username', read_only=True)
+
+    class Meta:
+        model = Order
+        fields = [
+            'id', 'order_id', 'client', 'status', 'order_date', 'is_confirmed',
+            'confirmed_date', 'completed_date', 'expected_date', 'event_type',
+            'material', 'preferred_Color', 'updated_at', 'customization_options',
+        ]
+
+    @classmethod
+    def prepare_queryset(cls, queryset, request):
+        fields = cls.requested_fields(request)
+        # The cursor paginator reads id and order_date from every row
+        columns = {'id', 'order_date'} | (fields - {'client', 'customization_options'})
+        if 'client' in fields:
+            queryset = queryset.select_related('client')
+            columns |= {'client', 'client__username'}
+        if 'customization_options' in fields:
+            queryset = queryset.prefetch_related('customization_options')
+        return queryset.only(*columns)
+
+
+class MeasurementField(serializers.DecimalField):
+    """Decimal inches that also accepts legacy text such as "32in" or "81 cm"."""
+
+    def to_internal_value(self, data):
+        try:
+            data = parse_measurement(data)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+        if data is None:
+            return None
+        return super().to_internal_value(data)
+
+
 class MeasurementSerializer(serializers.ModelSerializer):
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.DecimalField: MeasurementField,
+    }
+
     class Meta:
         model = Measurement
         fields = '__all__'
@@ -0,0 +1,134 @@
+# biobio/services.py
+from django.db import transaction
+from django.utils import timezone
+
+from .email_templates import (
+    STATUS_UPDATE_COPY,
+    render_order_confirmation,
+    render_order_status_update,
+)
+from .models import Order, UserProfile
+from .notification_service import NotificationService
+
+# Fields a client may still change until the order is confirmed
+EDITABLE_ORDER_FIELDS = (
+    "measurements",
+    "expected_date",
+    "event_type",
+    "material",
+    "comments",
+    "preferred_Color",
+)
+
+
+class OrderLocked(Exception):
+    """The order's confirmation state does not allow this change."""
+
+
+class OutboxEmailNotifications:
+    """
+    Email the client through the outbox.
+
+    Emails are queued inside the transaction that changes the order, so they
+    exist only if it commits; the send_notifications worker delivers them.
+    """
+
+    def order_confirmed(self, order):
+        subject, body = render_order_confirmation(order, order.client)
+        self.queue(order, subject, body)
+
+    def order_status_changed(self, order, new_status):
+        email = render_order_status_update(order, order.client, new_status)
+        if email is not None:
+            self.queue(order, *email)
+
+    def queue(self, order, subject, body):
+        NotificationService.queue_email_notification(
+            to_email=order.client.email,
+            subject=subject,
+            message=body,
+            order=order.order_id,
+        )
+
+
+class OutboxSmsNotifications:
+    """Text the client through the outbox, the same way emails are queued."""
+
+    def order_confirmed(self, order):
+        self.queue(order, f"Your order {order.id} has been confirmed.")
+
+    def order_status_changed(self, order, new_status):
+        # Same wording as the status email's subject line
+        copy = STATUS_UPDATE_COPY.get(new_status)
+        if copy is not None:
+            self.queue(order, copy["subject"].format(order_id=order.order_id))
+
+    def queue(self, order, message):
+        NotificationService.queue_sms_notification(
+            to_phone=order.client.phonenumber, message=message, order=order.order_id
+        )
+
+
+def get_profile(username):
+    """The profile for ``username``; raises UserProfile.DoesNotExist."""
+    return UserProfile.objects.get(username=username)
+
+
+def profile_version(username):
+    """``(id, updated_at)`` of a profile, enough to revalidate a cached copy."""
+    return UserProfile.objects.values_list("id", "updated_at").get(username=username)
+
+
+def create_order(serializer, username):
+    """Save a validated OrderSerializer as a new order for ``username``."""
+    return serializer.save(client=get_profile(username))
+
+
+def confirm_order(order_id, notifications):
+    order = Order.objects.select_related("client").get(id=order_id)
+    order.is_confirmed = True
+    order.confirmed_date = timezone.now()
+    with transaction.atomic():
+        order.save()
+        if order.client is None:
+            print(f"User profile not found for order: {order.order_id}")
+        else:
+            notifications.order_confirmed(order)
+    return order
+
+
+def update_order(order_id, data):
+    """Apply the EDITABLE_ORDER_FIELDS present in ``data`` to an unconfirmed order."""
+    order = Order.objects.get(id=order_id)
+    if order.is_confirmed:
+        raise OrderLocked("Cannot modify a confirmed order.")
+    for field in EDITABLE_ORDER_FIELDS:
+        setattr(order, field, data.get(field, getattr(order, field)))
+    order.save()
+    return order
+
+
+def update_order_status(order_id, new_status, notifications):
+    """Move a confirmed order to ``new_status`` (None keeps the current one)."""
+    order = Order.objects.select_related("client").get(id=order_id)
+    if not order.is_confirmed:
+        raise OrderLocked("Cannot modify order unless it is confirmed.")
+    if new_status is None:
+        new_status = order.status
+    order.status = new_status
+    if new_status == "Completed" and not order.completed_date:
+        order.completed_date = timezone.now()
+    with transaction.atomic():
+        order.save()
+        if order.client is None:
+            print(f"User profile not found for order: {order.order_id}")
+        else:
+            notifications.order_status_changed(order, new_status)
+    return order
+
+
+def delete_order(order_id):
+    order = Order.objects.get(id=order_id)
+    if order.is_confirmed:
+        raise OrderLocked("Cannot delete a confirmed order.")
+    order.delete()
@@ -0,0 +1,68 @@
+# biobio/streaming.py
+from itertools import islice
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+EXPORT_CONTENT_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _chunks(queryset, serializer, chunk_size):
+    """Rendered rows, ``chunk_size`` at a time, read through a DB cursor."""
+    rows = queryset.iterator(chunk_size=chunk_size)
+    while batch := list(islice(rows, chunk_size)):
+        yield serializer.to_representation(batch)
+
+
+def _json_array(chunks):
+    renderer = JSONRenderer()
+    yield b"["
+    separator = b""
+    for chunk in chunks:
+        # Rendered as one list so the output matches the API byte for byte
+        yield separator + renderer.render(chunk)[1:-1]
+        separator = b","
+    yield b"]"
+
+
+def _ndjson(chunks):
+    renderer = JSONRenderer()
+    for chunk in chunks:
+        yield b"".join(renderer.render(item) + b"\n" for item in chunk)
+
+
+def export_response(request, queryset, serializer_class, filename):
+    """
+    Stream every row of ``queryset`` as a JSON array or NDJSON download.
+
+    ``request.query_params["export"]`` picks the format. Rows are read in
+    EXPORT_CHUNK_SIZE batches and rendered with ``serializer_class`` (a
+    ValuesSerializer), so memory stays flat however large the table is.
+    """
+    export_format = request.query_params.get("export")
+    if export_format not in EXPORT_CONTENT_TYPES:
+        return Response(
+            {"error": f"export must be one of {', '.join(EXPORT_CONTENT_TYPES)}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    serializer = serializer_class(many=True, context={"request": request})
+    chunks = _chunks(
+        serializer_class.prepare_queryset(queryset, request),
+        serializer,
+        settings.EXPORT_CHUNK_SIZE,
+    )
+    stream = _json_array(chunks) if export_format == "json" else _ndjson(chunks)
+    response = StreamingHttpResponse(
+        stream, content_type=EXPORT_CONTENT_TYPES[export_format]
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{filename}.{export_format}"'
+    )
+    return response
@@ -1,3 +1,1740 @@
-from django.test import TestCase
+import csv
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from importlib import import_module
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import NoReverseMatch, include, path, reverse
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from . import notification_service, views, views_v2
+from .checks import check_notification_settings
+from .dashboard import compute_dashboard_counts
+from .email_templates import (
+    EmailTemplate,
+    render_order_confirmation,
+    render_order_status_update,
+    render_password_reset,
+)
+from .hashers import ScryptPasswordHasher
+from .models import (
+    CustomizationOption,
+    Measurement,
+    NotificationLog,
+    Order,
+    OrderSequence,
+    PasswordResetToken,
+    UserProfile,
+)
+from .measurements import PercentileCont, parse_measurement
+from .metrics import RequestMetricsMiddleware, request_metrics
+from .querylog import QueryInspector, QueryInspectorMiddleware
+from .notification_service import NotificationService
+from .notification_service_v2 import NotificationServiceV2
+from .pagination import OrderCursorPagination
+from .serializers import OrderListSerializer
+from .views import ADMIN_ORDER_FILTERS
+
+
+def make_profile(username, **extra):
+    fields = {
+        "password": "unused",
+        "role": "client",
+        "firstname": username.title(),
+        "lastname": "Client",
+        "phonenumber": "0000000000",
+        "email": f"{username}@example.com",
+    }
+    fields.update(extra)
+    return UserProfile.objects.create(username=username, **fields)
+
+
+class OrderIdAllocationTests(TestCase):
+    def test_order_ids_are_sequential_per_day(self):
+        prefix = datetime.now().strftime("JFK%d%m%Y")
+        first = Order.objects.create()
+        second = Order.objects.create()
+
+        self.assertEqual(first.order_id, f"{prefix}0001")
+        self.assertEqual(second.order_id, f"{prefix}0002")
+
+    def test_allocation_uses_a_single_query(self):
+        with self.assertNumQueries(1):
+            OrderSequence.next_value("JFK01012030")
+
+    def test_explicit_order_id_is_kept(self):
+        order = Order.objects.create(order_id="JFK010120300042")
+        self.assertEqual(order.order_id, "JFK010120300042")
+        self.assertFalse(OrderSequence.objects.exists())
+
+
+class OrderIdConcurrencyTests(TransactionTestCase):
+    threads = 8
+    orders_per_thread = 25
+
+    def test_concurrent_creates_never_collide(self):
+        errors = []
+        barrier = threading.Barrier(self.threads)
+
+        def worker():
+            try:
+                barrier.wait()
+                for _ in range(self.orders_per_thread):
+                    Order.objects.create()
+            except Exception as e:  # surfaced through the assertion below
+                errors.append(e)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker) for _ in range(self.threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        total = self.threads * self.orders_per_thread
+        order_ids = list(Order.objects.values_list("order_id", flat=True))
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(order_ids), total)
+        self.assertEqual(len(set(order_ids)), total)
+
+
+class AdminDashboardTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.alice = make_profile("alice")
+        Order.objects.create(client=self.alice)
+        Order.objects.create(client=self.alice, is_confirmed=True, status="fitting")
+        Order.objects.create(client=self.alice, is_confirmed=True, status="Completed")
+
+    def test_counts_match_per_status_filters(self):
+        response = self.client.get(reverse("admin-dashboard"))
+
+        self.assertEqual(
+            response.json(),
+            {
+                "total_clients": 1,
+                "total_orders": 3,
+                "pending_orders": 0,
+                "in_progress_orders": 0,
+                "fitting_orders": 1,
+                "completed_orders": 1,
+                "unconfirmed_orders": 1,
+            },
+        )
+
+    def test_orders_aggregate_plus_client_count_is_two_queries(self):
+        with self.assertNumQueries(2):
+            compute_dashboard_counts()
+
+    def test_snapshot_is_served_from_cache_until_an_order_changes(self):
+        url = reverse("admin-dashboard")
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Order.objects.create(client=self.alice)
+        self.assertEqual(self.client.get(url).json()["total_orders"], 4)
+
+
+class OrderListPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        alice = make_profile("alice")
+        self.bob = make_profile("bob")
+        for _ in range(5):
+            Order.objects.create(client=alice, is_confirmed=True)
+        Order.objects.create(client=self.bob)
+
+    def collect(self, url, params):
+        ids = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            ids.extend(order["id"] for order in body["results"])
+            if not body["next"]:
+                return ids
+            response = self.client.get(body["next"])
+
+    def test_admin_list_walks_every_order_newest_first(self):
+        ids = self.collect(reverse("admin-orders"), {"type": "all", "page_size": 2})
+        expected = list(
+            Order.objects.order_by("-order_date", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(ids, expected)
+
+    def test_admin_list_applies_type_filter(self):
+        ids = self.collect(reverse("admin-orders"), {"type": "unconfirmed"})
+        self.assertEqual(
+            ids,
+            list(Order.objects.filter(client=self.bob).values_list("id", flat=True)),
+        )
+
+    def test_admin_list_rejects_unknown_type(self):
+        response = self.client.get(reverse("admin-orders"), {"type": "archived"})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"error": "Type not found."})
+
+    def test_page_size_is_capped(self):
+        response = self.client.get(
+            reverse("admin-orders"), {"type": "all", "page_size": 10_000}
+        )
+        self.assertEqual(len(response.json()["results"]), 6)
+        self.assertEqual(OrderCursorPagination.max_page_size, 200)
+
+    def test_client_list_accepts_query_or_path_username(self):
+        by_query = self.collect(
+            reverse("order-list"), {"username": "alice", "page_size": 2}
+        )
+        by_path = self.collect(reverse("order-list-username", args=["alice"]), {})
+        self.assertEqual(len(by_query), 5)
+        self.assertEqual(by_query, by_path)
+
+
+class OrderClientRelationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.alice = make_profile("alice")
+
+    def test_create_accepts_username_and_returns_it(self):
+        response = self.client.post(
+            reverse("order-create"), {"username": "alice", "event_type": "Wedding"}
+        )
+
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response.json()["client"], "alice")
+        self.assertEqual(Order.objects.get().client, self.alice)
+
+    def test_confirm_reads_order_and_client_in_one_query(self):
+        order = Order.objects.create(client=self.alice)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(reverse("confirm-order", args=[order.id]))
+
+        selects = [q["sql"] for q in queries if q["sql"].startswith("SELECT")]
+        self.assertEqual(len(selects), 1, selects)
+        self.assertEqual(NotificationLog.objects.get().recipient, "alice@example.com")
+
+    def test_orders_outlive_a_deleted_profile(self):
+        order = Order.objects.create(client=self.alice)
+        self.alice.delete()
+
+        order.refresh_from_db()
+        self.assertIsNone(order.client)
+
+    def test_client_list_without_username_is_empty(self):
+        Order.objects.create(client=self.alice)
+        Order.objects.create(client=None)  # e.g. its profile was deleted
+
+        response = self.client.get(reverse("order-list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"], [])
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.alice = make_profile("alice")
+        self.order = Order.objects.create(client=self.alice)
+        Measurement.objects.create(username="alice", chest=40)
+
+    def assertRevalidates(self, url, params=None):
+        first = self.client.get(url, params)
+        self.assertEqual(first.status_code, 200, first.content)
+        self.assertIn("no-cache", first["Cache-Control"])
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, params, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        # A client without the validator is served the cached payload
+        with self.assertNumQueries(1):
+            response = self.client.get(url, params)
+        self.assertEqual(response.json(), first.json())
+        return first["ETag"]
+
+    def test_detail_and_list_views_answer_304(self):
+        for url, params in (
+            (reverse("order-details", args=[self.order.id]), None),
+            (reverse("order-list-username", args=["alice"]), None),
+            (reverse("user-profile-detail", args=["alice"]), None),
+            (reverse("measurement-detail"), {"username": "alice"}),
+        ):
+            with self.subTest(url=url):
+                self.assertRevalidates(url, params)
+
+    def test_changes_produce_a_new_etag(self):
+        detail = reverse("order-details", args=[self.order.id])
+        listing = reverse("order-list-username", args=["alice"])
+        detail_etag = self.assertRevalidates(detail)
+        list_etag = self.assertRevalidates(listing)
+
+        self.order.event_type = "Wedding"
+        self.order.save()
+        Order.objects.create(client=self.alice)
+
+        response = self.client.get(detail, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["event_type"], "Wedding")
+        response = self.client.get(listing, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    def test_changing_customization_options_changes_the_order_etags(self):
+        option = CustomizationOption.objects.create(name="Lapel")
+        detail = reverse("order-details", args=[self.order.id])
+        listing = reverse("order-list-username", args=["alice"])
+
+        def rename():
+            option.name = "Peak lapel"
+            option.save()
+
+        changes = (
+            (lambda: self.order.customization_options.add(option), ["Lapel"]),
+            (rename, ["Peak lapel"]),
+            (option.order_set.clear, []),
+            (lambda: option.order_set.add(self.order), ["Peak lapel"]),
+            (lambda: self.order.customization_options.remove(option), []),
+        )
+        for change, expected in changes:
+            detail_etag = self.assertRevalidates(detail)
+            list_etag = self.assertRevalidates(listing)
+            change()
+
+            with self.subTest(expected=expected):
+                response = self.client.get(detail, HTTP_IF_NONE_MATCH=detail_etag)
+                options = response.json()["customization_options"]
+                self.assertEqual([option["name"] for option in options], expected)
+                response = self.client.get(listing, HTTP_IF_NONE_MATCH=list_etag)
+                options = response.json()["results"][0]["customization_options"]
+                self.assertEqual([option["name"] for option in options], expected)
+
+    def test_deleting_an_option_changes_the_order_etag(self):
+        option = CustomizationOption.objects.create(name="Lapel")
+        self.order.customization_options.add(option)
+        url = reverse("order-details", args=[self.order.id])
+        etag = self.assertRevalidates(url)
+
+        option.delete()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.json()["customization_options"], [])
+
+    @override_settings(ALLOWED_HOSTS=["a.example.com", "b.example.com"])
+    def test_payloads_are_not_shared_between_hosts(self):
+        url = reverse("order-list-username", args=["alice"])
+        first = self.client.get(url, HTTP_HOST="a.example.com")
+        second = self.client.get(url, HTTP_HOST="b.example.com")
+        self.assertNotEqual(first["ETag"], second["ETag"])
+
+    def test_renaming_the_client_changes_the_order_etag(self):
+        url = reverse("order-details", args=[self.order.id])
+        etag = self.assertRevalidates(url)
+
+        self.alice.username = "alice2"
+        self.alice.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.json()["client"], "alice2")
+
+
+class OrderListFieldsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        alice = make_profile("alice")
+        self.order = Order.objects.create(
+            client=alice, measurements="chest 40", comments="rush job"
+        )
+        self.order.customization_options.add(
+            CustomizationOption.objects.create(name="Lapel")
+        )
+
+    def test_list_leaves_out_text_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin-orders"), {"type": "all"})
+
+        order = response.json()["results"][0]
+        self.assertEqual(order["client"], "alice")
+        self.assertEqual(order["customization_options"][0]["name"], "Lapel")
+        self.assertNotIn("measurements", order)
+        self.assertNotIn("comments", order)
+        self.assertNotIn('"measurements"', queries[0]["sql"])
+
+        detail = self.client.get(reverse("order-details", args=[self.order.id]))
+        self.assertEqual(detail.json()["measurements"], "chest 40")
+
+    def test_sparse_fields_skip_joins_and_prefetches(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("admin-orders"), {"type": "all", "fields": "id,status,bogus"}
+            )
+
+        self.assertEqual(
+            response.json()["results"], [{"id": self.order.id, "status": "Pending"}]
+        )
+
+
+class FastReadSerializerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        alice = make_profile("alice", gender="F", bio="Prefers linen")
+        make_profile("bob")
+        lapel, pocket = (
+            CustomizationOption.objects.create(name="Lapel", description="Notch"),
+            CustomizationOption.objects.create(name="Pocket"),
+        )
+        for index in range(5):
+            order = Order.objects.create(
+                client=alice if index % 2 else None,
+                status="Completed" if index == 3 else "Pending",
+                is_confirmed=index > 0,
+                confirmed_date=timezone.now() if index else None,
+                expected_date=timezone.localdate() if index == 2 else None,
+                preferred_Color="Navy",
+            )
+            order.customization_options.add(*[lapel, pocket][: index % 3])
+
+    def assertSameResponses(self, url, params=None):
+        responses = []
+        for fast in (False, True):
+            cache.clear()
+            with override_settings(FAST_READ_SERIALIZERS=fast):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url, params)
+            responses.append((response.status_code, response.content, len(queries)))
+        self.assertEqual(responses[0][0], 200)
+        self.assertEqual(responses[0], responses[1])
+
+    def test_user_profile_list_matches(self):
+        self.assertSameResponses(reverse("biodata-list"))
+
+    def test_order_lists_match(self):
+        for order_type in ("all", "unconfirmed", "pending", "completed"):
+            with self.subTest(order_type=order_type):
+                self.assertSameResponses(reverse("admin-orders"), {"type": order_type})
+        self.assertSameResponses(reverse("order-list"), {"username": "alice"})
+
+    def test_sparse_fields_and_later_pages_match(self):
+        self.assertSameResponses(
+            reverse("admin-orders"),
+            {"type": "all", "fields": "id,client,expected_date,customization_options"},
+        )
+        with override_settings(FAST_READ_SERIALIZERS=True):
+            first = self.client.get(
+                reverse("admin-orders"), {"type": "all", "page_size": 2}
+            ).json()
+        self.assertSameResponses(first["next"])
+
+
+class StreamingExportTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        alice = make_profile("alice")
+        make_profile("bob")
+        lapel = CustomizationOption.objects.create(name="Lapel")
+        for index in range(5):
+            order = Order.objects.create(client=alice, is_confirmed=index % 2 == 0)
+            if index % 2:
+                order.customization_options.add(lapel)
+
+    def export(self, url, params):
+        response = self.client.get(url, params)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content)
+
+    @override_settings(EXPORT_CHUNK_SIZE=2)
+    def test_json_export_matches_the_api_rendering(self):
+        request = Request(APIRequestFactory().get("/"))
+        orders = Order.objects.order_by("-order_date", "-id")
+        expected = JSONRenderer().render(
+            OrderListSerializer(
+                OrderListSerializer.prepare_queryset(orders, request),
+                many=True,
+                context={"request": request},
+            ).data
+        )
+
+        # One cursor over the orders, plus one options query per chunk of two
+        with self.assertNumQueries(4):
+            response, content = self.export(
+                reverse("admin-orders"), {"type": "all", "export": "json"}
+            )
+
+        self.assertEqual(content, expected)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertIn('filename="orders-all.json"', response["Content-Disposition"])
+
+    def test_ndjson_export(self):
+        response, content = self.export(
+            reverse("biodata-list"), {"export": "ndjson", "fields": "ignored"}
+        )
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual([row["username"] for row in rows], ["alice", "bob"])
+        self.assertNotIn("password", rows[0])
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        _, content = self.export(
+            reverse("admin-orders"),
+            {"type": "unconfirmed", "export": "ndjson", "fields": "id"},
+        )
+        self.assertEqual(len(content.splitlines()), 2)
+        self.assertEqual(list(json.loads(content.splitlines()[0])), ["id"])
+
+    def test_unknown_export_format(self):
+        response = self.client.get(reverse("biodata-list"), {"export": "xml"})
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(EXPORT_CHUNK_SIZE=50)
+    def test_peak_memory_does_not_grow_with_rows(self):
+        client = UserProfile.objects.get(username="alice")
+
+        def add_orders(count):
+            start = Order.objects.count()
+            Order.objects.bulk_create(
+                Order(order_id=f"BULK{i:08d}", client=client)
+                for i in range(start, start + count)
+            )
+
+        def peak_while_streaming():
+            response = self.client.get(
+                reverse("admin-orders"), {"type": "all", "export": "ndjson"}
+            )
+            tracemalloc.start()
+            try:
+                rows = size = 0
+                for chunk in response.streaming_content:
+                    rows += chunk.count(b"\n")
+                    size += len(chunk)
+                return rows, size, tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        add_orders(1000)
+        peak_while_streaming()  # warm up lazily built serializer state
+        rows, _, peak = peak_while_streaming()
+        add_orders(3000)
+        more_rows, size, later_peak = peak_while_streaming()
+
+        self.assertEqual((rows, more_rows), (1005, 4005))
+        self.assertLess(later_peak, peak * 1.5)
+        self.assertLess(later_peak * 2, size)
+
+
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        request_metrics.reset()
+        self.client = APIClient()
+
+    def test_server_timing_header(self):
+        make_profile("alice")
+
+        response = self.client.get(reverse("biodata-list"))
+
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^app;dur=[\d.]+, db;dur=[\d.]+;desc="1 queries"$',
+        )
+
+    def test_metrics_are_aggregated_per_view(self):
+        for _ in range(2):
+            self.client.get(reverse("admin-dashboard"))
+        self.client.get(reverse("admin-orders"), {"type": "bogus"})
+
+        metrics = request_metrics.render()
+
+        labels = 'view="admin-dashboard",method="GET"'
+        self.assertIn(
+            'biobio_requests_total{view="admin-dashboard",method="GET",status="200"} 2',
+            metrics,
+        )
+        self.assertIn(
+            'biobio_requests_total{view="admin-orders",method="GET",status="404"} 1',
+            metrics,
+        )
+        self.assertIn(f"biobio_request_duration_seconds_count{{{labels}}} 2", metrics)
+        # Two count queries on the first request, none once the counts are cached
+        self.assertIn(f'biobio_request_db_queries_bucket{{{labels},le="0"}} 1', metrics)
+        self.assertIn(f"biobio_request_db_queries_sum{{{labels}}} 2", metrics)
+        self.assertIn(
+            f'biobio_response_size_bytes_bucket{{{labels},le="+Inf"}} 2', metrics
+        )
+
+    def test_metrics_endpoint_is_admin_only(self):
+        self.assertEqual(self.client.get(reverse("admin-metrics")).status_code, 401)
+
+        self.client.force_authenticate(
+            User.objects.create_user("ops", password="unused", is_staff=True)
+        )
+        response = self.client.get(reverse("admin-metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertIn(
+            "# TYPE biobio_request_duration_seconds histogram",
+            response.content.decode(),
+        )
+
+    @override_settings(REQUEST_METRICS=False)
+    def test_can_be_switched_off(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            RequestMetricsMiddleware(lambda request: None)
+
+
+class QueryInspectorTests(TestCase):
+    def test_flags_repeated_shapes_and_slow_queries(self):
+        profiles = [make_profile(f"client{i}") for i in range(3)]
+        for profile in profiles:
+            Order.objects.create(client=profile)
+
+        with QueryInspector(slow_ms=0, repeat_threshold=3) as inspector:
+            for order in Order.objects.all():
+                order.client.username
+            UserProfile.objects.filter(username__in=["a", "b"]).count()
+            UserProfile.objects.filter(username__in=["a"]).count()
+
+        repeated = inspector.repeated_queries()
+        self.assertEqual(len(repeated), 1)
+        self.assertEqual(repeated[0]["count"], 3)
+        self.assertIn('FROM "biobio_userprofile"', repeated[0]["sql"])
+        self.assertRegex(repeated[0]["origin"], r"^biobio/tests\.py:\d+ in test_")
+        # IN lists of different lengths share a shape but ran only twice
+        self.assertEqual(len(inspector.slow_queries), 6)
+
+        with self.assertLogs("biobio.queries", "WARNING") as logs:
+            inspector.view = "example"
+            inspector.log_findings()
+        event = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(
+            (event["event"], event["view"], event["count"]),
+            ("repeated_query", "example", 3),
+        )
+
+    @override_settings(QUERY_INSPECTOR=True, SLOW_QUERY_MS=0)
+    def test_middleware_logs_findings_with_the_view(self):
+        make_profile("alice")
+
+        with self.assertLogs("biobio.queries", "WARNING") as logs:
+            APIClient().get(reverse("user-profile-detail", args=["alice"]))
+
+        event = json.loads(logs.records[0].getMessage())
+        self.assertEqual(event["event"], "slow_query")
+        self.assertEqual(event["view"], "user-profile-detail")
+        self.assertRegex(
+            event["origin"], r"^biobio/services\.py:\d+ in profile_version$"
+        )
+
+    @override_settings(QUERY_INSPECTOR=False)
+    def test_middleware_can_be_switched_off(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            QueryInspectorMiddleware(lambda request: None)
+
+
+@override_settings(RESEND_API_KEY="test")
+@mock.patch("resend.Batch.send")
+class NPlusOneTests(TestCase):
+    """
+    Drive every read and bulk endpoint over several rows and fail on any
+    query shape that views.py runs once per row.
+
+    Add an entry to KNOWN_REPEATED_QUERIES only for a repeat that is
+    intended, never to silence a new N+1.
+    """
+
+    # (view name, query origin) pairs allowed to repeat
+    KNOWN_REPEATED_QUERIES = set()
+    rows = 4
+
+    def setUp(self):
+        # Configure resend from the test key, not whatever ran first
+        patcher = mock.patch.object(notification_service, "_resend", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache.clear()
+        self.client = APIClient()
+        options = [
+            CustomizationOption.objects.create(name=f"Option {i}") for i in range(2)
+        ]
+        self.usernames = []
+        for index in range(self.rows):
+            profile = make_profile(f"client{index}")
+            self.usernames.append(profile.username)
+            Measurement.objects.create(username=profile.username, chest=Decimal("40"))
+            for status in ("Pending", "Completed"):
+                order = Order.objects.create(
+                    client=profile, status=status, is_confirmed=True
+                )
+                order.customization_options.add(*options)
+        self.order = Order.objects.first()
+
+    def requests(self):
+        yield "get", reverse("biodata-list"), {}
+        yield "get", reverse("biodata-list"), {"export": "ndjson"}
+        yield "get", reverse("order-list"), {"username": "client0"}
+        yield "get", reverse("order-list-username", args=["client0"]), {}
+        for order_type in ADMIN_ORDER_FILTERS:
+            yield "get", reverse("admin-orders"), {"type": order_type}
+        yield "get", reverse("admin-orders"), {"type": "all", "export": "json"}
+        yield "get", reverse("admin-dashboard"), {}
+        yield "get", reverse("admin-measurement-analytics"), {}
+        yield "get", reverse("user-profile-detail", args=["client0"]), {}
+        yield "get", reverse("order-details", args=[self.order.id]), {}
+        yield "get", reverse("measurement-detail"), {"username": "client0"}
+        yield "post", reverse("confirm-order", args=[self.order.id]), {}
+        yield "put", reverse("update-status", args=[self.order.id]), {
+            "status": "Completed"
+        }
+        yield "post", reverse("notifications"), {
+            "usernames": self.usernames,
+            "subject": "Hello",
+            "message": "<p>Hi</p>",
+        }
+
+    def test_views_do_not_query_per_row(self, batch_send):
+        found = []
+        for method, url, data in self.requests():
+            with QueryInspector(repeat_threshold=self.rows) as inspector:
+                response = getattr(self.client, method)(
+                    url, data, format="json" if method != "get" else None
+                )
+                if response.streaming:
+                    b"".join(response.streaming_content)
+            self.assertLess(response.status_code, 400, url)
+            view = response.resolver_match.view_name
+            found += [
+                f"{view}: {query['count']}x at {query['origin']}\n  {query['sql']}"
+                for query in inspector.repeated_queries()
+                if (view, query["origin"]) not in self.KNOWN_REPEATED_QUERIES
+            ]
+        self.assertEqual(found, [], "\n".join(found))
+
+
+class ListQueryCountMixin:
+    """
+    Reusable check that a list view's query count does not grow with its rows.
+
+    ``seed(n)`` must add ``n`` more rows the view will return. The view is
+    called directly, without going through a URLconf.
+    """
+
+    def assertListQueriesConstant(
+        self, view_class, seed, params=None, view_kwargs=None, sizes=(2, 12)
+    ):
+        view = view_class.as_view()
+        factory = APIRequestFactory()
+        counts, seeded = [], 0
+        for size in sizes:
+            seed(size - seeded)
+            seeded = size
+            request = factory.get("/", params or {})
+            with CaptureQueriesContext(connection) as queries:
+                response = view(request, **(view_kwargs or {}))
+                response.render()
+            self.assertEqual(response.status_code, 200, response.content)
+            counts.append(len(queries))
+        self.assertEqual(
+            len(set(counts)),
+            1,
+            f"{view_class.__module__}.{view_class.__name__} ran {counts} queries "
+            f"for {list(sizes)} rows",
+        )
+
+
+class ListViewQueryCountTests(ListQueryCountMixin, TestCase):
+    def setUp(self):
+        self.alice = make_profile("alice")
+        self.options = [
+            CustomizationOption.objects.create(name=name) for name in ("Lapel", "Cuff")
+        ]
+        self.profiles = 0
+
+    def seed_orders(self, count, **fields):
+        for _ in range(count):
+            order = Order.objects.create(client=self.alice, **fields)
+            order.customization_options.set(self.options)
+
+    def seed_profiles(self, count):
+        for _ in range(count):
+            self.profiles += 1
+            make_profile(f"user{self.profiles}")
+
+    def test_admin_order_list(self):
+        for order_type in views.ADMIN_ORDER_FILTERS:
+            with self.subTest(type=order_type):
+                Order.objects.all().delete()
+                self.assertListQueriesConstant(
+                    views.AdminOrderListView,
+                    lambda n: self.seed_orders(
+                        n, is_confirmed=order_type != "unconfirmed"
+                    ),
+                    params={"type": order_type},
+                )
+
+    def test_client_order_list(self):
+        self.assertListQueriesConstant(
+            views.OrderListView, self.seed_orders, params={"username": "alice"}
+        )
+
+    def test_user_profile_lists(self):
+        for view_class in (views.UserProfileListView, views_v2.UserProfileListView):
+            with self.subTest(view=view_class.__module__):
+                self.assertListQueriesConstant(view_class, self.seed_profiles)
+
+
+class QueryPlanTests(TestCase):
+    """
+    EXPLAIN every hot-path query on a seeded dataset and fail on full table scans.
+
+    Postgres prefers a sequential scan on small tables whatever the indexes,
+    so it is switched off there; a scan that still shows up has no usable index.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cache.clear()
+        profiles = [make_profile(f"client{i}") for i in range(20)]
+        statuses = [choice for choice, _ in Order.STATUS_CHOICES]
+        Order.objects.bulk_create(
+            Order(
+                order_id=f"JFK{i:08d}",
+                client=profiles[i % 20],
+                status=statuses[i % len(statuses)],
+                is_confirmed=i % 3 != 0,
+            )
+            for i in range(400)
+        )
+        NotificationLog.objects.bulk_create(
+            NotificationLog(
+                order=f"JFK{i:08d}",
+                notification_type="email",
+                message="",
+                recipient="client@example.com",
+                status="Success" if i % 4 else NotificationLog.STATUS_PENDING,
+                next_attempt_at=timezone.now(),
+            )
+            for i in range(400)
+        )
+        PasswordResetToken.objects.bulk_create(
+            PasswordResetToken(
+                user=profiles[i % 20],
+                token=f"token-{i}",
+                expires_at=timezone.now() + timedelta(hours=1 if i % 2 else -1),
+                used=i % 5 == 0,
+            )
+            for i in range(200)
+        )
+
+    def full_scans(self, sql):
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute(f"EXPLAIN {sql}")
+                plan = [row[0] for row in cursor.fetchall()]
+            return [line.strip() for line in plan if "Seq Scan" in line]
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            plan = [row[-1] for row in cursor.fetchall()]
+        return [line for line in plan if re.fullmatch(r"SCAN \S+", line)]
+
+    def assertNoFullScans(self, run):
+        with CaptureQueriesContext(connection) as queries:
+            run()
+        selects = [q["sql"] for q in queries if q["sql"].startswith("SELECT")]
+        self.assertTrue(selects)
+        for sql in selects:
+            self.assertEqual(self.full_scans(sql), [], sql)
+
+    def get_view(self, view_class, params=None, **kwargs):
+        request = APIRequestFactory().get("/", params or {})
+        response = view_class.as_view()(request, **kwargs)
+        response.render()
+        self.assertEqual(response.status_code, 200, response.content)
+
+    def test_order_lists(self):
+        self.assertNoFullScans(
+            lambda: self.get_view(views.OrderListView, {"username": "client3"})
+        )
+        for order_type in views.ADMIN_ORDER_FILTERS:
+            with self.subTest(type=order_type):
+                self.assertNoFullScans(
+                    lambda: self.get_view(
+                        views.AdminOrderListView, {"type": order_type}
+                    )
+                )
+
+    def test_dashboard_counts(self):
+        self.assertNoFullScans(compute_dashboard_counts)
+
+    def test_notification_lookups(self):
+        self.assertNoFullScans(
+            lambda: list(
+                NotificationLog.objects.filter(order="JFK00000007").order_by(
+                    "-timestamp"
+                )
+            )
+        )
+        self.assertNoFullScans(
+            lambda: list(
+                NotificationLog.objects.filter(
+                    timestamp__gte=timezone.now() - timedelta(days=1)
+                )
+            )
+        )
+        self.assertNoFullScans(
+            lambda: list(
+                NotificationLog.objects.filter(
+                    status=NotificationLog.STATUS_PENDING,
+                    next_attempt_at__lte=timezone.now(),
+                ).order_by("next_attempt_at")[:50]
+            )
+        )
+
+    def test_reset_token_lookups(self):
+        profile = UserProfile.objects.get(username="client3")
+        self.assertNoFullScans(
+            lambda: PasswordResetToken.objects.filter(
+                token="token-3", used=False, expires_at__gte=timezone.now()
+            )
+            .select_related("user")
+            .first()
+        )
+        self.assertNoFullScans(
+            lambda: list(PasswordResetToken.objects.filter(user=profile, used=False))
+        )
+        self.assertNoFullScans(
+            lambda: list(
+                PasswordResetToken.objects.filter(
+                    used=False, expires_at__lt=timezone.now()
+                )
+            )
+        )
+
+
+class MeasurementTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_parser_accepts_legacy_units(self):
+        cases = {
+            "32": Decimal("32.00"),
+            "32in": Decimal("32.00"),
+            '15.5"': Decimal("15.50"),
+            "81 cm": Decimal("31.89"),
+            "40,5 inches": Decimal("40.50"),
+            "": None,
+            None: None,
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(parse_measurement(raw), expected)
+        with self.assertRaises(ValueError):
+            parse_measurement("about 32")
+
+    def test_api_stores_inches(self):
+        make_profile("alice")
+        response = self.client.post(
+            reverse("measurement-create"),
+            {"username": "alice", "chest": "96.5 cm", "neck": "15in", "waist": ""},
+        )
+
+        self.assertEqual(response.status_code, 201, response.content)
+        measurement = Measurement.objects.get()
+        self.assertEqual(measurement.chest, Decimal("37.99"))
+        self.assertEqual(measurement.neck, Decimal("15.00"))
+        self.assertIsNone(measurement.waist)
+
+        response = self.client.post(
+            reverse("measurement-create"), {"username": "alice", "chest": "big"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_analytics_reports_distribution_in_two_queries(self):
+        Measurement.objects.bulk_create(
+            Measurement(username=f"client{i}", chest=30 + i, neck=None if i else 15)
+            for i in range(11)
+        )
+
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse("admin-measurement-analytics"), {"percentiles": "10,50,90"}
+            )
+
+        chest = response.json()["fields"]["chest"]
+        self.assertEqual(chest["count"], 11)
+        self.assertEqual((chest["min"], chest["mean"], chest["max"]), (30, 35, 40))
+        self.assertEqual(chest["stddev"], 3.16)
+        self.assertEqual(chest["percentiles"], {"p10": 31, "p50": 35, "p90": 39})
+        neck = response.json()["fields"]["neck"]
+        self.assertEqual(neck["count"], 1)
+        self.assertEqual(neck["percentiles"]["p50"], 15)
+
+    def test_migration_clears_values_the_decimal_columns_cannot_hold(self):
+        migration = import_module("biobio.migrations.0006_measurement_decimals")
+        cases = {
+            "32in": "32.00",
+            "9999.99": "9999.99",
+            "10000": None,
+            "254000 mm": None,
+            "about 32": None,
+            "": None,
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(migration.normalize(raw), expected)
+
+    def test_postgres_percentiles_are_ordered_set_aggregates(self):
+        query = Measurement.objects.values("username").annotate(
+            p10=PercentileCont("chest", 10)
+        )
+        self.assertIn(
+            'PERCENTILE_CONT(0.1) WITHIN GROUP (ORDER BY "biobio_measurement"."chest")',
+            str(query.query),
+        )
+
+    def test_analytics_rejects_bad_percentiles(self):
+        response = self.client.get(
+            reverse("admin-measurement-analytics"), {"percentiles": "0,50"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class CleanupDuplicateMeasurementsTests(TestCase):
+    def setUp(self):
+        # username is unique, so rows without one are the duplicates left to clean
+        self.kept = Measurement.objects.bulk_create(
+            [Measurement(username="alice"), Measurement(username="bob")]
+        )
+        self.nameless = Measurement.objects.bulk_create(
+            Measurement(username=None) for _ in range(5)
+        )
+
+    def cleanup(self, **options):
+        out = StringIO()
+        call_command("cleanup_duplicate_measurements", stdout=out, **options)
+        return out.getvalue()
+
+    def test_dry_run_reports_without_deleting(self):
+        output = self.cleanup(dry_run=True)
+
+        self.assertIn("would delete 4 duplicate measurement(s)", output)
+        self.assertEqual(Measurement.objects.count(), 7)
+
+    def test_keeps_the_newest_row_per_username(self):
+        self.cleanup(batch_size=2)
+
+        self.assertEqual(
+            set(Measurement.objects.values_list("id", flat=True)),
+            {self.kept[0].id, self.kept[1].id, self.nameless[-1].id},
+        )
+
+    def test_deletes_each_batch_in_one_statement(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.cleanup(batch_size=100)
+
+        deletes = [q["sql"] for q in queries if q["sql"].startswith("DELETE")]
+        self.assertEqual(len(deletes), 1, deletes)
+
+    def test_rejects_batch_sizes_below_one(self):
+        for batch_size in (0, -5):
+            with self.subTest(batch_size=batch_size):
+                with self.assertRaisesMessage(CommandError, "--batch-size"):
+                    self.cleanup(batch_size=batch_size)
+        self.assertEqual(Measurement.objects.count(), 7)
+
+
+class ExportDataTests(TestCase):
+    def setUp(self):
+        alice = make_profile("alice")
+        lapel = CustomizationOption.objects.create(name="Lapel")
+        pocket = CustomizationOption.objects.create(name="Pocket")
+        self.orders = [
+            Order.objects.create(client=alice, status=status)
+            for status in ("Pending", "Completed", "Completed", "Pending")
+        ]
+        self.orders[1].customization_options.add(lapel, pocket)
+        Order.objects.filter(id=self.orders[2].id).update(
+            order_date=timezone.now() - timedelta(days=400)
+        )
+
+    def export(self, *args, **options):
+        out = StringIO()
+        call_command("export_data", *args, stdout=out, **options)
+        return out.getvalue()
+
+    def test_orders_csv_with_filters(self):
+        since = (timezone.localdate() - timedelta(days=30)).isoformat()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "orders.csv")
+            output = self.export(
+                "orders", "--since", since, "--status", "Completed", "--output", path
+            )
+            with open(path, newline="") as exported:
+                rows = list(csv.DictReader(exported))
+
+        self.assertIn("Exported 1 orders row(s)", output)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["id"], str(self.orders[1].id))
+        self.assertEqual(rows[0]["client"], "alice")
+        self.assertEqual(rows[0]["customization_options"], "Lapel; Pocket")
+        self.assertNotIn("client_id", rows[0])
+
+    def test_reads_and_writes_in_chunks(self):
+        # One cursor over the orders, plus one options query per chunk of two
+        with self.assertNumQueries(3):
+            output = self.export("orders", "--output", "-", "--batch-size", "2")
+
+        rows = list(csv.DictReader(StringIO(output)))
+        self.assertEqual([row["id"] for row in rows], [str(o.id) for o in self.orders])
+
+    def test_measurements_to_stdout(self):
+        Measurement.objects.create(username="alice", chest=Decimal("40.5"))
+
+        rows = list(
+            csv.DictReader(StringIO(self.export("measurements", "--output", "-")))
+        )
+
+        self.assertEqual(rows[0]["username"], "alice")
+        self.assertEqual(rows[0]["chest"], "40.50")
+        self.assertEqual(rows[0]["waist"], "")
+
+    def test_rejects_unsupported_requests(self):
+        with self.assertRaisesMessage(CommandError, "no status"):
+            self.export("measurements", "--status", "Pending")
+        with mock.patch.dict(sys.modules, {"pyarrow": None}):
+            with self.assertRaisesMessage(CommandError, "needs pyarrow"):
+                self.export("notifications", "--format", "parquet")
+
+
+@override_settings(
+    LOGIN_MAX_FAILED_ATTEMPTS=3,
+    PASSWORD_HASHERS=[
+        "biobio.hashers.ScryptPasswordHasher",
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ],
+    PASSWORD_SCRYPT_WORK_FACTOR=2**10,
+)
+class LoginTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.profile = make_profile(
+            "alice", password=make_password("s3cret!", hasher="md5")
+        )
+
+    def login(self, password):
+        return self.client.post(
+            reverse("verify"), {"username": "alice", "password": password}
+        )
+
+    def test_lockout_skips_the_password_hash(self):
+        for _ in range(3):
+            self.assertEqual(self.login("wrong").status_code, 400)
+
+        with mock.patch("biobio.login.check_password") as check:
+            with self.assertNumQueries(0):
+                response = self.login("s3cret!")
+
+        self.assertEqual(response.status_code, 429)
+        check.assert_not_called()
+
+    def test_success_resets_failures(self):
+        self.login("wrong")
+        self.login("wrong")
+        self.assertEqual(self.login("s3cret!").status_code, 200)
+
+        self.assertEqual(self.login("wrong").status_code, 400)
+        self.assertEqual(self.login("s3cret!").status_code, 200)
+
+    def test_unknown_usernames_are_limited_too(self):
+        for _ in range(3):
+            self.client.post(reverse("verify"), {"username": "nobody", "password": "x"})
+        response = self.client.post(
+            reverse("verify"), {"username": "nobody", "password": "x"}
+        )
+        self.assertEqual(response.status_code, 429)
+
+    def test_old_hash_is_kept_unless_rehash_is_enabled(self):
+        self.assertEqual(self.login("s3cret!").status_code, 200)
+        self.profile.refresh_from_db()
+        self.assertTrue(self.profile.password.startswith("md5$"))
+
+    @override_settings(PASSWORD_REHASH_ON_LOGIN=True)
+    def test_login_upgrades_old_hash_to_preferred_hasher(self):
+        self.assertEqual(self.login("s3cret!").status_code, 200)
+
+        self.profile.refresh_from_db()
+        self.assertTrue(self.profile.password.startswith("scrypt$"))
+        self.assertEqual(self.login("s3cret!").status_code, 200)
+
+
+class PasswordFieldTests(TestCase):
+    def test_preferred_hashers_fit_the_password_column(self):
+        max_length = UserProfile._meta.get_field("password").max_length
+        for name, path in settings.PREFERRED_PASSWORD_HASHERS.items():
+            with self.subTest(hasher=name):
+                try:
+                    hasher = import_string(path)()
+                    encoded = hasher.encode("a" * 64, hasher.salt())
+                except ValueError:
+                    # Optional library (argon2-cffi) not installed
+                    continue
+                self.assertLessEqual(len(encoded), max_length)
+
+    def test_scrypt_hashes_at_the_highest_allowed_cost(self):
+        max_length = UserProfile._meta.get_field("password").max_length
+        hasher = ScryptPasswordHasher()
+        for work_factor in (2**15, 2**16):
+            with self.subTest(work_factor=work_factor):
+                with override_settings(PASSWORD_SCRYPT_WORK_FACTOR=work_factor):
+                    encoded = hasher.encode("s3cret!", hasher.salt())
+                self.assertTrue(encoded.startswith(f"scrypt${work_factor}$"))
+                self.assertLessEqual(len(encoded), max_length)
+                # Verified with the cost stored in the hash, not the setting
+                self.assertTrue(hasher.verify("s3cret!", encoded))
+                self.assertFalse(hasher.verify("wrong", encoded))
+
+    def test_settings_reject_work_factors_scrypt_cannot_store(self):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE="BioData.settings")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for work_factor in ("30000", "131072"):
+            with self.subTest(work_factor=work_factor):
+                env["PASSWORD_SCRYPT_WORK_FACTOR"] = work_factor
+                result = subprocess.run(
+                    [sys.executable, "-c", "import django; django.setup()"],
+                    env=env,
+                    cwd=root,
+                    capture_output=True,
+                    text=True,
+                )
+                self.assertNotEqual(result.returncode, 0)
+                self.assertIn("PASSWORD_SCRYPT_WORK_FACTOR", result.stderr)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+@mock.patch.object(NotificationService, "send_email_notification", return_value=True)
+class PasswordResetTests(TestCase):
+    new_password = "N3w-password"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.profile = make_profile("alice", password=make_password("0ld-password"))
+
+    def request_token(self, send):
+        response = self.client.post(
+            reverse("forgot-password"), {"email": "alice@example.com"}
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return re.search(r"token=([^'\"]+)", send.call_args.kwargs["message"]).group(1)
+
+    def confirm(self, token):
+        return self.client.post(
+            reverse("reset-password"),
+            {
+                "token": token,
+                "new_password": self.new_password,
+                "confirm_password": self.new_password,
+            },
+        )
+
+    def test_issuing_a_token_writes_nothing(self, send):
+        with CaptureQueriesContext(connection) as queries:
+            self.request_token(send)
+
+        # One profile lookup and no writes before the email goes out
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]["sql"].startswith("SELECT"))
+        self.assertFalse(PasswordResetToken.objects.exists())
+
+    def test_token_resets_password_once(self, send):
+        token = self.request_token(send)
+
+        self.assertEqual(self.confirm(token).status_code, 200)
+        self.profile.refresh_from_db()
+        self.assertTrue(check_password(self.new_password, self.profile.password))
+        self.assertEqual(self.confirm(token).status_code, 400)
+
+    def test_expired_or_tampered_tokens_are_rejected(self, send):
+        token = self.request_token(send)
+
+        self.assertEqual(self.confirm(token[:-1] + "x").status_code, 400)
+        with override_settings(PASSWORD_RESET_TIMEOUT=-1):
+            self.assertEqual(self.confirm(token).status_code, 400)
+
+    def test_legacy_row_tokens_still_work(self, send):
+        PasswordResetToken.objects.create(
+            user=self.profile,
+            token="legacy-token",
+            expires_at=timezone.now() + timedelta(hours=1),
+        )
+
+        self.assertEqual(self.confirm("legacy-token").status_code, 200)
+        self.assertTrue(PasswordResetToken.objects.get().used)
+
+    def test_purge_deletes_used_and_expired_rows(self, send):
+        now = timezone.now()
+        for token, used, expires_at in (
+            ("live", False, now + timedelta(hours=1)),
+            ("used", True, now + timedelta(hours=1)),
+            ("expired", False, now - timedelta(hours=1)),
+        ):
+            PasswordResetToken.objects.create(
+                user=self.profile, token=token, used=used, expires_at=expires_at
+            )
+
+        call_command("purge_password_reset_tokens", stdout=StringIO())
+
+        self.assertEqual(
+            list(PasswordResetToken.objects.values_list("token", flat=True)), ["live"]
+        )
+
+
+@mock.patch.object(NotificationService, "send_email_notification")
+class NotificationOutboxTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.order = Order.objects.create(client=make_profile("alice"))
+
+    def drain(self, **options):
+        call_command(
+            "send_notifications",
+            once=True,
+            stdout=StringIO(),
+            stderr=StringIO(),
+            **options,
+        )
+
+    def test_confirm_queues_email_without_sending(self, send):
+        response = self.client.post(reverse("confirm-order", args=[self.order.id]))
+
+        self.assertEqual(response.status_code, 200)
+        send.assert_not_called()
+        queued = NotificationLog.objects.get()
+        self.assertEqual(queued.status, NotificationLog.STATUS_PENDING)
+        self.assertEqual(queued.recipient, "alice@example.com")
+        self.assertEqual(queued.subject, f"Order Confirmed - {self.order.order_id}")
+
+    def test_status_update_queues_email(self, send):
+        self.order.is_confirmed = True
+        self.order.save()
+
+        self.client.put(
+            reverse("update-status", args=[self.order.id]), {"status": "fitting"}
+        )
+
+        send.assert_not_called()
+        queued = NotificationLog.objects.get()
+        self.assertIn("Ready for Fitting", queued.subject)
+        self.assertIn("Your Garment Is Ready for Fitting", queued.message)
+
+    def test_worker_sends_pending_email(self, send):
+        send.return_value = True
+        self.client.post(reverse("confirm-order", args=[self.order.id]))
+        queued_at = NotificationLog.objects.get().timestamp
+
+        self.drain()
+
+        send.assert_called_once()
+        delivered = NotificationLog.objects.get()
+        self.assertEqual(delivered.status, NotificationLog.STATUS_SUCCESS)
+        self.assertEqual(delivered.attempts, 1)
+        self.assertIsNone(delivered.next_attempt_at)
+        # The queue time survives delivery; the attempt is recorded separately
+        self.assertEqual(delivered.timestamp, queued_at)
+        self.assertGreaterEqual(delivered.last_attempt_at, queued_at)
+
+    def test_worker_backs_off_then_gives_up(self, send):
+        send.return_value = False
+        self.client.post(reverse("confirm-order", args=[self.order.id]))
+
+        self.drain(max_attempts=2, backoff=60)
+        retrying = NotificationLog.objects.get()
+        self.assertEqual(retrying.status, NotificationLog.STATUS_PENDING)
+        self.assertEqual(retrying.attempts, 1)
+        self.assertGreater(retrying.next_attempt_at, timezone.now())
+
+        # Not due yet, so a second drain leaves it alone
+        self.drain(max_attempts=2, backoff=60)
+        self.assertEqual(send.call_count, 1)
+
+        NotificationLog.objects.update(next_attempt_at=timezone.now())
+        self.drain(max_attempts=2, backoff=60)
+        failed = NotificationLog.objects.get()
+        self.assertEqual(failed.attempts, 2)
+        self.assertTrue(failed.status.startswith("Failed"))
+        self.assertIsNone(failed.next_attempt_at)
+
+    def test_claimed_notifications_are_leased_while_sending(self, send):
+        self.client.post(reverse("confirm-order", args=[self.order.id]))
+
+        def check_lease(**kwargs):
+            # Other workers would skip the row until the lease runs out
+            leased = NotificationLog.objects.get()
+            self.assertGreater(leased.next_attempt_at, timezone.now())
+            return True
+
+        send.side_effect = check_lease
+        self.drain()
+
+        self.assertEqual(NotificationLog.objects.get().status, "Success")
+
+    def test_sent_notifications_stay_recorded_if_the_worker_dies(self, send):
+        self.client.post(reverse("confirm-order", args=[self.order.id]))
+        self.client.post(reverse("confirm-order", args=[self.order.id]))
+        send.side_effect = [True, SystemExit]
+
+        with self.assertRaises(SystemExit):
+            self.drain()
+
+        self.assertEqual(
+            sorted(NotificationLog.objects.values_list("status", flat=True)),
+            [NotificationLog.STATUS_PENDING, NotificationLog.STATUS_SUCCESS],
+        )
+
+
+# Both APIs, for tests of the opt-in v2 URL set (API_V2)
+urlpatterns = [
+    path("api/users/", include("biobio.urls")),
+    path("api/v2/users/", include("biobio.urls_v2")),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class OrderLifecycleTests(TestCase):
+    """The order endpoints behave the same on both APIs; only messages differ."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.order = Order.objects.create(
+            client=make_profile("alice"), event_type="Wedding", comments="Slim fit"
+        )
+
+    def test_update_changes_only_editable_fields(self):
+        for prefix in ("", "v2:"):
+            with self.subTest(api=prefix or "v1"):
+                response = self.client.put(
+                    reverse(f"{prefix}update-order", args=[self.order.id]),
+                    {"comments": f"Loose fit {prefix}", "status": "Completed"},
+                    format="json",
+                )
+
+                self.assertEqual(response.status_code, 200)
+                self.order.refresh_from_db()
+                self.assertEqual(self.order.comments, f"Loose fit {prefix}")
+                self.assertEqual(self.order.event_type, "Wedding")
+                self.assertEqual(self.order.status, "Pending")
+
+    def test_confirmed_order_cannot_be_edited_or_deleted(self):
+        self.order.is_confirmed = True
+        self.order.save()
+
+        for prefix in ("", "v2:"):
+            with self.subTest(api=prefix or "v1"):
+                updated = self.client.put(
+                    reverse(f"{prefix}update-order", args=[self.order.id]),
+                    {"comments": "Loose fit"},
+                    format="json",
+                )
+                deleted = self.client.post(
+                    reverse(f"{prefix}delete-order", args=[self.order.id])
+                )
+
+                self.assertEqual(
+                    updated.json(), {"error": "Cannot modify a confirmed order."}
+                )
+                self.assertEqual(
+                    deleted.json(), {"error": "Cannot delete a confirmed order."}
+                )
+                self.assertTrue(Order.objects.filter(id=self.order.id).exists())
+
+    @mock.patch.object(NotificationService, "send_sms_notification")
+    def test_v2_queues_texts_for_the_worker(self, send_sms):
+        self.client.post(reverse("v2:confirm-order", args=[self.order.id]))
+        self.client.put(
+            reverse("v2:update-status", args=[self.order.id]),
+            {"status": "fitting"},
+            format="json",
+        )
+
+        send_sms.assert_not_called()
+        queued = NotificationLog.objects.order_by("id")
+        self.assertEqual(
+            [(sms.notification_type, sms.status) for sms in queued],
+            [("sms", NotificationLog.STATUS_PENDING)] * 2,
+        )
+
+        send_sms.return_value = True
+        call_command("send_notifications", once=True, stdout=StringIO())
+
+        self.assertEqual(
+            [call.args for call in send_sms.call_args_list],
+            [
+                ("0000000000", f"Your order {self.order.id} has been confirmed."),
+                ("0000000000", f"👔 Ready for Fitting - Order {self.order.order_id}"),
+            ],
+        )
+        self.assertEqual(
+            set(queued.values_list("status", flat=True)),
+            {NotificationLog.STATUS_SUCCESS},
+        )
+
+    def test_v2_is_not_served_by_default(self):
+        with override_settings(ROOT_URLCONF="BioData.urls"):
+            with self.assertRaises(NoReverseMatch):
+                reverse("v2:confirm-order", args=[self.order.id])
+
+
+@override_settings(
+    RESEND_API_KEY="test", RESEND_BATCH_SIZE=2, RESEND_BATCH_CONCURRENCY=2
+)
+class BulkEmailTests(TestCase):
+    recipients = [f"client{i}@example.com" for i in range(5)]
+
+    def setUp(self):
+        patcher = mock.patch.object(notification_service, "_resend", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @mock.patch("resend.Batch.send")
+    def test_recipients_are_grouped_into_batches(self, batch_send):
+        results = NotificationService.send_bulk(self.recipients, "Hello", "<p>Hi</p>")
+
+        self.assertEqual(batch_send.call_count, 3)
+        sent_to = [
+            email["to"] for call in batch_send.call_args_list for email in call.args[0]
+        ]
+        self.assertCountEqual(sent_to, self.recipients)
+        self.assertTrue(all(results.values()))
+        self.assertEqual(
+            NotificationLog.objects.filter(
+                status=NotificationLog.STATUS_SUCCESS
+            ).count(),
+            5,
+        )
+
+    @mock.patch("resend.Batch.send")
+    def test_failed_batch_is_reported_per_recipient(self, batch_send):
+        def fail_second_batch(params):
+            if params[0]["to"] == self.recipients[2]:
+                raise RuntimeError("rate limited")
+            return {"data": [{"id": "x"}] * len(params)}
+
+        batch_send.side_effect = fail_second_batch
+        results = NotificationService.send_bulk(self.recipients, "Hello", "<p>Hi</p>")
+
+        self.assertEqual(
+            [email for email, sent in results.items() if not sent], self.recipients[2:4]
+        )
+        failed = NotificationLog.objects.exclude(status=NotificationLog.STATUS_SUCCESS)
+        self.assertCountEqual(
+            failed.values_list("recipient", flat=True), self.recipients[2:4]
+        )
+        self.assertEqual(failed.first().status, "Failed: rate limited")
+
+    @mock.patch("resend.Batch.send")
+    def test_send_email_view_broadcasts_to_usernames(self, batch_send):
+        make_profile("alice")
+        make_profile("bob")
+
+        response = APIClient().post(
+            reverse("notifications"),
+            {"usernames": ["alice", "bob"], "subject": "Hi", "message": "<p>Hi</p>"},
+            format="json",
+        )
+
+        self.assertEqual(response.json(), {"sent": 2, "failed": []})
+        batch_send.assert_called_once()
+
+    def broadcast(self, usernames):
+        return APIClient().post(
+            reverse("notifications"),
+            {"usernames": usernames, "subject": "Hi", "message": "<p>Hi</p>"},
+            format="json",
+        )
+
+    @mock.patch("resend.Batch.send")
+    def test_send_email_view_requires_a_list_of_usernames(self, batch_send):
+        make_profile("alice")
+
+        for usernames in ("alice", {"alice": 1}, [["alice"]]):
+            with self.subTest(usernames=usernames):
+                self.assertEqual(self.broadcast(usernames).status_code, 400)
+        batch_send.assert_not_called()
+
+    @mock.patch("resend.Batch.send")
+    def test_send_email_view_fails_when_nothing_is_sent(self, batch_send):
+        make_profile("alice")
+
+        self.assertEqual(self.broadcast(["nobody"]).status_code, 404)
+
+        batch_send.side_effect = RuntimeError("provider down")
+        response = self.broadcast(["alice"])
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {"sent": 0, "failed": ["alice@example.com"]})
+
+    @override_settings(RESEND_API_KEY=None)
+    def test_send_email_view_reports_missing_provider_settings(self):
+        make_profile("alice")
+
+        response = self.broadcast(["alice"])
+
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("RESEND_API_KEY", response.json()["error"])
+
+
+class TwilioClientPoolTests(TestCase):
+    def setUp(self):
+        notification_service._reset_twilio_client()
+        self.addCleanup(notification_service._reset_twilio_client)
+
+    def test_client_is_shared_until_fork(self):
+        client = notification_service.get_twilio_client()
+        self.assertIs(notification_service.get_twilio_client(), client)
+
+        notification_service._reset_twilio_client()  # what a forked child runs
+        self.assertIsNot(notification_service.get_twilio_client(), client)
+
+    @mock.patch("biobio.notification_service_v2.get_twilio_client")
+    def test_send_sms_many_reports_each_number(self, get_client):
+        def create(to, **kwargs):
+            if to == "bad":
+                raise RuntimeError("invalid number")
+
+        get_client.return_value.messages.create.side_effect = create
+
+        results = NotificationServiceV2.send_sms_many(["+100", "bad", "+100"], "Hi")
+
+        self.assertEqual(results, {"+100": True, "bad": False})
+        self.assertEqual(get_client.return_value.messages.create.call_count, 2)
+        self.assertEqual(
+            dict(NotificationLog.objects.values_list("recipient", "status")),
+            {"+100": "Success", "bad": "Failed: invalid number"},
+        )
+
+
+class LazyProviderTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(notification_service, "_resend", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(RESEND_API_KEY="re_test")
+    def test_resend_is_configured_on_first_use(self):
+        resend = notification_service.get_resend()
+
+        self.assertEqual(resend.api_key, "re_test")
+        self.assertIs(notification_service.get_resend(), resend)
+
+    @override_settings(RESEND_API_KEY=None)
+    def test_missing_resend_key_fails_on_first_send(self):
+        with self.assertRaises(ImproperlyConfigured):
+            NotificationService.send_email_notification("a@example.com", "Hi", "Hi")
+        with self.assertRaises(ImproperlyConfigured):
+            NotificationService.send_bulk(["a@example.com"], "Hi", "Hi")
+        self.assertFalse(NotificationLog.objects.exists())
+
+    @override_settings(RESEND_API_KEY=None)
+    def test_deploy_check_warns_about_missing_resend_key(self):
+        warnings = check_notification_settings(None)
+
+        self.assertEqual([warning.id for warning in warnings], ["biobio.W001"])
+
+    def test_startup_needs_neither_provider_sdks_nor_credentials(self):
+        env = {
+            key: value for key, value in os.environ.items() if key != "RESEND_API_KEY"
+        }
+        env["DJANGO_SETTINGS_MODULE"] = "BioData.settings"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        worker = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, BioData.wsgi, biobio.urls; "
+                "print(sorted({'pdb', 'resend', 'twilio'} & set(sys.modules)))",
+            ],
+            env=env,
+            cwd=root,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(worker.returncode, 0, worker.stderr)
+        self.assertEqual(worker.stdout.strip(), "[]")
+
+        check = subprocess.run(
+            [sys.executable, "manage.py", "check"],
+            env=env,
+            cwd=root,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(check.returncode, 0, check.stderr)
+
+
+class EmailTemplateTests(TestCase):
+    def setUp(self):
+        self.profile = make_profile("alice", firstname="Alice", lastname="<Smith>")
+        self.order = Order.objects.create(client=self.profile, event_type="Wedding")
+
+    def test_partial_leaves_only_the_per_email_fields(self):
+        template = EmailTemplate("<p>${a} and ${b}</p>").partial(b="B & co")
+        self.assertEqual(template.fields, ["a"])
+        self.assertEqual(template.render(a="<A>"), "<p>&lt;A&gt; and B & co</p>")
+
+    def test_values_cannot_break_out_of_attributes(self):
+        subject, html = render_password_reset(self.profile, "x' onclick='alert(1)")
+        self.assertIn("href='x&#x27; onclick=&#x27;alert(1)'", html)
+
+    def test_status_update_fills_order_fields(self):
+        subject, html = render_order_status_update(
+            self.order, self.profile, "in_progress"
+        )
+
+        self.assertEqual(
+            subject, f"🚀 Production Update - Order {self.order.order_id} In Progress"
+        )
+        self.assertIn(f'<span class="detail-value">{self.order.order_id}</span>', html)
+        self.assertIn('<span class="detail-value">In Production</span>', html)
+        self.assertIn('<span class="detail-value">Wedding</span>', html)
+        self.assertIn("Hello Alice &lt;Smith&gt;,", html)
+        self.assertNotIn("${", html)
+
+    def test_statuses_without_email_render_nothing(self):
+        self.assertIsNone(
+            render_order_status_update(self.order, self.profile, "Pending")
+        )
+
+    def test_confirmation_defaults_missing_event_type(self):
+        self.order.event_type = None
+        subject, html = render_order_confirmation(self.order, self.profile)
+        self.assertEqual(subject, f"Order Confirmed - {self.order.order_id}")
+        self.assertIn("<strong>Event Type:</strong> N/A", html)
@@ -0,0 +1,50 @@
+# biobio/tokens.py
+from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.utils.encoding import force_bytes, force_str
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+from .models import UserProfile
+
+
+class ResetTokenGenerator(PasswordResetTokenGenerator):
+    """
+    Signed, time-limited reset tokens for UserProfile.
+
+    Nothing is stored: the HMAC covers the profile's current password hash,
+    so a token stops working as soon as the password changes, and
+    PASSWORD_RESET_TIMEOUT bounds its age otherwise.
+    """
+
+    key_salt = "biobio.tokens.ResetTokenGenerator"
+
+    def _make_hash_value(self, user, timestamp):
+        return f"{user.pk}{user.password}{user.email}{user.is_active}{timestamp}"
+
+
+reset_token_generator = ResetTokenGenerator()
+
+
+def make_reset_token(user_profile):
+    """Return ``<uidb64>.<token>`` for the reset link."""
+    uidb64 = urlsafe_base64_encode(force_bytes(user_profile.pk))
+    return f"{uidb64}.{reset_token_generator.make_token(user_profile)}"
+
+
+def is_signed_reset_token(token):
+    # Legacy row tokens are UUIDs, which never contain a "."
+    return "." in token
+
+
+def check_reset_token(token):
+    """Return the profile a signed token was issued for, or None if it is invalid."""
+    uidb64, _, signed = token.partition(".")
+    try:
+        pk = int(force_str(urlsafe_base64_decode(uidb64)))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    user_profile = UserProfile.objects.filter(pk=pk).first()
+    if user_profile is None or not reset_token_generator.check_token(
+        user_profile, signed
+    ):
+        return None
+    return user_profile
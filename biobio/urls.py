@@ -17,11 +17,13 @@ from .views import (
     MeasurementCreateView,
     MeasurementUpdateView,
     MeasurementDetailView,
+    MeasurementAnalyticsView,
     SendEmailView,
     AdminCreateOrderView,
 )
 from .views import (
     AdminDashboardView,
+    AdminMetricsView,
     AdminOrderListView,
     OrderConfirmView,
     OrderUpdateView,
@@ -84,10 +86,16 @@ urlpatterns = [
     ),
     path("notifications/email", SendEmailView.as_view(), name="notifications"),
     path("admin/dashboard", AdminDashboardView.as_view(), name="admin-dashboard"),
+    path("admin/metrics", AdminMetricsView.as_view(), name="admin-metrics"),
     path(
         "admin/orders/create/",
         AdminCreateOrderView.as_view(),
         name="admin-create-order",
     ),
     path("admin/orders", AdminOrderListView.as_view(), name="admin-orders"),
+    path(
+        "admin/measurements/analytics",
+        MeasurementAnalyticsView.as_view(),
+        name="admin-measurement-analytics",
+    ),
 ]
@@ -0,0 +1,69 @@
+from django.urls import path
+
+from .views_v2 import (
+    BiodataCreateView,
+    CreateUserView,
+    CustomTokenObtainPairView,
+    MeasurementCreateView,
+    MeasurementDetailView,
+    MeasurementUpdateView,
+    OrderConfirmView,
+    OrderCreateView,
+    OrderDeleteView,
+    OrderDetailsView,
+    OrderListView,
+    OrderUpdateStatusView,
+    OrderUpdateView,
+    UserProfileDetailView,
+    UserProfileListView,
+    UserVerficationView,
+)
+
+# Same paths and names as biobio.urls, reversed as "v2:<name>"
+app_name = "v2"
+
+urlpatterns = [
+    path("login/", CustomTokenObtainPairView.as_view(), name="token_obtain_pair"),
+    path("userprofile/", UserProfileListView.as_view(), name="biodata-list"),
+    path("biodata/", BiodataCreateView.as_view(), name="biodata-create"),
+    path("signup/", CreateUserView.as_view(), name="signup"),
+    path("verify/", UserVerficationView.as_view(), name="verify"),
+    path(
+        "profile/<str:username>/",
+        UserProfileDetailView.as_view(),
+        name="user-profile-detail",
+    ),
+    path("orders/", OrderListView.as_view(), name="order-list"),
+    path("orders/new/", OrderCreateView.as_view(), name="order-create"),
+    path("orders/<str:username>/", OrderListView.as_view(), name="order-list-username"),
+    path(
+        "orders/view/<int:order_id>/", OrderDetailsView.as_view(), name="order-details"
+    ),
+    path(
+        "orders/confirm/<int:order_id>/",
+        OrderConfirmView.as_view(),
+        name="confirm-order",
+    ),
+    path(
+        "orders/update/<int:order_id>/", OrderUpdateView.as_view(), name="update-order"
+    ),
+    path(
+        "orders/updatestatus/<int:order_id>/",
+        OrderUpdateStatusView.as_view(),
+        name="update-status",
+    ),
+    path(
+        "orders/delete/<int:order_id>/", OrderDeleteView.as_view(), name="delete-order"
+    ),
+    path(
+        "measurements/new/", MeasurementCreateView.as_view(), name="measurement-create"
+    ),
+    path(
+        "measurements/update/",
+        MeasurementUpdateView.as_view(),
+        name="measurement-update",
+    ),
+    path(
+        "measurements/view/", MeasurementDetailView.as_view(), name="measurement-detail"
+    ),
+]
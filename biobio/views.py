@@ -1,17 +1,16 @@
 from django.shortcuts import render, get_object_or_404
-from django.http import Http404
+from django.http import Http404, HttpResponse
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework.permissions import AllowAny
 from django.conf import settings
-import uuid
+from django.core.exceptions import ImproperlyConfigured
 import re
-from datetime import timedelta
 from django.utils import timezone
+from django.db.models import Count, Max, Q
 from rest_framework import generics, permissions
-from django.contrib.auth.models import User
 from rest_framework import serializers
 from .serializers import CustomTokenObtainPairSerializer
 from rest_framework.permissions import IsAdminUser
@@ -20,10 +19,31 @@ from .models import UserProfile, Order
 from .models import PasswordResetToken
 from .serializers import BiodataSerializer
 from .serializers import UserProfileSerializer, OrderSerializer, MeasurementSerializer
+from .serializers import OrderListSerializer
+from .fast_serializers import OrderListValuesSerializer, UserProfileValuesSerializer
 from rest_framework.decorators import api_view
 from .notification_service import NotificationService
-from django.contrib.auth.hashers import check_password, make_password
-import pdb
+from .conditional import conditional_payload
+from .dashboard import get_dashboard_counts
+from .login import is_locked_out, record_failure, reset_failures, verify_password
+from .measurements import DEFAULT_PERCENTILES, size_chart
+from .metrics import request_metrics
+from .tokens import check_reset_token, is_signed_reset_token, make_reset_token
+from .pagination import OrderCursorPagination
+from .services import (
+    OrderLocked,
+    OutboxEmailNotifications,
+    confirm_order,
+    create_order,
+    delete_order,
+    get_profile,
+    profile_version,
+    update_order,
+    update_order_status,
+)
+from .streaming import export_response
+from .email_templates import render_password_reset
+from django.contrib.auth.hashers import make_password
 
 from rest_framework.permissions import IsAuthenticated
 
@@ -39,9 +59,22 @@ class UserProfileListView(generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
 
     def get(self, request, *args, **kwargs):
+        if "export" in request.query_params:
+            return export_response(
+                request,
+                UserProfile.objects.order_by("id"),
+                UserProfileValuesSerializer,
+                "userprofiles",
+            )
         try:
             allusers = UserProfile.objects.all()
-            serializer = UserProfileSerializer(allusers, many=True)
+            if settings.FAST_READ_SERIALIZERS:
+                allusers = UserProfileValuesSerializer.prepare_queryset(
+                    allusers, request
+                )
+                serializer = UserProfileValuesSerializer(allusers, many=True)
+            else:
+                serializer = UserProfileSerializer(allusers, many=True)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({"error": str(e)}, status.HTTP_400_BAD_REQUEST)
@@ -112,18 +145,25 @@ class UserVerficationView(APIView):
                 {"error": "Please provide both username and password"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        # Locked-out usernames are rejected before any query or password hash
+        if is_locked_out(username):
+            return Response(
+                {"error": "Too many failed login attempts. Please try again later."},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
         try:
-            user_profile = UserProfile.objects.get(username=username)
-            passcheck = check_password(password, user_profile.password)
-            print(passcheck)
-            if passcheck:
+            user_profile = get_profile(username)
+            if verify_password(user_profile, password):
+                reset_failures(username)
                 return Response({"role": user_profile.role}, status=status.HTTP_200_OK)
             else:
+                record_failure(username)
                 return Response(
                     {"error": "Username and password do not match"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
         except UserProfile.DoesNotExist:
+            record_failure(username)
             return Response(
                 {"error": "Username and password do not match"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -151,16 +191,13 @@ class ForgotPasswordRequestView(APIView):
 
         try:
             # Use filter to handle multiple records gracefully
-            user_profiles = UserProfile.objects.filter(email=email)
+            user_profile = UserProfile.objects.filter(email=email).first()
 
-            if not user_profiles.exists():
+            if user_profile is None:
                 return Response(
                     {"error": "Email not found"}, status=status.HTTP_404_NOT_FOUND
                 )
 
-            # If multiple exist, use the first one (will be prevented by unique constraint after migration)
-            user_profile = user_profiles.first()
-
             print(f"📧 Found user profile for {email}: {user_profile.username}")
         except Exception as e:
             print(f"❌ Error finding user profile: {str(e)}")
@@ -169,12 +206,8 @@ class ForgotPasswordRequestView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        # Create reset token valid for 1 hour
-        token = str(uuid.uuid4())
-        expires_at = timezone.now() + timedelta(hours=1)
-        PasswordResetToken.objects.create(
-            user=user_profile, token=token, expires_at=expires_at
-        )
+        # Signed token valid for PASSWORD_RESET_TIMEOUT; nothing is written to the database
+        token = make_reset_token(user_profile)
 
         reset_base = (
             getattr(settings, "FRONTEND_RESET_URL", None)
@@ -182,23 +215,12 @@ class ForgotPasswordRequestView(APIView):
         )
         reset_link = f"{reset_base}?token={token}"
 
-        email_body = f"""
-        <div style='font-family: Arial, sans-serif; line-height:1.6;'>
-            <h2>Password Reset Requested</h2>
-            <p>Hello {user_profile.firstname},</p>
-            <p>We received a request to reset the password for your account. Click the button below to reset your password. This link will expire in 1 hour.</p>
-            <p style='text-align:center; margin:24px 0;'>
-                <a href='{reset_link}' style='background:#8B4513; color:#ffffff; padding:12px 20px; text-decoration:none; border-radius:6px;'>Reset Password</a>
-            </p>
-            <p>If you did not request this, you can safely ignore this email. If you continue to receive these emails, please contact an administrator.</p>
-            <p>Thank you,<br/>JFK Team</p>
-        </div>
-        """
+        subject, email_body = render_password_reset(user_profile, reset_link)
 
         try:
             email_sent = NotificationService.send_email_notification(
                 to_email=user_profile.email,
-                subject="Reset your JFK password",
+                subject=subject,
                 message=email_body,
             )
 
@@ -277,28 +299,34 @@ class ResetPasswordConfirmView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        reset_token = (
-            PasswordResetToken.objects.filter(
-                token=token, used=False, expires_at__gte=timezone.now()
+        if is_signed_reset_token(token):
+            user_profile = check_reset_token(token)
+            reset_token = None
+        else:
+            # Tokens stored before signed tokens were issued stay valid until they expire
+            reset_token = (
+                PasswordResetToken.objects.filter(
+                    token=token, used=False, expires_at__gte=timezone.now()
+                )
+                .select_related("user")
+                .first()
             )
-            .select_related("user")
-            .first()
-        )
+            user_profile = reset_token.user if reset_token else None
 
-        if not reset_token:
+        if user_profile is None:
             return Response(
                 {"error": "Invalid or expired reset token"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
         try:
-            reset_token.user.password = make_password(new_password)
-            reset_token.user.save()
-            reset_token.used = True
-            reset_token.save()
-            PasswordResetToken.objects.filter(user=reset_token.user, used=False).update(
-                used=True
-            )
+            # Changing the hash also invalidates every signed token issued before
+            user_profile.password = make_password(new_password)
+            user_profile.save(update_fields=["password", "updated_at"])
+            if reset_token is not None:
+                PasswordResetToken.objects.filter(user=user_profile, used=False).update(
+                    used=True
+                )
             return Response(
                 {"message": "Password has been reset successfully"},
                 status=status.HTTP_200_OK,
@@ -315,9 +343,15 @@ class UserProfileDetailView(APIView):
 
     def get(self, request, username, *args, **kwargs):
         try:
-            user_profile = UserProfile.objects.get(username=username)
-            serializer = UserProfileSerializer(user_profile)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # Revalidation only needs the row version; serialize on a cache miss
+            pk, updated_at = profile_version(username)
+            return conditional_payload(
+                request,
+                f"user-profile:{pk}",
+                updated_at,
+                updated_at,
+                lambda: UserProfileSerializer(UserProfile.objects.get(id=pk)).data,
+            )
         except UserProfile.DoesNotExist:
             return Response(
                 {"error": "User profile not found."}, status=status.HTTP_404_NOT_FOUND
@@ -325,7 +359,7 @@ class UserProfileDetailView(APIView):
 
     def put(self, request, username, *args, **kwargs):
         try:
-            user_profile = UserProfile.objects.get(username=username)
+            user_profile = get_profile(username)
             serializer = UserProfileSerializer(
                 user_profile, data=request.data, partial=True
             )
@@ -340,8 +374,7 @@ class UserProfileDetailView(APIView):
 
     def delete(self, request, username, *args, **kwargs):
         try:
-            user_profile = UserProfile.objects.get(username=username)
-            user_profile.delete()
+            get_profile(username).delete()
             return Response(status=status.HTTP_204_NO_CONTENT)
         except UserProfile.DoesNotExist:
             return Response(
@@ -360,8 +393,7 @@ class OrderCreateView(generics.CreateAPIView):
         username = self.request.data.get("username")
 
         try:
-            user_profile = UserProfile.objects.get(username=username)
-            serializer.save(client=user_profile.username)
+            create_order(serializer, username)
         except UserProfile.DoesNotExist:
             raise serializers.ValidationError(
                 {"error": "User with the provided username does not exist."}
@@ -378,43 +410,12 @@ class OrderCreateView(generics.CreateAPIView):
 
 
 class OrderConfirmView(APIView):
+    # Where confirmation and status messages go; views_v2 texts clients instead
+    notifications = OutboxEmailNotifications()
+
     def post(self, request, order_id):
         try:
-            order = Order.objects.get(id=order_id)
-            order.is_confirmed = True
-            order.confirmed_date = timezone.now()
-            order.save()
-
-            # Send email notification to client
-            try:
-                user_profile = UserProfile.objects.get(username=order.client)
-                email_body = f"""
-                <div style='font-family: Arial, sans-serif; line-height:1.6;'>
-                    <h2 style='color: #8B4513;'>Order Confirmation</h2>
-                    <p>Hello {user_profile.firstname} {user_profile.lastname},</p>
-                    <p>We are pleased to inform you that your order has been successfully confirmed by our team.</p>
-                    <div style='background: #f5f5f5; padding: 15px; border-radius: 6px; margin: 20px 0;'>
-                        <p style='margin: 5px 0;'><strong>Order ID:</strong> {order.order_id}</p>
-                        <p style='margin: 5px 0;'><strong>Client Name:</strong> {user_profile.firstname} {user_profile.lastname}</p>
-                        <p style='margin: 5px 0;'><strong>Status:</strong> Confirmed</p>
-                        <p style='margin: 5px 0;'><strong>Event Type:</strong> {order.event_type or 'N/A'}</p>
-                    </div>
-                    <p>Our skilled tailors have begun working on your custom garment. We will keep you informed at every stage of the production process. You can also log in to your dashboard at any time to track the progress of your order.</p>
-                    <p>We appreciate your trust in our craftsmanship and look forward to delivering a garment that exceeds your expectations.</p>
-                    <p style='margin-top: 30px;'>Thank you for your patronage.</p>
-                    <p>Warm regards,<br/>The JFK Tailoring Team</p>
-                </div>
-                """
-                NotificationService.send_email_notification(
-                    to_email=user_profile.email,
-                    subject=f"Order Confirmed - {order.order_id}",
-                    message=email_body,
-                )
-            except UserProfile.DoesNotExist:
-                print(f"User profile not found for client: {order.client}")
-            except Exception as e:
-                print(f"Error sending confirmation email: {e}")
-
+            confirm_order(order_id, self.notifications)
             return Response(
                 {"message": "Order confirmed successfully."}, status=status.HTTP_200_OK
             )
@@ -427,27 +428,12 @@ class OrderConfirmView(APIView):
 class OrderUpdateView(APIView):
     def put(self, request, order_id):
         try:
-            order = Order.objects.get(id=order_id)
-            if order.is_confirmed:
-                return Response(
-                    {"error": "Cannot modify a confirmed order."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            # Update order fields based on request data
-            order.measurements = request.data.get("measurements", order.measurements)
-            order.expected_date = request.data.get("expected_date", order.expected_date)
-            order.event_type = request.data.get("event_type", order.event_type)
-            order.material = request.data.get("material", order.material)
-            order.comments = request.data.get("comments", order.comments)
-            order.preferred_Color = request.data.get(
-                "preferred_Color", order.preferred_Color
-            )
-            order.save()
-
+            update_order(order_id, request.data)
             return Response(
                 {"message": "Order updated successfully."}, status=status.HTTP_200_OK
             )
+        except OrderLocked as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Order.DoesNotExist:
             return Response(
                 {"error": "Order not found."}, status=status.HTTP_404_NOT_FOUND
@@ -455,132 +441,18 @@ class OrderUpdateView(APIView):
 
 
 class OrderUpdateStatusView(APIView):
+    notifications = OutboxEmailNotifications()
+
     def put(self, request, order_id):
         try:
-            order = Order.objects.get(id=order_id)
-            if not order.is_confirmed:
-                return Response(
-                    {"error": "Cannot modify order unless it is confirmed."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            new_status = request.data.get("status", order.status)
-            order.status = new_status
-
-            # Set completed_date when status changes to Completed
-            if new_status == "Completed" and not order.completed_date:
-                order.completed_date = timezone.now()
-
-            order.save()
-
-            # Send email notification based on status
-            try:
-                user_profile = UserProfile.objects.get(username=order.client)
-
-                email_templates = {
-                    "in_progress": {
-                        "subject": f"🚀 Production Update - Order {order.order_id} In Progress",
-                        "title": "Your Order Is Now In Production",
-                        "intro": "Great news! Your custom garment has entered the production phase.",
-                        "body": "Our expert tailors are currently working on your order. This stage involves careful cutting, stitching, and assembly of your garment according to your specifications and measurements. We take pride in our attention to detail and craftsmanship.",
-                        "action": "You can monitor the progress of your order by logging into your dashboard at any time. We will notify you when your order moves to the next stage.",
-                    },
-                    "fitting": {
-                        "subject": f"👔 Ready for Fitting - Order {order.order_id}",
-                        "title": "Your Garment Is Ready for Fitting",
-                        "intro": "Excellent news! Your custom garment has been completed and is ready for a fitting session.",
-                        "body": "We invite you to visit our office at your earliest convenience for a fitting appointment. During this session, we will ensure the garment fits perfectly and make any necessary adjustments to guarantee your complete satisfaction.",
-                        "action": "Please contact us to schedule a convenient time for your fitting. Our team is available to accommodate your schedule. Remember, minor adjustments are part of our commitment to delivering the perfect fit.",
-                    },
-                    "Completed": {
-                        "subject": f"✅ Order Complete - {order.order_id} Ready for Collection",
-                        "title": "Your Order Is Complete!",
-                        "intro": "Congratulations! Your custom garment is now complete and ready for collection.",
-                        "body": "We are delighted to inform you that your order has been finished to our highest standards. All adjustments have been completed, and your garment is perfectly tailored to your measurements and preferences.",
-                        "action": "You may collect your order at our office during business hours. Please bring your order confirmation for a smooth collection process. We look forward to seeing you and hope you enjoy wearing your new garment.",
-                    },
-                }
-
-                if new_status in email_templates:
-                    template = email_templates[new_status]
-                    email_body = f"""
-                    <!DOCTYPE html>
-                    <html>
-                    <head>
-                        <style>
-                            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-                            body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; }}
-                            .email-container {{ max-width: 600px; margin: 0 auto; background: #fff; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 20px rgba(0,0,0,0.1); }}
-                            .email-header {{ background: linear-gradient(135deg, #8B4513 0%, #A0522D 100%); padding: 30px 20px; text-align: center; color: white; }}
-                            .logo {{ font-size: 28px; font-weight: bold; margin-bottom: 10px; }}
-                            .order-details {{ padding: 30px; background: rgba(139, 69, 19, 0.05); border-radius: 8px; margin: 20px 0; }}
-                            .detail-item {{ display: flex; margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid rgba(139, 69, 19, 0.1); }}
-                            .detail-label {{ font-weight: 600; color: #8B4513; min-width: 180px; }}
-                            .detail-value {{ font-weight: 500; color: #222; }}
-                            .content {{ padding: 30px; }}
-                            .footer {{ background: linear-gradient(135deg, #8B4513 0%, #A0522D 100%); padding: 25px; color: white; text-align: center; }}
-                            h2 {{ color: #8B4513; margin-bottom: 15px; }}
-                            p {{ margin: 15px 0; }}
-                        </style>
-                    </head>
-                    <body>
-                        <div class="email-container">
-                            <div class="email-header">
-                                <div class="logo">JFK TAILOR SHOP</div>
-                                <div>Order Status Update</div>
-                            </div>
-                            <div class="content">
-                                <h2>{template['title']}</h2>
-                                <p>Hello {user_profile.firstname} {user_profile.lastname},</p>
-                                <p>{template['intro']}</p>
-                                
-                                <div class="order-details">
-                                    <div class="detail-item">
-                                        <span class="detail-label">Order ID:</span>
-                                        <span class="detail-value">{order.order_id}</span>
-                                    </div>
-                                    <div class="detail-item">
-                                        <span class="detail-label">Client Name:</span>
-                                        <span class="detail-value">{user_profile.firstname} {user_profile.lastname}</span>
-                                    </div>
-                                    <div class="detail-item">
-                                        <span class="detail-label">Current Status:</span>
-                                        <span class="detail-value">{template['title'].replace('Your Order Is Now ', '').replace('Your Garment Is ', '').replace('Your Order Is ', '')}</span>
-                                    </div>
-                                    <div class="detail-item">
-                                        <span class="detail-label">Event Type:</span>
-                                        <span class="detail-value">{order.event_type or 'N/A'}</span>
-                                    </div>
-                                </div>
-                                
-                                <p>{template['body']}</p>
-                                <p><strong>{template['action']}</strong></p>
-                                
-                                <p style="margin-top: 30px; text-align: center; font-size: 16px;">
-                                    Thank you for choosing <strong style="color: #8B4513;">JFK Tailor Shop</strong>!
-                                </p>
-                            </div>
-                            <div class="footer">
-                                <p>JFK Tailor Shop | Where Excellence Meets Elegance</p>
-                                <p>Need help? Contact us at support@jfktailorshop.com</p>
-                                <p style="margin-top: 15px; font-style: italic;">Best regards,<br/>The JFK Tailor Shop Team</p>
-                            </div>
-                        </div>
-                    </body>
-                    </html>
-                    """
-                    NotificationService.send_email_notification(
-                        to_email=user_profile.email,
-                        subject=template["subject"],
-                        message=email_body,
-                    )
-            except UserProfile.DoesNotExist:
-                print(f"User profile not found for client: {order.client}")
-            except Exception as e:
-                print(f"Error sending status update email: {e}")
-
+            update_order_status(
+                order_id, request.data.get("status"), self.notifications
+            )
             return Response(
                 {"message": "Order updated successfully."}, status=status.HTTP_200_OK
             )
+        except OrderLocked as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Order.DoesNotExist:
             return Response(
                 {"error": "Order not found."}, status=status.HTTP_404_NOT_FOUND
@@ -588,22 +460,41 @@ class OrderUpdateStatusView(APIView):
 
 
 class OrderListView(generics.ListAPIView):
-    serializer_class = OrderSerializer
+    serializer_class = OrderListSerializer
     permission_classes = [permissions.AllowAny]
+    pagination_class = OrderCursorPagination
+
+    def get_serializer_class(self):
+        if settings.FAST_READ_SERIALIZERS:
+            return OrderListValuesSerializer
+        return OrderListSerializer
 
     def get_queryset(self):
-        username = self.request.query_params.get("username")
-        try:
-            user = UserProfile.objects.get(username=username)
-            Orderlist = Order.objects.filter(client=username)
-            return Orderlist
-        except User.DoesNotExist:
-            raise serializers.ValidationError(
-                {"error": "User with the provided username does not exist."}
-            )
-        except Exception as e:
-            print(f"Error fetching orders: {e}")
-            return Order.objects.none()
+        username = self.kwargs.get("username") or self.request.query_params.get(
+            "username"
+        )
+        # An unknown or missing username simply yields an empty page; filtering
+        # on None would match the orders that have no client
+        orders = (
+            Order.objects.filter(client__username=username)
+            if username
+            else Order.objects.none()
+        )
+        return self.get_serializer_class().prepare_queryset(orders, self.request)
+
+    def list(self, request, *args, **kwargs):
+        # The newest updated_at plus the row count changes on any edit, insert or delete
+        version = self.get_queryset().aggregate(
+            updated_at=Max("updated_at"), count=Count("id")
+        )
+        build_page = super().list
+        return conditional_payload(
+            request,
+            request.get_full_path(),
+            (version["updated_at"], version["count"]),
+            version["updated_at"],
+            lambda: build_page(request, *args, **kwargs).data,
+        )
 
 
 class OrderDetailsView(generics.GenericAPIView):
@@ -614,9 +505,19 @@ class OrderDetailsView(generics.GenericAPIView):
         order_id = kwargs.get("order_id")
         # order_id = self.request.query_params.get('order_id')
         try:
-            order = Order.objects.get(id=order_id)
-            serializer = OrderSerializer(order)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # The payload shows the client's username, so its version counts too
+            version = Order.objects.values_list("updated_at", "client__updated_at").get(
+                id=order_id
+            )
+            return conditional_payload(
+                request,
+                f"order:{order_id}",
+                version,
+                max(filter(None, version)),
+                lambda: OrderSerializer(
+                    Order.objects.select_related("client").get(id=order_id)
+                ).data,
+            )
         except Order.DoesNotExist:
             return Response(
                 {"error": "Order not found."}, status=status.HTTP_404_NOT_FOUND
@@ -629,17 +530,12 @@ class OrderDeleteView(generics.GenericAPIView):
     def post(self, request, *args, **kwargs):
 
         try:
-            order_id = kwargs.get("order_id")
-            order = Order.objects.get(id=order_id)
-            if order.is_confirmed:
-                return Response(
-                    {"error": "Cannot delete a confirmed order."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            order.delete()
+            delete_order(kwargs.get("order_id"))
             return Response(
                 {"message": "Order deleted successfully."}, status=status.HTTP_200_OK
             )
+        except OrderLocked as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Order.DoesNotExist:
             return Response(
                 {"error": "Order not found."}, status=status.HTTP_404_NOT_FOUND
@@ -656,7 +552,7 @@ class MeasurementCreateView(generics.CreateAPIView):
             username = request.data.get("username")
 
             # Check if user exists
-            user_profile = UserProfile.objects.get(username=username)
+            get_profile(username)
 
             # Check if measurement already exists for this user
             existing_measurement = Measurement.objects.filter(username=username).first()
@@ -746,18 +642,27 @@ class MeasurementDetailView(generics.RetrieveAPIView):
             username = request.query_params.get("username")
             # Get the first measurement (most recent if there are duplicates)
             # Order by id descending to get the latest record
-            measurement = (
-                Measurement.objects.filter(username=username).order_by("-id").first()
+            version = (
+                Measurement.objects.filter(username=username)
+                .order_by("-id")
+                .values_list("id", "updated_at")
+                .first()
             )
 
-            if not measurement:
+            if not version:
                 return Response(
                     {"error": "Measurements not found for this user"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-            serializer = self.get_serializer(measurement)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            pk, updated_at = version
+            return conditional_payload(
+                request,
+                f"measurement:{pk}",
+                updated_at,
+                updated_at,
+                lambda: self.get_serializer(Measurement.objects.get(id=pk)).data,
+            )
         except Exception as e:
             return Response(
                 {"error": str(e)},
@@ -765,15 +670,44 @@ class MeasurementDetailView(generics.RetrieveAPIView):
             )
 
 
+class MeasurementAnalyticsView(APIView):
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        # Distribution and percentile size chart for every measurement field
+        percentiles = request.query_params.get("percentiles")
+        if percentiles is None:
+            percentiles = DEFAULT_PERCENTILES
+        else:
+            try:
+                percentiles = sorted({int(p) for p in percentiles.split(",") if p})
+            except ValueError:
+                percentiles = None
+            if not percentiles or not all(1 <= p <= 99 for p in percentiles):
+                return Response(
+                    {"error": "percentiles must be whole numbers from 1 to 99."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        measurements = Measurement.objects.all()
+        return Response(
+            {
+                "unit": "in",
+                "fields": size_chart(measurements, percentiles),
+            }
+        )
+
+
 class SendEmailView(generics.GenericAPIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = UserProfileSerializer
 
     def post(self, request, *args, **kwargs):
+        if "usernames" in request.data:
+            return self.broadcast(request, request.data["usernames"])
         try:
             username = self.request.data.get("username")
-            user_profile = UserProfile.objects.get(username=username)
-            email = user_profile.email
+            email = get_profile(username).email
             message = request.data.get("message")
             subject = request.data.get("subject")
             email_sent = NotificationService.send_email_notification(
@@ -797,91 +731,105 @@ class SendEmailView(generics.GenericAPIView):
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def broadcast(self, request, usernames):
+        if not isinstance(usernames, list) or not all(
+            isinstance(username, str) for username in usernames
+        ):
+            return Response(
+                {"error": "usernames must be a list of usernames."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        # One query for every address, then batched provider calls
+        emails = UserProfile.objects.filter(username__in=usernames).values_list(
+            "email", flat=True
+        )
+        try:
+            results = NotificationService.send_bulk(
+                emails, request.data.get("subject"), request.data.get("message")
+            )
+        except ImproperlyConfigured as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        if not results:
+            return Response(
+                {"error": "No user with the provided usernames exists."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        failed = [email for email, sent in results.items() if not sent]
+        return Response(
+            {"sent": len(results) - len(failed), "failed": failed},
+            status=(
+                status.HTTP_500_INTERNAL_SERVER_ERROR
+                if len(failed) == len(results)
+                else status.HTTP_200_OK
+            ),
+        )
+
 
 class AdminDashboardView(APIView):
     permission_classes = [permissions.AllowAny]
 
     def get(self, request):
-        total_clients = UserProfile.objects.count()
-        total_orders = Order.objects.count()
-        pending_orders = Order.objects.filter(
-            status="Pending", is_confirmed="True"
-        ).count()
-        in_progress_orders = Order.objects.filter(
-            status="in_progress", is_confirmed="True"
-        ).count()
-        fitting_orders = Order.objects.filter(
-            status="fitting", is_confirmed="True"
-        ).count()
-        completed_orders = Order.objects.filter(
-            status="Completed", is_confirmed="True"
-        ).count()
-        unconfirmed_orders = Order.objects.filter(is_confirmed="False").count()
-        # total_notifications = NotificationLog.objects.count()
-
-        data = {
-            "total_clients": total_clients,
-            "total_orders": total_orders,
-            "pending_orders": pending_orders,
-            "in_progress_orders": in_progress_orders,
-            "fitting_orders": fitting_orders,
-            "completed_orders": completed_orders,
-            "unconfirmed_orders": unconfirmed_orders,
-            # "total_notifications": total_notifications,
-        }
+        # Served from a short-lived snapshot that order and profile writes invalidate
+        data = get_dashboard_counts()
         return Response(data)
 
 
+class AdminMetricsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        # This worker's request metrics, in the Prometheus text format
+        return HttpResponse(
+            request_metrics.render(), content_type="text/plain; version=0.0.4"
+        )
+
+
+# Admin list "type" -> filter applied to the orders table
+ADMIN_ORDER_FILTERS = {
+    "all": Q(),
+    "confirmed": Q(is_confirmed=True),
+    "unconfirmed": Q(is_confirmed=False),
+    "pending": Q(status="Pending", is_confirmed=True),
+    "in_progress": Q(status="in_progress", is_confirmed=True),
+    "fitting": Q(status="fitting", is_confirmed=True),
+    "completed": Q(status="Completed", is_confirmed=True),
+}
+
+
 class AdminOrderListView(generics.ListAPIView):
-    queryset = Order.objects.all()
-    serializer_class = OrderSerializer
+    serializer_class = OrderListSerializer
     permission_classes = [permissions.AllowAny]
+    pagination_class = OrderCursorPagination
 
-    def get(self, request, *args, **kwargs):
+    def get_serializer_class(self):
+        if settings.FAST_READ_SERIALIZERS:
+            return OrderListValuesSerializer
+        return OrderListSerializer
 
-        try:
-            type = request.query_params.get("type")
+    def get_queryset(self):
+        order_filter = ADMIN_ORDER_FILTERS[self.request.query_params.get("type")]
+        return self.get_serializer_class().prepare_queryset(
+            Order.objects.filter(order_filter), self.request
+        )
 
-            if type == "confirmed":
-                orderlist = Order.objects.filter(is_confirmed="True")
-                serializer = OrderSerializer(orderlist, many=True)
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            if type == "unconfirmed":
-                orderlist = Order.objects.filter(is_confirmed="False")
-                serializer = OrderSerializer(orderlist, many=True)
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            if type == "pending":
-                orderlist = Order.objects.filter(status="Pending", is_confirmed="True")
-                serializer = OrderSerializer(orderlist, many=True)
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            if type == "in_progress":
-                orderlist = Order.objects.filter(
-                    status="in_progress", is_confirmed="True"
-                )
-                serializer = OrderSerializer(orderlist, many=True)
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            if type == "fitting":
-                orderlist = Order.objects.filter(status="fitting", is_confirmed="True")
-                serializer = OrderSerializer(orderlist, many=True)
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            if type == "completed":
-                orderlist = Order.objects.filter(
-                    status="Completed", is_confirmed="True"
-                )
-                serializer = OrderSerializer(orderlist, many=True)
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            if type == "all":
-                orderlist = Order.objects.all()
-                serializer = OrderSerializer(orderlist, many=True)
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            else:
-                return Response(
-                    {"error": "Type not found."}, status=status.HTTP_404_NOT_FOUND
-                )
-        except Exception as e:
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("type") not in ADMIN_ORDER_FILTERS:
             return Response(
-                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {"error": "Type not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        if "export" in request.query_params:
+            order_type = request.query_params["type"]
+            return export_response(
+                request,
+                Order.objects.filter(ADMIN_ORDER_FILTERS[order_type]).order_by(
+                    "-order_date", "-id"
+                ),
+                OrderListValuesSerializer,
+                f"orders-{order_type}",
             )
+        return super().list(request, *args, **kwargs)
 
 
 class AdminOrderUpdateView(generics.UpdateAPIView):
@@ -916,7 +864,7 @@ class AdminCreateOrderView(generics.CreateAPIView):
             "client_id"
         )  # Expect client ID in request body
         try:
-            client = UserProfile.objects.get(username=client_id)
+            client = get_profile(client_id)
         except UserProfile.DoesNotExist:
             return Response(
                 {"error": "Client does not exist"}, status=status.HTTP_404_NOT_FOUND